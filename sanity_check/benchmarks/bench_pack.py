@@ -0,0 +1,251 @@
+"""Benchmark of all checks on a synthetic pack.
+
+Usage:
+    python benchmarks/bench_pack.py [--entities N] [--recipes N] [--languages N]
+        [--keys N] [--sounds N] [--textures N] [--bom N] [--repeat N]
+        [--save results.json] [--baseline results.json]
+
+The pack is generated once in a temporary directory. Every repeat runs the
+checks one by one on a fresh copy of it, with fixes enabled, and the fastest
+time of each check is reported with its throughput. `--save` stores the
+results, and `--baseline` compares them with results stored earlier (for
+example from another commit) and exits with 1 if a check became slower than
+`--threshold` allows.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+pkg_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if pkg_dir not in sys.path:
+    sys.path.insert(0, pkg_dir)
+
+import config
+import data
+import diagnostics
+import documents
+import identifiers
+import references
+import pack_index
+import sanity_check
+import scheduler
+
+BOM = b"\xef\xbb\xbf"
+
+
+def write(path, text, bom=False):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        if bom:
+            f.write(BOM)
+        f.write(text.encode("utf8"))
+
+
+def generate_pack(root, entities, recipes, languages, keys, sounds, textures, bom):
+    """Generate BP and RP folders under `root`. About one in ten entities,
+    recipes, translations and sounds has an issue the checks report."""
+    bp = os.path.join(root, "BP")
+    rp = os.path.join(root, "RP")
+    written = 0
+    for i in range(entities):
+        properties = {}
+        for p in range(20):
+            # Integers where floats are expected are fixed by the check
+            value = p if (i + p) % 10 == 0 else p + 0.5
+            properties[f"test:float_{p}"] = {
+                "type": "float",
+                "range": [0.0, value + 10],
+                "default": value,
+            }
+        entity = {
+            "format_version": "1.20.0",
+            "minecraft:entity": {
+                "description": {
+                    "identifier": f"test:entity_{i}",
+                    "properties": properties,
+                },
+                "component_groups": {
+                    f"test:group_{g}": {"minecraft:variant": {"value": g}}
+                    for g in range(50)
+                },
+                "components": {"minecraft:health": {"value": 20, "max": 20}},
+                "events": {
+                    f"test:event_{g}": {"add": {"component_groups": [f"test:group_{g}"]}}
+                    for g in range(50)
+                },
+            },
+        }
+        path = os.path.join(bp, "entities", f"entity_{i}.json")
+        write(path, json.dumps(entity, indent=2), bom=written < bom)
+        written += 1
+    for i in range(recipes):
+        recipe_type = ["minecraft:recipe_shaped", "minecraft:recipe_shapeless"][i % 2]
+        # Every tenth recipe reuses the identifier of the one before it
+        identifier = f"test:recipe_{i - 1 if i % 10 == 9 else i}"
+        recipe = {
+            "format_version": "1.20.0",
+            recipe_type: {
+                "description": {"identifier": identifier},
+                "tags": ["crafting_table"],
+                "result": {"item": "minecraft:stick", "count": 4},
+            },
+        }
+        path = os.path.join(bp, "recipes", f"recipe_{i}.json")
+        write(path, json.dumps(recipe, indent=2), bom=written < bom)
+        written += 1
+    # Misspelled folders and files for the misspelling checks
+    for name in ["entites", "recipies", "item", "texture"]:
+        os.makedirs(os.path.join(bp, name), exist_ok=True)
+    write(os.path.join(bp, "manifest.jsn"), "{}")
+    write(os.path.join(rp, "texts", "english.lang"), "")
+    # The texture atlases are misspelled next to many textures, so finding the
+    # closest name has to go through all of them
+    for i in range(textures):
+        write(os.path.join(rp, "textures", f"texture_{i}.png"), "")
+    write(os.path.join(rp, "textures", "item_textures.json"), "{}")
+    write(os.path.join(rp, "textures", "terain_texture.json"), "{}")
+    codes = [f"{language}_{country}" for language, country in zip(data.languages, data.countries)]
+    for pack in (bp, rp):
+        for l in range(languages):
+            lines = ["## Generated translations"]
+            for k in range(keys):
+                # Every language misses a different tenth of the keys
+                if (k + l) % 10 != 0:
+                    lines.append(f"item.test:item_{k}.name=Item {k} in {codes[l]}")
+            path = os.path.join(pack, "texts", f"{codes[l]}.lang")
+            write(path, "\n".join(lines) + "\n", bom=pack == bp and written < bom)
+            written += 1
+    definitions = {}
+    for i in range(sounds):
+        name = f"sounds/test/group_{i % 100}/sound_{i}"
+        definitions[f"test.sound_{i}"] = {"sounds": [name, {"name": name, "volume": 0.5}]}
+        if i % 10 != 0:
+            write(os.path.join(rp, name + ".ogg"), "")
+    write(
+        os.path.join(rp, "sounds", "sound_definitions.json"),
+        json.dumps({"format_version": "1.14.0", "sound_definitions": definitions}, indent=2),
+    )
+    write(os.path.join(rp, "sounds", "unsupported.mp3"), "")
+
+
+def tree_size(root):
+    files = 0
+    size = 0
+    for directory, dirs, names in os.walk(root):
+        for name in names:
+            files += 1
+            size += os.path.getsize(os.path.join(directory, name))
+    return files, size
+
+
+def run(pack, repeat):
+    """Return {check name: (best wall time, files read, bytes read)}."""
+    config.config = config.Config(translation_report="summary", lang_workers=1)
+    best = {}
+    work_root = tempfile.mkdtemp(prefix="sanity_check_bench_")
+    old_cwd = os.getcwd()
+    try:
+        for i in range(repeat):
+            work = os.path.join(work_root, str(i))
+            shutil.copytree(pack, work)
+            os.chdir(work)
+            pack_index.clear()
+            documents.cache.clear()
+            identifiers.clear()
+            references.clear()
+            # Diagnostics are collected, but not printed
+            diagnostics.collector = diagnostics.Collector(buffered=True)
+            results = scheduler.run_checks(sanity_check.build_checks(), workers=1)
+            for result in results:
+                stats = result.stats
+                previous = best.get(result.name)
+                if previous is None or stats.wall_time < previous[0]:
+                    best[result.name] = (stats.wall_time, stats.files_read, stats.bytes_read)
+            os.chdir(old_cwd)
+            shutil.rmtree(work)
+    finally:
+        os.chdir(old_cwd)
+        diagnostics.collector = None
+        shutil.rmtree(work_root, ignore_errors=True)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=200)
+    parser.add_argument("--recipes", type=int, default=1000)
+    parser.add_argument("--languages", type=int, default=10)
+    parser.add_argument("--keys", type=int, default=5000, help="translation keys per language")
+    parser.add_argument("--sounds", type=int, default=5000)
+    parser.add_argument("--textures", type=int, default=5000)
+    parser.add_argument("--bom", type=int, default=100, help="number of files with a BOM")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with results saved with --save")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="allowed slowdown against the baseline"
+    )
+    args = parser.parse_args()
+
+    pack = tempfile.mkdtemp(prefix="sanity_check_pack_")
+    try:
+        generate_pack(
+            pack,
+            args.entities,
+            args.recipes,
+            args.languages,
+            args.keys,
+            args.sounds,
+            args.textures,
+            args.bom,
+        )
+        files, size = tree_size(pack)
+        print(f"Pack: {files} files, {size / 1024 / 1024:.2f} MB")
+        results = run(pack, args.repeat)
+    finally:
+        shutil.rmtree(pack, ignore_errors=True)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf8") as f:
+            baseline = json.load(f)["checks"]
+    print(f"{'check':<30} {'time':>9} {'files/s':>10} {'MB/s':>8} {'baseline':>9}")
+    regressions = []
+    for name, (elapsed, files_read, bytes_read) in results.items():
+        files_per_second = files_read / elapsed if elapsed > 0 else 0
+        mb_per_second = bytes_read / 1024 / 1024 / elapsed if elapsed > 0 else 0
+        compared = ""
+        if name in baseline:
+            ratio = elapsed / max(baseline[name]["seconds"], 1e-6)
+            compared = f"{ratio:8.2f}x"
+            # Very short checks are too noisy to compare
+            if ratio > args.threshold and elapsed > 0.01:
+                regressions.append(name)
+        print(
+            f"{name:<30} {elapsed:7.3f} s {files_per_second:10.0f} {mb_per_second:8.2f} {compared:>9}"
+        )
+    print(f"{'total':<30} {sum(r[0] for r in results.values()):7.3f} s")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf8") as f:
+            json.dump(
+                {
+                    "settings": vars(args),
+                    "checks": {
+                        name: {"seconds": r[0], "files_read": r[1], "bytes_read": r[2]}
+                        for name, r in results.items()
+                    },
+                },
+                f,
+                indent=2,
+            )
+    if regressions:
+        print(f"Slower than the baseline: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
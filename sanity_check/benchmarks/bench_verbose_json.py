@@ -0,0 +1,128 @@
+"""Benchmark of verbose_json.parseJson on a multi-megabyte entity file.
+
+Usage:
+    python benchmarks/bench_verbose_json.py [--size MB] [--compare path/to/verbose_json.py]
+
+`--compare` loads another version of verbose_json.py (for example one
+exported with `git show <rev>:sanity_check/verbose_json.py`) and runs the
+same benchmark with it.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+
+pkg_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if pkg_dir not in sys.path:
+    sys.path.insert(0, pkg_dir)
+
+import verbose_json
+
+
+def generate_entity(size_mb, property_count=50):
+    """Return the text of an entity file of roughly `size_mb` megabytes."""
+    properties = {}
+    for i in range(property_count):
+        properties[f"test:float_{i}"] = {
+            "type": "float",
+            "range": [0, 10],
+            "default": 0,
+            "client_sync": True,
+        }
+    entity = {
+        "format_version": "1.20.0",
+        "minecraft:entity": {
+            "description": {
+                "identifier": "test:entity",
+                "is_spawnable": True,
+            },
+            "component_groups": {},
+            "components": {},
+            "events": {},
+        },
+    }
+    body = entity["minecraft:entity"]
+    if property_count > 0:
+        body["description"]["properties"] = properties
+    i = 0
+    while len(json.dumps(entity, indent=2)) < size_mb * 1024 * 1024:
+        for _ in range(100):
+            body["component_groups"][f"test:group_{i}"] = {
+                "minecraft:variant": {"value": i},
+                "minecraft:movement": {"value": 0.25, "max": 1.5},
+                "minecraft:type_family": {"family": ["mob", "test", "ü\"quoted\""]},
+                "minecraft:timer": {
+                    "looping": False,
+                    "time": [1.0, 2.5],
+                    "time_down_event": {"event": f"test:event_{i}", "target": "self"},
+                },
+            }
+            body["events"][f"test:event_{i}"] = {
+                "add": {"component_groups": [f"test:group_{i}"]},
+                "remove": {},
+                "set_property": {f"test:float_{i % 50}": i * 0.5},
+            }
+            i += 1
+    return json.dumps(entity, indent=2)
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location("verbose_json_compare", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bench(module, make_listener, text, repeat):
+    best = None
+    for _ in range(repeat):
+        listener = make_listener(module, text)
+        start = time.perf_counter()
+        module.parseJson(text, listener)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=float, default=4, help="size of the entity in MB")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--compare", help="another verbose_json.py to benchmark")
+    args = parser.parse_args()
+
+    text = generate_entity(args.size)
+    # Entities without properties are parsed to the end by PropertyListener
+    text_without_properties = generate_entity(args.size, property_count=0)
+    mb = len(text.encode("utf8")) / 1024 / 1024
+    print(f"Entity file: {mb:.2f} MB")
+
+    start = time.perf_counter()
+    json.loads(text)
+    print(f"{'json.loads (reference)':<56} {time.perf_counter() - start:8.3f} s")
+
+    results = [("verbose_json", verbose_json)]
+    if args.compare:
+        results.append((os.path.basename(args.compare), load_module(args.compare)))
+    cases = [
+        ("full parse", lambda module, text: module.JsonListener(), text),
+        # Stops after minecraft:entity/description/properties
+        ("PropertyListener", lambda module, text: module.PropertyListener(text), text),
+        (
+            "PropertyListener, no properties",
+            lambda module, text: module.PropertyListener(text),
+            text_without_properties,
+        ),
+    ]
+    for listener_name, make_listener, case_text in cases:
+        for name, module in results:
+            elapsed = bench(module, make_listener, case_text, args.repeat)
+            label = f"{name} ({listener_name})"
+            print(f"{label:<56} {elapsed:8.3f} s {mb / elapsed:8.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
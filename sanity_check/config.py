@@ -1,4 +1,5 @@
 import json
+import os
 import sys
 
 
@@ -39,8 +40,11 @@ class Checks(object):
         missing_translations_rp=True,
         incorrect_property_types=True,
         duplicated_recipe_ids=True,
+        duplicated_identifiers=True,
         unsupported_sound_files=True,
         missing_sounds=True,
+        dangling_references=False,
+        unreachable_assets=False,
         **kwargs
     ):
         # start with defaults
@@ -57,8 +61,11 @@ class Checks(object):
             "missing_translations_rp": missing_translations_rp,
             "incorrect_property_types": incorrect_property_types,
             "duplicated_recipe_ids": duplicated_recipe_ids,
+            "duplicated_identifiers": duplicated_identifiers,
             "unsupported_sound_files": unsupported_sound_files,
             "missing_sounds": missing_sounds,
+            "dangling_references": dangling_references,
+            "unreachable_assets": unreachable_assets,
         }
 
         # apply global override if provided
@@ -85,10 +92,58 @@ class Checks(object):
 
 
 class Config(object):
-    def __init__(self, fail_on_warnings=False, fail_on_errors=True, log_fixes=True, fixes={}, checks={}):
+    def __init__(
+        self,
+        fail_on_warnings=False,
+        fail_on_errors=True,
+        log_fixes=True,
+        fixes={},
+        checks={},
+        workers=None,
+        incremental=False,
+        cache_path=os.path.join("data", "sanity_check", "cache.json"),
+        translation_report="full",
+        translation_report_limit=10,
+        lang_workers=None,
+        definition_workers=None,
+        max_diagnostics_per_rule=None,
+        report=None,
+        report_format="json",
+        timings=False,
+        profile=False,
+        profile_path=os.path.join("data", "sanity_check", "profile"),
+        document_cache_size=64,
+    ):
         self.fail_on_warnings = fail_on_warnings
         self.fail_on_errors = fail_on_errors
         self.log_fixes = log_fixes
+        # Number of checks to run concurrently, None means one per CPU
+        self.workers = workers
+        # Whether to reuse per-file results of the previous run for unchanged files
+        self.incremental = incremental
+        self.cache_path = cache_path
+        # "full" warns about every missing translation, "summary" once per file
+        self.translation_report = translation_report
+        # Number of missing keys listed per file in the summary
+        self.translation_report_limit = translation_report_limit
+        # Number of processes parsing large .lang files, None means one per CPU
+        self.lang_workers = lang_workers
+        # Number of processes reading identifiers of BP definitions, None means
+        # one per CPU
+        self.definition_workers = definition_workers
+        # Diagnostics shown per rule, None means all of them
+        self.max_diagnostics_per_rule = max_diagnostics_per_rule
+        # Path of a report with all findings and check timings, None for no report
+        self.report = report
+        # "json" or "sarif"
+        self.report_format = report_format
+        # Whether to print how long each check took and how much it read
+        self.timings = timings
+        # Whether to run the checks one by one under cProfile, tracing memory
+        self.profile = profile
+        self.profile_path = profile_path
+        # Megabytes of parsed files kept in memory for the checks to share
+        self.document_cache_size = document_cache_size
         self.fixes = Fixes(**fixes)
         self.checks = Checks(**checks)
 
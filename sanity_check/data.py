@@ -1,4 +1,5 @@
 # coding=utf-8
+import functools
 import os
 
 
@@ -535,6 +536,62 @@ RP_FILES = normalize_data(
     ]
 )
 
+# Sets for membership tests. The lists above keep their order for suggestions.
+languages_set = frozenset(languages)
+countries_set = frozenset(countries)
+BP_FILES_SET = frozenset(BP_FILES)
+RP_FILES_SET = frozenset(RP_FILES)
+
+# Folders of BP definitions with a `description.identifier`, and the start of
+# the name of their root field
+BP_DEFINITIONS = {
+    "entities": "minecraft:entity",
+    "items": "minecraft:item",
+    "blocks": "minecraft:block",
+    "recipes": "minecraft:recipe_",
+    "biomes": "minecraft:biome",
+    "feature_rules": "minecraft:feature_rules",
+}
+
+BOM = b"\xef\xbb\xbf"
+
 BOM_EXTENSIONS = [".mcfunction", ".json", ".lang"]
 
 MISSPELLING_THRESHOLD = 3
+
+# Sound file formats accepted by the game, in the order they are reported
+SOUND_EXTENSIONS = [".ogg", ".wav", ".fsb"]
+
+VANILLA_SOUNDS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "vanilla_sounds.txt"
+)
+VANILLA_REFERENCES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "vanilla_references.txt"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def vanilla_sounds():
+    """Return the sound paths of the vanilla resource pack, generated by
+    prepare_data.py. Read on first use, so runs without missing_sounds don't
+    pay for it."""
+    with open(VANILLA_SOUNDS_PATH, "r", encoding="utf8") as f:
+        return frozenset(line for line in f.read().splitlines() if line)
+
+
+@functools.lru_cache(maxsize=None)
+def vanilla_references():
+    """Return {kind: set of identifiers} of the definitions and asset paths of
+    the vanilla packs, generated by prepare_data.py, or an empty dict if it
+    wasn't generated. Read on first use, like `vanilla_sounds`."""
+    references = {}
+    try:
+        with open(VANILLA_REFERENCES_PATH, "r", encoding="utf8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return references
+    for line in lines:
+        kind, separator, identifier = line.partition("\t")
+        if separator:
+            references.setdefault(kind, set()).add(identifier)
+    return {kind: frozenset(identifiers) for kind, identifiers in references.items()}
@@ -0,0 +1,134 @@
+import sys
+import threading
+
+import scheduler
+
+ERROR = "error"
+WARNING = "warning"
+FIX = "fix"
+# Plain messages, like files that failed to parse
+INFO = "info"
+
+PREFIXES = {ERROR: "[ERROR] ", WARNING: "[WARNING] ", FIX: "[FIX] ", INFO: ""}
+
+
+class Diagnostic(object):
+    """A single finding of a check.
+
+    `rule` identifies the kind of finding, `file` and `pointer` (a JSON
+    pointer into the file) where it is, when known.
+    """
+
+    def __init__(self, rule, severity, message, file=None, pointer=None, fixed=False):
+        self.rule = rule
+        self.severity = severity
+        self.message = message
+        self.file = file
+        self.pointer = pointer
+        self.fixed = fixed
+
+    def key(self):
+        return (self.rule, self.severity, self.file, self.pointer, self.message)
+
+    def format(self):
+        return PREFIXES[self.severity] + self.message
+
+    def stream(self):
+        if self.severity in (ERROR, WARNING):
+            return sys.stderr
+        return sys.stdout
+
+
+class Collector(object):
+    """Collects the diagnostics of a run.
+
+    Repeated diagnostics are dropped. At most `max_per_rule` diagnostics of
+    each rule and severity are printed (None means no limit), but all of them
+    are kept in `diagnostics`. When `buffered`, nothing is printed until
+    `flush`.
+    """
+
+    def __init__(self, max_per_rule=None, show_fixes=True, buffered=False):
+        self.max_per_rule = max_per_rule
+        self.show_fixes = show_fixes
+        self.buffered = buffered
+        self.diagnostics = []
+        self.seen = set()
+        # (rule, severity) -> number of printed diagnostics
+        self.counts = {}
+        # (rule, severity) -> number of diagnostics over max_per_rule
+        self.suppressed = {}
+        # severity -> number of distinct diagnostics
+        self.totals = {}
+        self.pending = []
+        self.lock = threading.Lock()
+
+    def add(self, diagnostic):
+        """Record a diagnostic. Returns whether it was printed (or buffered
+        for printing)."""
+        with self.lock:
+            key = diagnostic.key()
+            if key in self.seen:
+                return False
+            self.seen.add(key)
+            self.diagnostics.append(diagnostic)
+            severity = diagnostic.severity
+            self.totals[severity] = self.totals.get(severity, 0) + 1
+            if severity == FIX and not self.show_fixes:
+                return False
+            rule = (diagnostic.rule, severity)
+            count = self.counts.get(rule, 0)
+            if self.max_per_rule is not None and count >= self.max_per_rule:
+                self.suppressed[rule] = self.suppressed.get(rule, 0) + 1
+                return False
+            self.counts[rule] = count + 1
+            if self.buffered:
+                self.pending.append(diagnostic)
+            else:
+                print(diagnostic.format(), file=diagnostic.stream())
+            return True
+
+    def flush(self):
+        """Print the buffered diagnostics, a single write per stream, and how
+        many diagnostics were left out per rule."""
+        with self.lock:
+            pending = self.pending
+            self.pending = []
+            suppressed = sorted(self.suppressed.items(), key=str)
+        lines = {}
+        for diagnostic in pending:
+            lines.setdefault(diagnostic.stream(), []).append(diagnostic.format())
+        for (rule, severity), count in suppressed:
+            lines.setdefault(sys.stdout, []).append(
+                f"{count} more {rule} diagnostics ({severity}) were not shown."
+            )
+        for stream, stream_lines in lines.items():
+            stream.write("\n".join(stream_lines) + "\n")
+            stream.flush()
+
+    def count(self, severity):
+        return self.totals.get(severity, 0)
+
+    def failed(self, fail_on_warnings, fail_on_errors):
+        """Return whether the run should fail, once all checks finished."""
+        if fail_on_errors and self.count(ERROR) > 0:
+            return True
+        return fail_on_warnings and self.count(WARNING) > 0
+
+
+# Collector of the current run. Without one, diagnostics are just printed.
+collector = None
+
+
+def report(diagnostic):
+    """Record a diagnostic. From a scheduled check, it is recorded when the
+    check's output is replayed, so deduplication and limits don't depend on
+    the order checks finish in."""
+    scheduler.defer(lambda: _add(diagnostic))
+
+
+def _add(diagnostic):
+    if collector is None:
+        print(diagnostic.format(), file=diagnostic.stream())
+    else:
+        collector.add(diagnostic)
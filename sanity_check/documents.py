@@ -0,0 +1,137 @@
+import collections
+import json
+import os
+import threading
+
+import instrumentation
+import verbose_json
+
+# Rough memory use of each representation, relative to the size of the text
+TEXT_COST = 1
+JSON_COST = 4
+VERBOSE_COST = 10
+
+
+class Document(object):
+    __slots__ = ("size", "mtime_ns", "text", "json", "verbose", "cost")
+
+    def __init__(self, stat, text):
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self.text = text
+        self.json = None
+        self.verbose = None
+        self.cost = len(text) * TEXT_COST
+
+
+class DocumentCache(object):
+    """Text and decoded trees of files, shared by all checks of a run.
+
+    A file is read and decoded at most once, as long as its size and
+    modification time don't change and it isn't evicted. The least recently
+    used documents are dropped once they take more than `max_bytes` (an
+    estimate). The trees are shared, so callers must not modify them.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        # (working directory, path) -> Document, least recently used first
+        self.documents = collections.OrderedDict()
+        self.total_cost = 0
+        self.lock = threading.Lock()
+
+    def _get(self, key, path, stat):
+        """Return the up to date Document of a file, reading it if needed."""
+        if stat is None:
+            stat = os.stat(path)
+        with self.lock:
+            document = self.documents.get(key)
+            if document is not None:
+                if document.size == stat.st_size and document.mtime_ns == stat.st_mtime_ns:
+                    self.documents.move_to_end(key)
+                    return document
+                self._remove(key)
+        with open(path, "r", encoding="utf8") as f:
+            text = f.read()
+        instrumentation.record_read(stat.st_size)
+        document = Document(stat, text)
+        with self.lock:
+            self._store(key, document)
+        return document
+
+    def _store(self, key, document):
+        if key in self.documents:
+            self._remove(key)
+        if document.cost > self.max_bytes:
+            return
+        self.documents[key] = document
+        self.total_cost += document.cost
+        self._evict()
+
+    def _grow(self, key, document, cost):
+        with self.lock:
+            if self.documents.get(key) is not document:
+                return
+            document.cost += cost
+            self.total_cost += cost
+            if document.cost > self.max_bytes:
+                self._remove(key)
+            self._evict()
+
+    def _evict(self):
+        while self.total_cost > self.max_bytes and len(self.documents) > 0:
+            key, document = self.documents.popitem(last=False)
+            self.total_cost -= document.cost
+
+    def _remove(self, key):
+        document = self.documents.pop(key)
+        self.total_cost -= document.cost
+
+    def get_text(self, path, stat=None):
+        """Return the text of a file. `stat` can be passed to avoid a syscall
+        when it is already known, for example from the pack index."""
+        return self._get(_key(path), path, stat).text
+
+    def get_json(self, path, stat=None):
+        """Return the file decoded with `json.loads`."""
+        key = _key(path)
+        document = self._get(key, path, stat)
+        tree = document.json
+        if tree is None:
+            tree = json.loads(document.text)
+            document.json = tree
+            self._grow(key, document, len(document.text) * JSON_COST)
+        return tree
+
+    def get_verbose(self, path, stat=None):
+        """Return the root `verbose_json.JsonContext` of the file, with the
+        offsets of all values."""
+        key = _key(path)
+        document = self._get(key, path, stat)
+        root = document.verbose
+        if root is None:
+            listener = verbose_json.JsonListener()
+            root = verbose_json.parseJson(document.text, listener)
+            document.verbose = root
+            self._grow(key, document, len(document.text) * VERBOSE_COST)
+        return root
+
+    def invalidate(self, path):
+        """Forget a file, after it was written."""
+        with self.lock:
+            key = _key(path)
+            if key in self.documents:
+                self._remove(key)
+
+    def clear(self):
+        with self.lock:
+            self.documents.clear()
+            self.total_cost = 0
+
+
+def _key(path):
+    # Keyed like pack indexes, which is cheaper than os.path.abspath
+    return (os.getcwd(), os.path.normpath(path))
+
+
+cache = DocumentCache()
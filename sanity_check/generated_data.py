@@ -1,4097 +0,0 @@
-vanilla_sounds = [
-"music/game/bromeliad",
-"music/game/hal1",
-"music/game/hal2",
-"music/game/hal3",
-"music/game/hal4",
-"music/game/left_to_bloom",
-"music/game/nuance1",
-"music/game/nuance2",
-"music/game/piano1",
-"music/game/piano2",
-"music/game/piano3",
-"sounds/ambient/nether/basalt_deltas/ambience",
-"sounds/ambient/nether/basalt_deltas/basaltground1",
-"sounds/ambient/nether/basalt_deltas/basaltground2",
-"sounds/ambient/nether/basalt_deltas/basaltground3",
-"sounds/ambient/nether/basalt_deltas/click1",
-"sounds/ambient/nether/basalt_deltas/click2",
-"sounds/ambient/nether/basalt_deltas/click3",
-"sounds/ambient/nether/basalt_deltas/click4",
-"sounds/ambient/nether/basalt_deltas/click5",
-"sounds/ambient/nether/basalt_deltas/click6",
-"sounds/ambient/nether/basalt_deltas/click7",
-"sounds/ambient/nether/basalt_deltas/click8",
-"sounds/ambient/nether/basalt_deltas/debris1",
-"sounds/ambient/nether/basalt_deltas/debris2",
-"sounds/ambient/nether/basalt_deltas/debris3",
-"sounds/ambient/nether/basalt_deltas/heavy_click1",
-"sounds/ambient/nether/basalt_deltas/heavy_click2",
-"sounds/ambient/nether/basalt_deltas/long_debris1",
-"sounds/ambient/nether/basalt_deltas/long_debris2",
-"sounds/ambient/nether/basalt_deltas/plode1",
-"sounds/ambient/nether/basalt_deltas/plode2",
-"sounds/ambient/nether/basalt_deltas/plode3",
-"sounds/ambient/nether/basalt_deltas/twist1",
-"sounds/ambient/nether/basalt_deltas/twist2",
-"sounds/ambient/nether/basalt_deltas/twist3",
-"sounds/ambient/nether/basalt_deltas/twist4",
-"sounds/ambient/nether/crimson_forest/addition1",
-"sounds/ambient/nether/crimson_forest/addition2",
-"sounds/ambient/nether/crimson_forest/addition3",
-"sounds/ambient/nether/crimson_forest/ambience",
-"sounds/ambient/nether/crimson_forest/mood1",
-"sounds/ambient/nether/crimson_forest/mood2",
-"sounds/ambient/nether/crimson_forest/mood3",
-"sounds/ambient/nether/crimson_forest/mood4",
-"sounds/ambient/nether/crimson_forest/particles1",
-"sounds/ambient/nether/crimson_forest/particles2",
-"sounds/ambient/nether/crimson_forest/particles3",
-"sounds/ambient/nether/crimson_forest/shine1",
-"sounds/ambient/nether/crimson_forest/shine2",
-"sounds/ambient/nether/crimson_forest/shine3",
-"sounds/ambient/nether/crimson_forest/shroom1",
-"sounds/ambient/nether/crimson_forest/shroom2",
-"sounds/ambient/nether/crimson_forest/shroom3",
-"sounds/ambient/nether/crimson_forest/twang1",
-"sounds/ambient/nether/crimson_forest/voom1",
-"sounds/ambient/nether/crimson_forest/voom2",
-"sounds/ambient/nether/nether_wastes/addition1",
-"sounds/ambient/nether/nether_wastes/addition2",
-"sounds/ambient/nether/nether_wastes/addition3",
-"sounds/ambient/nether/nether_wastes/addition4",
-"sounds/ambient/nether/nether_wastes/addition5",
-"sounds/ambient/nether/nether_wastes/addition6",
-"sounds/ambient/nether/nether_wastes/addition7",
-"sounds/ambient/nether/nether_wastes/addition8",
-"sounds/ambient/nether/nether_wastes/ambience",
-"sounds/ambient/nether/nether_wastes/dark1",
-"sounds/ambient/nether/nether_wastes/dark2",
-"sounds/ambient/nether/nether_wastes/ground1",
-"sounds/ambient/nether/nether_wastes/ground2",
-"sounds/ambient/nether/nether_wastes/ground3",
-"sounds/ambient/nether/nether_wastes/ground4",
-"sounds/ambient/nether/nether_wastes/mood1",
-"sounds/ambient/nether/nether_wastes/mood2",
-"sounds/ambient/nether/nether_wastes/mood3",
-"sounds/ambient/nether/nether_wastes/mood4",
-"sounds/ambient/nether/soulsand_valley/ambience",
-"sounds/ambient/nether/soulsand_valley/mood1",
-"sounds/ambient/nether/soulsand_valley/mood2",
-"sounds/ambient/nether/soulsand_valley/mood3",
-"sounds/ambient/nether/soulsand_valley/mood4",
-"sounds/ambient/nether/soulsand_valley/sand1",
-"sounds/ambient/nether/soulsand_valley/sand2",
-"sounds/ambient/nether/soulsand_valley/sand3",
-"sounds/ambient/nether/soulsand_valley/voices1",
-"sounds/ambient/nether/soulsand_valley/voices2",
-"sounds/ambient/nether/soulsand_valley/voices3",
-"sounds/ambient/nether/soulsand_valley/voices4",
-"sounds/ambient/nether/soulsand_valley/voices5",
-"sounds/ambient/nether/soulsand_valley/whisper1",
-"sounds/ambient/nether/soulsand_valley/whisper2",
-"sounds/ambient/nether/soulsand_valley/whisper3",
-"sounds/ambient/nether/soulsand_valley/whisper4",
-"sounds/ambient/nether/soulsand_valley/whisper5",
-"sounds/ambient/nether/soulsand_valley/whisper6",
-"sounds/ambient/nether/soulsand_valley/whisper7",
-"sounds/ambient/nether/soulsand_valley/whisper8",
-"sounds/ambient/nether/soulsand_valley/wind1",
-"sounds/ambient/nether/soulsand_valley/wind2",
-"sounds/ambient/nether/soulsand_valley/wind3",
-"sounds/ambient/nether/soulsand_valley/wind4",
-"sounds/ambient/nether/soulsand_valley/with1",
-"sounds/ambient/nether/warped_forest/addition1",
-"sounds/ambient/nether/warped_forest/addition2",
-"sounds/ambient/nether/warped_forest/addition3",
-"sounds/ambient/nether/warped_forest/addition4",
-"sounds/ambient/nether/warped_forest/addition5",
-"sounds/ambient/nether/warped_forest/addition6",
-"sounds/ambient/nether/warped_forest/ambience",
-"sounds/ambient/nether/warped_forest/enish1",
-"sounds/ambient/nether/warped_forest/enish2",
-"sounds/ambient/nether/warped_forest/enish3",
-"sounds/ambient/nether/warped_forest/help1",
-"sounds/ambient/nether/warped_forest/help2",
-"sounds/ambient/nether/warped_forest/here1",
-"sounds/ambient/nether/warped_forest/here2",
-"sounds/ambient/nether/warped_forest/here3",
-"sounds/ambient/nether/warped_forest/mood1",
-"sounds/ambient/nether/warped_forest/mood2",
-"sounds/ambient/nether/warped_forest/mood3",
-"sounds/ambient/nether/warped_forest/mood4",
-"sounds/ambient/underwater/enter1",
-"sounds/ambient/underwater/enter2",
-"sounds/ambient/underwater/enter3",
-"sounds/ambient/underwater/exit1",
-"sounds/ambient/underwater/exit2",
-"sounds/ambient/underwater/exit3",
-"sounds/ambient/weather/end_flash1",
-"sounds/ambient/weather/end_flash2",
-"sounds/ambient/weather/end_flash3",
-"sounds/ambient/weather/end_flash4",
-"sounds/ambient/weather/end_flash5",
-"sounds/ambient/weather/end_flash6",
-"sounds/ambient/weather/end_flash7",
-"sounds/ambient/weather/end_flash8",
-"sounds/ambient/weather/rain1",
-"sounds/ambient/weather/rain2",
-"sounds/ambient/weather/rain3",
-"sounds/ambient/weather/rain4",
-"sounds/ambient/weather/thunder1",
-"sounds/ambient/weather/thunder2",
-"sounds/ambient/weather/thunder3",
-"sounds/armor/break_wolf",
-"sounds/armor/crack_wolf1",
-"sounds/armor/crack_wolf2",
-"sounds/armor/crack_wolf3",
-"sounds/armor/crack_wolf4",
-"sounds/armor/damage_wolf1",
-"sounds/armor/damage_wolf2",
-"sounds/armor/damage_wolf3",
-"sounds/armor/damage_wolf4",
-"sounds/armor/equip_chain1",
-"sounds/armor/equip_chain2",
-"sounds/armor/equip_chain3",
-"sounds/armor/equip_chain4",
-"sounds/armor/equip_chain5",
-"sounds/armor/equip_chain6",
-"sounds/armor/equip_copper1",
-"sounds/armor/equip_copper2",
-"sounds/armor/equip_copper3",
-"sounds/armor/equip_copper4",
-"sounds/armor/equip_copper5",
-"sounds/armor/equip_copper6",
-"sounds/armor/equip_diamond1",
-"sounds/armor/equip_diamond2",
-"sounds/armor/equip_diamond3",
-"sounds/armor/equip_diamond4",
-"sounds/armor/equip_diamond5",
-"sounds/armor/equip_diamond6",
-"sounds/armor/equip_generic1",
-"sounds/armor/equip_generic2",
-"sounds/armor/equip_generic3",
-"sounds/armor/equip_generic4",
-"sounds/armor/equip_generic5",
-"sounds/armor/equip_generic6",
-"sounds/armor/equip_gold1",
-"sounds/armor/equip_gold2",
-"sounds/armor/equip_gold3",
-"sounds/armor/equip_gold4",
-"sounds/armor/equip_gold5",
-"sounds/armor/equip_gold6",
-"sounds/armor/equip_iron1",
-"sounds/armor/equip_iron2",
-"sounds/armor/equip_iron3",
-"sounds/armor/equip_iron4",
-"sounds/armor/equip_iron5",
-"sounds/armor/equip_iron6",
-"sounds/armor/equip_leather1",
-"sounds/armor/equip_leather2",
-"sounds/armor/equip_leather3",
-"sounds/armor/equip_leather4",
-"sounds/armor/equip_leather5",
-"sounds/armor/equip_leather6",
-"sounds/armor/equip_netherite1",
-"sounds/armor/equip_netherite2",
-"sounds/armor/equip_netherite3",
-"sounds/armor/equip_netherite4",
-"sounds/armor/equip_wolf1",
-"sounds/armor/equip_wolf2",
-"sounds/armor/repair_wolf1",
-"sounds/armor/repair_wolf2",
-"sounds/armor/repair_wolf3",
-"sounds/armor/repair_wolf4",
-"sounds/armor/unequip_wolf1",
-"sounds/armor/unequip_wolf2",
-"sounds/armor/unsaddle",
-"sounds/block/amethyst/break1",
-"sounds/block/amethyst/break2",
-"sounds/block/amethyst/break3",
-"sounds/block/amethyst/break4",
-"sounds/block/amethyst/place1",
-"sounds/block/amethyst/place2",
-"sounds/block/amethyst/place3",
-"sounds/block/amethyst/place4",
-"sounds/block/amethyst/resonate1",
-"sounds/block/amethyst/resonate2",
-"sounds/block/amethyst/resonate3",
-"sounds/block/amethyst/resonate4",
-"sounds/block/amethyst/shimmer",
-"sounds/block/amethyst/step1",
-"sounds/block/amethyst/step10",
-"sounds/block/amethyst/step11",
-"sounds/block/amethyst/step12",
-"sounds/block/amethyst/step13",
-"sounds/block/amethyst/step14",
-"sounds/block/amethyst/step2",
-"sounds/block/amethyst/step3",
-"sounds/block/amethyst/step4",
-"sounds/block/amethyst/step5",
-"sounds/block/amethyst/step6",
-"sounds/block/amethyst/step7",
-"sounds/block/amethyst/step8",
-"sounds/block/amethyst/step9",
-"sounds/block/amethyst_cluster/break1",
-"sounds/block/amethyst_cluster/break2",
-"sounds/block/amethyst_cluster/break3",
-"sounds/block/amethyst_cluster/break4",
-"sounds/block/amethyst_cluster/place1",
-"sounds/block/amethyst_cluster/place2",
-"sounds/block/amethyst_cluster/place3",
-"sounds/block/amethyst_cluster/place4",
-"sounds/block/azalea/break1",
-"sounds/block/azalea/break2",
-"sounds/block/azalea/break3",
-"sounds/block/azalea/break4",
-"sounds/block/azalea/break5",
-"sounds/block/azalea/break6",
-"sounds/block/azalea/step1",
-"sounds/block/azalea/step2",
-"sounds/block/azalea/step3",
-"sounds/block/azalea/step4",
-"sounds/block/azalea/step5",
-"sounds/block/azalea/step6",
-"sounds/block/azalea_leaves/break1",
-"sounds/block/azalea_leaves/break2",
-"sounds/block/azalea_leaves/break3",
-"sounds/block/azalea_leaves/break4",
-"sounds/block/azalea_leaves/break5",
-"sounds/block/azalea_leaves/break6",
-"sounds/block/azalea_leaves/break7",
-"sounds/block/azalea_leaves/step1",
-"sounds/block/azalea_leaves/step2",
-"sounds/block/azalea_leaves/step3",
-"sounds/block/azalea_leaves/step4",
-"sounds/block/azalea_leaves/step5",
-"sounds/block/bamboo/place1",
-"sounds/block/bamboo/place2",
-"sounds/block/bamboo/place3",
-"sounds/block/bamboo/place4",
-"sounds/block/bamboo/place5",
-"sounds/block/bamboo/place6",
-"sounds/block/bamboo/sapling_place1",
-"sounds/block/bamboo/sapling_place2",
-"sounds/block/bamboo/sapling_place3",
-"sounds/block/bamboo/sapling_place4",
-"sounds/block/bamboo/sapling_place5",
-"sounds/block/bamboo/sapling_place6",
-"sounds/block/bamboo/step1",
-"sounds/block/bamboo/step2",
-"sounds/block/bamboo/step3",
-"sounds/block/bamboo/step4",
-"sounds/block/bamboo/step5",
-"sounds/block/bamboo/step6",
-"sounds/block/bamboo_wood/break1",
-"sounds/block/bamboo_wood/break2",
-"sounds/block/bamboo_wood/break3",
-"sounds/block/bamboo_wood/break4",
-"sounds/block/bamboo_wood/break5",
-"sounds/block/bamboo_wood/step1",
-"sounds/block/bamboo_wood/step2",
-"sounds/block/bamboo_wood/step3",
-"sounds/block/bamboo_wood/step4",
-"sounds/block/bamboo_wood/step5",
-"sounds/block/bamboo_wood/step6",
-"sounds/block/bamboo_wood_button/bamboo_wood_button",
-"sounds/block/bamboo_wood_door/toggle1",
-"sounds/block/bamboo_wood_door/toggle2",
-"sounds/block/bamboo_wood_door/toggle3",
-"sounds/block/bamboo_wood_door/toggle4",
-"sounds/block/bamboo_wood_fence/toggle1",
-"sounds/block/bamboo_wood_fence/toggle2",
-"sounds/block/bamboo_wood_fence/toggle3",
-"sounds/block/bamboo_wood_fence/toggle4",
-"sounds/block/bamboo_wood_hanging_sign/break1",
-"sounds/block/bamboo_wood_hanging_sign/break2",
-"sounds/block/bamboo_wood_hanging_sign/break3",
-"sounds/block/bamboo_wood_hanging_sign/break4",
-"sounds/block/bamboo_wood_hanging_sign/step1",
-"sounds/block/bamboo_wood_hanging_sign/step2",
-"sounds/block/bamboo_wood_hanging_sign/step3",
-"sounds/block/bamboo_wood_hanging_sign/step4",
-"sounds/block/bamboo_wood_trapdoor/toggle1",
-"sounds/block/bamboo_wood_trapdoor/toggle2",
-"sounds/block/bamboo_wood_trapdoor/toggle3",
-"sounds/block/bamboo_wood_trapdoor/toggle4",
-"sounds/block/barrel/close",
-"sounds/block/barrel/open1",
-"sounds/block/barrel/open2",
-"sounds/block/beacon/activate",
-"sounds/block/beacon/ambient",
-"sounds/block/beacon/deactivate",
-"sounds/block/beacon/power1",
-"sounds/block/beacon/power2",
-"sounds/block/beacon/power3",
-"sounds/block/beehive/drip1",
-"sounds/block/beehive/drip2",
-"sounds/block/beehive/drip3",
-"sounds/block/beehive/drip4",
-"sounds/block/beehive/enter",
-"sounds/block/beehive/exit",
-"sounds/block/beehive/shear",
-"sounds/block/beehive/work1",
-"sounds/block/beehive/work2",
-"sounds/block/beehive/work3",
-"sounds/block/beehive/work4",
-"sounds/block/bell/bell_use01",
-"sounds/block/bell/bell_use02",
-"sounds/block/big_dripleaf/break1",
-"sounds/block/big_dripleaf/break2",
-"sounds/block/big_dripleaf/break3",
-"sounds/block/big_dripleaf/break4",
-"sounds/block/big_dripleaf/break5",
-"sounds/block/big_dripleaf/break6",
-"sounds/block/big_dripleaf/step1",
-"sounds/block/big_dripleaf/step2",
-"sounds/block/big_dripleaf/step3",
-"sounds/block/big_dripleaf/step4",
-"sounds/block/big_dripleaf/step5",
-"sounds/block/big_dripleaf/step6",
-"sounds/block/big_dripleaf/tilt_down1",
-"sounds/block/big_dripleaf/tilt_down2",
-"sounds/block/big_dripleaf/tilt_down3",
-"sounds/block/big_dripleaf/tilt_down4",
-"sounds/block/big_dripleaf/tilt_down5",
-"sounds/block/big_dripleaf/tilt_up1",
-"sounds/block/big_dripleaf/tilt_up2",
-"sounds/block/big_dripleaf/tilt_up3",
-"sounds/block/big_dripleaf/tilt_up4",
-"sounds/block/brewing_stand/brew1",
-"sounds/block/brewing_stand/brew2",
-"sounds/block/cactus_flower/break1",
-"sounds/block/cactus_flower/break2",
-"sounds/block/cactus_flower/break3",
-"sounds/block/cactus_flower/break4",
-"sounds/block/cactus_flower/break5",
-"sounds/block/cactus_flower/place1",
-"sounds/block/cactus_flower/place2",
-"sounds/block/cactus_flower/place3",
-"sounds/block/cactus_flower/place4",
-"sounds/block/cake/add_candle1",
-"sounds/block/cake/add_candle2",
-"sounds/block/cake/add_candle3",
-"sounds/block/calcite/break1",
-"sounds/block/calcite/break2",
-"sounds/block/calcite/break3",
-"sounds/block/calcite/break4",
-"sounds/block/calcite/place1",
-"sounds/block/calcite/place2",
-"sounds/block/calcite/place3",
-"sounds/block/calcite/place4",
-"sounds/block/calcite/step1",
-"sounds/block/calcite/step2",
-"sounds/block/calcite/step3",
-"sounds/block/calcite/step4",
-"sounds/block/calcite/step5",
-"sounds/block/calcite/step6",
-"sounds/block/campfire/crackle1",
-"sounds/block/campfire/crackle2",
-"sounds/block/campfire/crackle3",
-"sounds/block/campfire/crackle4",
-"sounds/block/campfire/crackle5",
-"sounds/block/campfire/crackle6",
-"sounds/block/candle/ambient1",
-"sounds/block/candle/ambient2",
-"sounds/block/candle/ambient3",
-"sounds/block/candle/break1",
-"sounds/block/candle/break2",
-"sounds/block/candle/break3",
-"sounds/block/candle/extinguish1",
-"sounds/block/candle/extinguish2",
-"sounds/block/candle/extinguish3",
-"sounds/block/candle/step1",
-"sounds/block/candle/step2",
-"sounds/block/candle/step3",
-"sounds/block/cartography_table/drawmap1",
-"sounds/block/cartography_table/drawmap2",
-"sounds/block/cartography_table/drawmap3",
-"sounds/block/cave_vines/break1",
-"sounds/block/cave_vines/break2",
-"sounds/block/cave_vines/break3",
-"sounds/block/cave_vines/break4",
-"sounds/block/cave_vines/break5",
-"sounds/block/cherry_leaves/break1",
-"sounds/block/cherry_leaves/break2",
-"sounds/block/cherry_leaves/break3",
-"sounds/block/cherry_leaves/break4",
-"sounds/block/cherry_leaves/break5",
-"sounds/block/cherry_leaves/step1",
-"sounds/block/cherry_leaves/step2",
-"sounds/block/cherry_leaves/step3",
-"sounds/block/cherry_leaves/step4",
-"sounds/block/cherry_leaves/step5",
-"sounds/block/cherry_wood/break1",
-"sounds/block/cherry_wood/break2",
-"sounds/block/cherry_wood/break3",
-"sounds/block/cherry_wood/break4",
-"sounds/block/cherry_wood/break5",
-"sounds/block/cherry_wood/step1",
-"sounds/block/cherry_wood/step2",
-"sounds/block/cherry_wood/step3",
-"sounds/block/cherry_wood/step4",
-"sounds/block/cherry_wood/step5",
-"sounds/block/cherry_wood/step6",
-"sounds/block/cherry_wood_button/cherry_wood_click",
-"sounds/block/cherry_wood_door/toggle1",
-"sounds/block/cherry_wood_door/toggle2",
-"sounds/block/cherry_wood_door/toggle3",
-"sounds/block/cherry_wood_door/toggle4",
-"sounds/block/cherry_wood_fence_gate/toggle1",
-"sounds/block/cherry_wood_fence_gate/toggle2",
-"sounds/block/cherry_wood_fence_gate/toggle3",
-"sounds/block/cherry_wood_fence_gate/toggle4",
-"sounds/block/cherry_wood_hanging_sign/break1",
-"sounds/block/cherry_wood_hanging_sign/break2",
-"sounds/block/cherry_wood_hanging_sign/break3",
-"sounds/block/cherry_wood_hanging_sign/break4",
-"sounds/block/cherry_wood_hanging_sign/step1",
-"sounds/block/cherry_wood_hanging_sign/step2",
-"sounds/block/cherry_wood_hanging_sign/step3",
-"sounds/block/cherry_wood_hanging_sign/step4",
-"sounds/block/cherry_wood_trapdoor/toggle1",
-"sounds/block/cherry_wood_trapdoor/toggle2",
-"sounds/block/cherry_wood_trapdoor/toggle3",
-"sounds/block/cherry_wood_trapdoor/toggle4",
-"sounds/block/chiseled_bookshelf/break1",
-"sounds/block/chiseled_bookshelf/break2",
-"sounds/block/chiseled_bookshelf/break3",
-"sounds/block/chiseled_bookshelf/break4",
-"sounds/block/chiseled_bookshelf/break5",
-"sounds/block/chiseled_bookshelf/break6",
-"sounds/block/chiseled_bookshelf/insert1",
-"sounds/block/chiseled_bookshelf/insert2",
-"sounds/block/chiseled_bookshelf/insert3",
-"sounds/block/chiseled_bookshelf/insert4",
-"sounds/block/chiseled_bookshelf/insert_enchanted1",
-"sounds/block/chiseled_bookshelf/insert_enchanted2",
-"sounds/block/chiseled_bookshelf/insert_enchanted3",
-"sounds/block/chiseled_bookshelf/insert_enchanted4",
-"sounds/block/chiseled_bookshelf/pickup1",
-"sounds/block/chiseled_bookshelf/pickup2",
-"sounds/block/chiseled_bookshelf/pickup3",
-"sounds/block/chiseled_bookshelf/pickup_enchanted1",
-"sounds/block/chiseled_bookshelf/pickup_enchanted2",
-"sounds/block/chiseled_bookshelf/pickup_enchanted3",
-"sounds/block/chiseled_bookshelf/step1",
-"sounds/block/chiseled_bookshelf/step2",
-"sounds/block/chiseled_bookshelf/step3",
-"sounds/block/chiseled_bookshelf/step4",
-"sounds/block/chiseled_bookshelf/step5",
-"sounds/block/chorusflower/death1",
-"sounds/block/chorusflower/death2",
-"sounds/block/chorusflower/death3",
-"sounds/block/chorusflower/grow1",
-"sounds/block/chorusflower/grow2",
-"sounds/block/chorusflower/grow3",
-"sounds/block/chorusflower/grow4",
-"sounds/block/composter/empty1",
-"sounds/block/composter/empty2",
-"sounds/block/composter/empty3",
-"sounds/block/composter/fill1",
-"sounds/block/composter/fill2",
-"sounds/block/composter/fill3",
-"sounds/block/composter/fill4",
-"sounds/block/composter/fill_success1",
-"sounds/block/composter/fill_success2",
-"sounds/block/composter/fill_success3",
-"sounds/block/composter/fill_success4",
-"sounds/block/composter/ready1",
-"sounds/block/composter/ready2",
-"sounds/block/composter/ready3",
-"sounds/block/composter/ready4",
-"sounds/block/conduit/activate",
-"sounds/block/conduit/ambient",
-"sounds/block/conduit/attack1",
-"sounds/block/conduit/attack2",
-"sounds/block/conduit/attack3",
-"sounds/block/conduit/deactivate",
-"sounds/block/conduit/short1",
-"sounds/block/conduit/short2",
-"sounds/block/conduit/short3",
-"sounds/block/conduit/short4",
-"sounds/block/conduit/short5",
-"sounds/block/conduit/short6",
-"sounds/block/conduit/short7",
-"sounds/block/conduit/short8",
-"sounds/block/conduit/short9",
-"sounds/block/copper/break1",
-"sounds/block/copper/break2",
-"sounds/block/copper/break3",
-"sounds/block/copper/break4",
-"sounds/block/copper/step1",
-"sounds/block/copper/step2",
-"sounds/block/copper/step3",
-"sounds/block/copper/step4",
-"sounds/block/copper/step5",
-"sounds/block/copper/step6",
-"sounds/block/copper_bulb/break1",
-"sounds/block/copper_bulb/break2",
-"sounds/block/copper_bulb/break3",
-"sounds/block/copper_bulb/break4",
-"sounds/block/copper_bulb/place1",
-"sounds/block/copper_bulb/place2",
-"sounds/block/copper_bulb/place3",
-"sounds/block/copper_bulb/place4",
-"sounds/block/copper_bulb/step1",
-"sounds/block/copper_bulb/step2",
-"sounds/block/copper_bulb/step3",
-"sounds/block/copper_bulb/step4",
-"sounds/block/copper_bulb/step5",
-"sounds/block/copper_bulb/step6",
-"sounds/block/copper_bulb/turn_on",
-"sounds/block/copper_chest/close1",
-"sounds/block/copper_chest/close2",
-"sounds/block/copper_chest/close3",
-"sounds/block/copper_chest/open",
-"sounds/block/copper_chest/open1",
-"sounds/block/copper_chest/open2",
-"sounds/block/copper_chest/open3",
-"sounds/block/copper_chest/oxidized_close1",
-"sounds/block/copper_chest/oxidized_close2",
-"sounds/block/copper_chest/oxidized_close3",
-"sounds/block/copper_chest/oxidized_open1",
-"sounds/block/copper_chest/oxidized_open2",
-"sounds/block/copper_chest/oxidized_open3",
-"sounds/block/copper_chest/weathered_close1",
-"sounds/block/copper_chest/weathered_close2",
-"sounds/block/copper_chest/weathered_close3",
-"sounds/block/copper_chest/weathered_open1",
-"sounds/block/copper_chest/weathered_open2",
-"sounds/block/copper_chest/weathered_open3",
-"sounds/block/copper_door/toggle1",
-"sounds/block/copper_door/toggle2",
-"sounds/block/copper_door/toggle3",
-"sounds/block/copper_golem_statue/break1",
-"sounds/block/copper_golem_statue/break2",
-"sounds/block/copper_golem_statue/break3",
-"sounds/block/copper_golem_statue/hit1",
-"sounds/block/copper_golem_statue/hit2",
-"sounds/block/copper_golem_statue/hit3",
-"sounds/block/copper_golem_statue/hit4",
-"sounds/block/copper_golem_statue/place1",
-"sounds/block/copper_golem_statue/place2",
-"sounds/block/copper_golem_statue/place3",
-"sounds/block/copper_golem_statue/place4",
-"sounds/block/copper_grate/break1",
-"sounds/block/copper_grate/break2",
-"sounds/block/copper_grate/break3",
-"sounds/block/copper_grate/break4",
-"sounds/block/copper_grate/step1",
-"sounds/block/copper_grate/step2",
-"sounds/block/copper_grate/step3",
-"sounds/block/copper_grate/step4",
-"sounds/block/copper_grate/step5",
-"sounds/block/copper_grate/step6",
-"sounds/block/copper_trapdoor/toggle1",
-"sounds/block/copper_trapdoor/toggle2",
-"sounds/block/copper_trapdoor/toggle3",
-"sounds/block/copper_trapdoor/toggle4",
-"sounds/block/crafter/craft",
-"sounds/block/crafter/fail",
-"sounds/block/creaking_heart/ambient1",
-"sounds/block/creaking_heart/ambient2",
-"sounds/block/creaking_heart/ambient3",
-"sounds/block/creaking_heart/ambient4",
-"sounds/block/creaking_heart/break",
-"sounds/block/creaking_heart/fall",
-"sounds/block/creaking_heart/hit1",
-"sounds/block/creaking_heart/hit2",
-"sounds/block/creaking_heart/hit3",
-"sounds/block/creaking_heart/hit4",
-"sounds/block/creaking_heart/hit5",
-"sounds/block/creaking_heart/place1",
-"sounds/block/creaking_heart/place2",
-"sounds/block/creaking_heart/place3",
-"sounds/block/creaking_heart/place4",
-"sounds/block/creaking_heart/spawn_mob",
-"sounds/block/creaking_heart/step1",
-"sounds/block/creaking_heart/step2",
-"sounds/block/creaking_heart/step3",
-"sounds/block/creaking_heart/step4",
-"sounds/block/creaking_heart/step5",
-"sounds/block/creaking_heart/step6",
-"sounds/block/creaking_heart/trail1",
-"sounds/block/creaking_heart/trail2",
-"sounds/block/creaking_heart/trail3",
-"sounds/block/creaking_heart/trail4",
-"sounds/block/creaking_heart/trail5",
-"sounds/block/creaking_heart/trail6",
-"sounds/block/creaking_heart/trail7",
-"sounds/block/deadbush/bushrustle1",
-"sounds/block/deadbush/bushrustle2",
-"sounds/block/deadbush/bushrustle3",
-"sounds/block/deadbush/creakysand1",
-"sounds/block/deadbush/crickets",
-"sounds/block/deadbush/howlingwind1",
-"sounds/block/deadbush/insect1",
-"sounds/block/deadbush/leaves",
-"sounds/block/deadbush/movingsand1",
-"sounds/block/deadbush/movingsand2",
-"sounds/block/deadbush/movingsand3",
-"sounds/block/decorated_pot/break1",
-"sounds/block/decorated_pot/break2",
-"sounds/block/decorated_pot/break3",
-"sounds/block/decorated_pot/break4",
-"sounds/block/decorated_pot/insert1",
-"sounds/block/decorated_pot/insert2",
-"sounds/block/decorated_pot/insert3",
-"sounds/block/decorated_pot/insert4",
-"sounds/block/decorated_pot/insert_fail1",
-"sounds/block/decorated_pot/insert_fail2",
-"sounds/block/decorated_pot/insert_fail3",
-"sounds/block/decorated_pot/insert_fail4",
-"sounds/block/decorated_pot/insert_fail5",
-"sounds/block/decorated_pot/shatter1",
-"sounds/block/decorated_pot/shatter2",
-"sounds/block/decorated_pot/shatter3",
-"sounds/block/decorated_pot/shatter4",
-"sounds/block/decorated_pot/shatter5",
-"sounds/block/decorated_pot/step1",
-"sounds/block/decorated_pot/step2",
-"sounds/block/decorated_pot/step3",
-"sounds/block/decorated_pot/step4",
-"sounds/block/decorated_pot/step5",
-"sounds/block/deepslate/break1",
-"sounds/block/deepslate/break2",
-"sounds/block/deepslate/break3",
-"sounds/block/deepslate/break4",
-"sounds/block/deepslate/place1",
-"sounds/block/deepslate/place2",
-"sounds/block/deepslate/place3",
-"sounds/block/deepslate/place4",
-"sounds/block/deepslate/place5",
-"sounds/block/deepslate/place6",
-"sounds/block/deepslate/step1",
-"sounds/block/deepslate/step2",
-"sounds/block/deepslate/step3",
-"sounds/block/deepslate/step4",
-"sounds/block/deepslate/step5",
-"sounds/block/deepslate/step6",
-"sounds/block/deepslate_bricks/place1",
-"sounds/block/deepslate_bricks/place2",
-"sounds/block/deepslate_bricks/place3",
-"sounds/block/deepslate_bricks/place4",
-"sounds/block/deepslate_bricks/place5",
-"sounds/block/deepslate_bricks/place6",
-"sounds/block/deepslate_bricks/step1",
-"sounds/block/deepslate_bricks/step2",
-"sounds/block/deepslate_bricks/step3",
-"sounds/block/deepslate_bricks/step4",
-"sounds/block/deepslate_bricks/step5",
-"sounds/block/deepslate_bricks/step6",
-"sounds/block/dried_ghast/ambient1",
-"sounds/block/dried_ghast/ambient2",
-"sounds/block/dried_ghast/ambient3",
-"sounds/block/dried_ghast/ambient4",
-"sounds/block/dried_ghast/ambient_water1",
-"sounds/block/dried_ghast/ambient_water2",
-"sounds/block/dried_ghast/break",
-"sounds/block/dried_ghast/place/place1",
-"sounds/block/dried_ghast/place/place2",
-"sounds/block/dried_ghast/place/place3",
-"sounds/block/dried_ghast/place/place4",
-"sounds/block/dried_ghast/place/place5",
-"sounds/block/dried_ghast/place/place6",
-"sounds/block/dried_ghast/placeinwater",
-"sounds/block/dried_ghast/step/step1",
-"sounds/block/dried_ghast/step/step2",
-"sounds/block/dried_ghast/step/step3",
-"sounds/block/dried_ghast/step/step4",
-"sounds/block/dried_ghast/step/step5",
-"sounds/block/dried_ghast/step/step6",
-"sounds/block/dried_ghast/transition",
-"sounds/block/dripstone/break1",
-"sounds/block/dripstone/break2",
-"sounds/block/dripstone/break3",
-"sounds/block/dripstone/break4",
-"sounds/block/dripstone/break5",
-"sounds/block/dripstone/step1",
-"sounds/block/dripstone/step2",
-"sounds/block/dripstone/step3",
-"sounds/block/dripstone/step4",
-"sounds/block/dripstone/step5",
-"sounds/block/dripstone/step6",
-"sounds/block/enchanting_table/enchant1",
-"sounds/block/enchanting_table/enchant2",
-"sounds/block/enchanting_table/enchant3",
-"sounds/block/end_portal/endportal",
-"sounds/block/end_portal/eyeplace1",
-"sounds/block/end_portal/eyeplace2",
-"sounds/block/end_portal/eyeplace3",
-"sounds/block/enderchest/close",
-"sounds/block/enderchest/open",
-"sounds/block/eyeblossom/close1",
-"sounds/block/eyeblossom/close2",
-"sounds/block/eyeblossom/close3",
-"sounds/block/eyeblossom/close_long",
-"sounds/block/eyeblossom/idle1",
-"sounds/block/eyeblossom/idle2",
-"sounds/block/eyeblossom/idle3",
-"sounds/block/eyeblossom/idle4",
-"sounds/block/eyeblossom/idle5",
-"sounds/block/eyeblossom/idle6",
-"sounds/block/eyeblossom/open1",
-"sounds/block/eyeblossom/open2",
-"sounds/block/eyeblossom/open3",
-"sounds/block/eyeblossom/open4",
-"sounds/block/eyeblossom/open_long",
-"sounds/block/fence_gate/close1",
-"sounds/block/fence_gate/close2",
-"sounds/block/fence_gate/open1",
-"sounds/block/fence_gate/open2",
-"sounds/block/firefly_bush/ambient1",
-"sounds/block/firefly_bush/ambient10",
-"sounds/block/firefly_bush/ambient11",
-"sounds/block/firefly_bush/ambient2",
-"sounds/block/firefly_bush/ambient3",
-"sounds/block/firefly_bush/ambient4",
-"sounds/block/firefly_bush/ambient5",
-"sounds/block/firefly_bush/ambient6",
-"sounds/block/firefly_bush/ambient7",
-"sounds/block/firefly_bush/ambient8",
-"sounds/block/firefly_bush/ambient9",
-"sounds/block/frog_spawn/break1",
-"sounds/block/frog_spawn/break2",
-"sounds/block/frog_spawn/break3",
-"sounds/block/frog_spawn/break4",
-"sounds/block/frog_spawn/hatch1",
-"sounds/block/frog_spawn/hatch2",
-"sounds/block/frog_spawn/hatch3",
-"sounds/block/frog_spawn/hatch4",
-"sounds/block/frog_spawn/hatch5",
-"sounds/block/frog_spawn/step1",
-"sounds/block/frog_spawn/step2",
-"sounds/block/frog_spawn/step3",
-"sounds/block/frog_spawn/step4",
-"sounds/block/frog_spawn/step5",
-"sounds/block/frog_spawn/step6",
-"sounds/block/froglight/break1",
-"sounds/block/froglight/break2",
-"sounds/block/froglight/break3",
-"sounds/block/froglight/break4",
-"sounds/block/froglight/step1",
-"sounds/block/froglight/step2",
-"sounds/block/froglight/step3",
-"sounds/block/froglight/step4",
-"sounds/block/froglight/step5",
-"sounds/block/froglight/step6",
-"sounds/block/furnace/fire_crackle1",
-"sounds/block/furnace/fire_crackle2",
-"sounds/block/furnace/fire_crackle3",
-"sounds/block/furnace/fire_crackle4",
-"sounds/block/furnace/fire_crackle5",
-"sounds/block/grass/flatten1",
-"sounds/block/grass/flatten2",
-"sounds/block/grass/flatten3",
-"sounds/block/grass/flatten4",
-"sounds/block/grindstone/grindstone1",
-"sounds/block/grindstone/grindstone2",
-"sounds/block/grindstone/grindstone3",
-"sounds/block/hanging_roots/break1",
-"sounds/block/hanging_roots/break2",
-"sounds/block/hanging_roots/break3",
-"sounds/block/hanging_roots/break4",
-"sounds/block/hanging_roots/step1",
-"sounds/block/hanging_roots/step2",
-"sounds/block/hanging_roots/step3",
-"sounds/block/hanging_roots/step4",
-"sounds/block/hanging_roots/step5",
-"sounds/block/hanging_roots/step6",
-"sounds/block/hanging_sign/break1",
-"sounds/block/hanging_sign/break2",
-"sounds/block/hanging_sign/break3",
-"sounds/block/hanging_sign/break4",
-"sounds/block/hanging_sign/step1",
-"sounds/block/hanging_sign/step2",
-"sounds/block/hanging_sign/step3",
-"sounds/block/hanging_sign/step4",
-"sounds/block/heavy_core/break1",
-"sounds/block/heavy_core/break2",
-"sounds/block/heavy_core/break3",
-"sounds/block/heavy_core/break4",
-"sounds/block/heavy_core/step1",
-"sounds/block/heavy_core/step2",
-"sounds/block/heavy_core/step3",
-"sounds/block/heavy_core/step4",
-"sounds/block/iron/break1",
-"sounds/block/iron/break2",
-"sounds/block/iron/break3",
-"sounds/block/iron/break4",
-"sounds/block/iron/break5",
-"sounds/block/iron/break6",
-"sounds/block/iron/break7",
-"sounds/block/iron/break8",
-"sounds/block/iron/step1",
-"sounds/block/iron/step2",
-"sounds/block/iron/step3",
-"sounds/block/iron/step4",
-"sounds/block/iron_door/close1",
-"sounds/block/iron_door/close2",
-"sounds/block/iron_door/close3",
-"sounds/block/iron_door/close4",
-"sounds/block/iron_door/open1",
-"sounds/block/iron_door/open2",
-"sounds/block/iron_door/open3",
-"sounds/block/iron_door/open4",
-"sounds/block/iron_trapdoor/close1",
-"sounds/block/iron_trapdoor/close2",
-"sounds/block/iron_trapdoor/close3",
-"sounds/block/iron_trapdoor/close4",
-"sounds/block/iron_trapdoor/open1",
-"sounds/block/iron_trapdoor/open2",
-"sounds/block/iron_trapdoor/open3",
-"sounds/block/iron_trapdoor/open4",
-"sounds/block/itemframe/add_item1",
-"sounds/block/itemframe/add_item2",
-"sounds/block/itemframe/add_item3",
-"sounds/block/itemframe/add_item4",
-"sounds/block/itemframe/break1",
-"sounds/block/itemframe/break2",
-"sounds/block/itemframe/break3",
-"sounds/block/itemframe/place1",
-"sounds/block/itemframe/place2",
-"sounds/block/itemframe/place3",
-"sounds/block/itemframe/place4",
-"sounds/block/itemframe/remove_item1",
-"sounds/block/itemframe/remove_item2",
-"sounds/block/itemframe/remove_item3",
-"sounds/block/itemframe/remove_item4",
-"sounds/block/itemframe/rotate_item1",
-"sounds/block/itemframe/rotate_item2",
-"sounds/block/itemframe/rotate_item3",
-"sounds/block/itemframe/rotate_item4",
-"sounds/block/lantern/break1",
-"sounds/block/lantern/break2",
-"sounds/block/lantern/break3",
-"sounds/block/lantern/break4",
-"sounds/block/lantern/break5",
-"sounds/block/lantern/break6",
-"sounds/block/lantern/place1",
-"sounds/block/lantern/place2",
-"sounds/block/lantern/place3",
-"sounds/block/lantern/place4",
-"sounds/block/lantern/place5",
-"sounds/block/lantern/place6",
-"sounds/block/leaf_litter/break1",
-"sounds/block/leaf_litter/break2",
-"sounds/block/leaf_litter/break3",
-"sounds/block/leaf_litter/break4",
-"sounds/block/leaf_litter/break5",
-"sounds/block/leaf_litter/place1",
-"sounds/block/leaf_litter/place2",
-"sounds/block/leaf_litter/place3",
-"sounds/block/leaf_litter/place4",
-"sounds/block/leaf_litter/place5",
-"sounds/block/leaf_litter/step1",
-"sounds/block/leaf_litter/step2",
-"sounds/block/leaf_litter/step3",
-"sounds/block/leaf_litter/step4",
-"sounds/block/leaf_litter/step5",
-"sounds/block/leaf_litter/step6",
-"sounds/block/loom/take_result1",
-"sounds/block/loom/take_result2",
-"sounds/block/mangrove_roots/break1",
-"sounds/block/mangrove_roots/break2",
-"sounds/block/mangrove_roots/break3",
-"sounds/block/mangrove_roots/break4",
-"sounds/block/mangrove_roots/break5",
-"sounds/block/mangrove_roots/break6",
-"sounds/block/mangrove_roots/step1",
-"sounds/block/mangrove_roots/step2",
-"sounds/block/mangrove_roots/step3",
-"sounds/block/mangrove_roots/step4",
-"sounds/block/mangrove_roots/step5",
-"sounds/block/mangrove_roots/step6",
-"sounds/block/mob_spawner/break1",
-"sounds/block/mob_spawner/break2",
-"sounds/block/mob_spawner/break3",
-"sounds/block/mob_spawner/break4",
-"sounds/block/mob_spawner/step1",
-"sounds/block/mob_spawner/step2",
-"sounds/block/mob_spawner/step3",
-"sounds/block/mob_spawner/step4",
-"sounds/block/mob_spawner/step5",
-"sounds/block/moss/break1",
-"sounds/block/moss/break2",
-"sounds/block/moss/break3",
-"sounds/block/moss/break4",
-"sounds/block/moss/break5",
-"sounds/block/moss/step1",
-"sounds/block/moss/step2",
-"sounds/block/moss/step3",
-"sounds/block/moss/step4",
-"sounds/block/moss/step5",
-"sounds/block/moss/step6",
-"sounds/block/mud/break1",
-"sounds/block/mud/break2",
-"sounds/block/mud/break3",
-"sounds/block/mud/break4",
-"sounds/block/mud/break5",
-"sounds/block/mud/break6",
-"sounds/block/mud/step1",
-"sounds/block/mud/step2",
-"sounds/block/mud/step3",
-"sounds/block/mud/step4",
-"sounds/block/mud/step5",
-"sounds/block/mud/step6",
-"sounds/block/mud_bricks/break1",
-"sounds/block/mud_bricks/break2",
-"sounds/block/mud_bricks/break3",
-"sounds/block/mud_bricks/break4",
-"sounds/block/mud_bricks/break5",
-"sounds/block/mud_bricks/break6",
-"sounds/block/mud_bricks/step1",
-"sounds/block/mud_bricks/step2",
-"sounds/block/mud_bricks/step3",
-"sounds/block/mud_bricks/step4",
-"sounds/block/mud_bricks/step5",
-"sounds/block/mud_bricks/step6",
-"sounds/block/muddy_mangrove_roots/break1",
-"sounds/block/muddy_mangrove_roots/break2",
-"sounds/block/muddy_mangrove_roots/break3",
-"sounds/block/muddy_mangrove_roots/break4",
-"sounds/block/muddy_mangrove_roots/break5",
-"sounds/block/muddy_mangrove_roots/break6",
-"sounds/block/muddy_mangrove_roots/step1",
-"sounds/block/muddy_mangrove_roots/step2",
-"sounds/block/muddy_mangrove_roots/step3",
-"sounds/block/muddy_mangrove_roots/step4",
-"sounds/block/muddy_mangrove_roots/step5",
-"sounds/block/muddy_mangrove_roots/step6",
-"sounds/block/nether_wood/break1",
-"sounds/block/nether_wood/break2",
-"sounds/block/nether_wood/break3",
-"sounds/block/nether_wood/break4",
-"sounds/block/nether_wood/step1",
-"sounds/block/nether_wood/step2",
-"sounds/block/nether_wood/step3",
-"sounds/block/nether_wood/step4",
-"sounds/block/nether_wood/step5",
-"sounds/block/nether_wood_button/nether_wood_button",
-"sounds/block/nether_wood_door/toggle1",
-"sounds/block/nether_wood_door/toggle2",
-"sounds/block/nether_wood_door/toggle3",
-"sounds/block/nether_wood_door/toggle4",
-"sounds/block/nether_wood_fence/toggle1",
-"sounds/block/nether_wood_fence/toggle2",
-"sounds/block/nether_wood_fence/toggle3",
-"sounds/block/nether_wood_fence/toggle4",
-"sounds/block/nether_wood_hanging_sign/break1",
-"sounds/block/nether_wood_hanging_sign/break2",
-"sounds/block/nether_wood_hanging_sign/break3",
-"sounds/block/nether_wood_hanging_sign/break4",
-"sounds/block/nether_wood_hanging_sign/step1",
-"sounds/block/nether_wood_hanging_sign/step2",
-"sounds/block/nether_wood_hanging_sign/step3",
-"sounds/block/nether_wood_hanging_sign/step4",
-"sounds/block/nether_wood_trapdoor/toggle1",
-"sounds/block/nether_wood_trapdoor/toggle2",
-"sounds/block/nether_wood_trapdoor/toggle3",
-"sounds/block/nether_wood_trapdoor/toggle4",
-"sounds/block/packed_mud/break1",
-"sounds/block/packed_mud/break2",
-"sounds/block/packed_mud/break3",
-"sounds/block/packed_mud/break4",
-"sounds/block/packed_mud/break5",
-"sounds/block/packed_mud/break6",
-"sounds/block/packed_mud/step1",
-"sounds/block/packed_mud/step2",
-"sounds/block/packed_mud/step3",
-"sounds/block/packed_mud/step4",
-"sounds/block/packed_mud/step5",
-"sounds/block/packed_mud/step6",
-"sounds/block/pale_hanging_moss/ambient1",
-"sounds/block/pale_hanging_moss/ambient10",
-"sounds/block/pale_hanging_moss/ambient11",
-"sounds/block/pale_hanging_moss/ambient12",
-"sounds/block/pale_hanging_moss/ambient13",
-"sounds/block/pale_hanging_moss/ambient14",
-"sounds/block/pale_hanging_moss/ambient15",
-"sounds/block/pale_hanging_moss/ambient2",
-"sounds/block/pale_hanging_moss/ambient3",
-"sounds/block/pale_hanging_moss/ambient4",
-"sounds/block/pale_hanging_moss/ambient5",
-"sounds/block/pale_hanging_moss/ambient6",
-"sounds/block/pale_hanging_moss/ambient7",
-"sounds/block/pale_hanging_moss/ambient8",
-"sounds/block/pale_hanging_moss/ambient9",
-"sounds/block/permissions/shimmer/shimmerblock",
-"sounds/block/pointed_dripstone/drip_lava1",
-"sounds/block/pointed_dripstone/drip_lava2",
-"sounds/block/pointed_dripstone/drip_lava3",
-"sounds/block/pointed_dripstone/drip_lava4",
-"sounds/block/pointed_dripstone/drip_lava5",
-"sounds/block/pointed_dripstone/drip_lava6",
-"sounds/block/pointed_dripstone/drip_lava_cauldron1",
-"sounds/block/pointed_dripstone/drip_lava_cauldron2",
-"sounds/block/pointed_dripstone/drip_lava_cauldron3",
-"sounds/block/pointed_dripstone/drip_lava_cauldron4",
-"sounds/block/pointed_dripstone/drip_water1",
-"sounds/block/pointed_dripstone/drip_water10",
-"sounds/block/pointed_dripstone/drip_water11",
-"sounds/block/pointed_dripstone/drip_water12",
-"sounds/block/pointed_dripstone/drip_water13",
-"sounds/block/pointed_dripstone/drip_water14",
-"sounds/block/pointed_dripstone/drip_water15",
-"sounds/block/pointed_dripstone/drip_water2",
-"sounds/block/pointed_dripstone/drip_water3",
-"sounds/block/pointed_dripstone/drip_water4",
-"sounds/block/pointed_dripstone/drip_water5",
-"sounds/block/pointed_dripstone/drip_water6",
-"sounds/block/pointed_dripstone/drip_water7",
-"sounds/block/pointed_dripstone/drip_water8",
-"sounds/block/pointed_dripstone/drip_water9",
-"sounds/block/pointed_dripstone/drip_water_cauldron1",
-"sounds/block/pointed_dripstone/drip_water_cauldron2",
-"sounds/block/pointed_dripstone/drip_water_cauldron3",
-"sounds/block/pointed_dripstone/drip_water_cauldron4",
-"sounds/block/pointed_dripstone/drip_water_cauldron5",
-"sounds/block/pointed_dripstone/drip_water_cauldron6",
-"sounds/block/pointed_dripstone/drip_water_cauldron7",
-"sounds/block/pointed_dripstone/drip_water_cauldron8",
-"sounds/block/pointed_dripstone/land1",
-"sounds/block/pointed_dripstone/land2",
-"sounds/block/pointed_dripstone/land3",
-"sounds/block/pointed_dripstone/land4",
-"sounds/block/pointed_dripstone/land5",
-"sounds/block/powder_snow/break1",
-"sounds/block/powder_snow/break2",
-"sounds/block/powder_snow/break3",
-"sounds/block/powder_snow/break4",
-"sounds/block/powder_snow/break5",
-"sounds/block/powder_snow/break6",
-"sounds/block/powder_snow/break7",
-"sounds/block/powder_snow/step1",
-"sounds/block/powder_snow/step10",
-"sounds/block/powder_snow/step2",
-"sounds/block/powder_snow/step3",
-"sounds/block/powder_snow/step4",
-"sounds/block/powder_snow/step5",
-"sounds/block/powder_snow/step6",
-"sounds/block/powder_snow/step7",
-"sounds/block/powder_snow/step8",
-"sounds/block/powder_snow/step9",
-"sounds/block/pumpkin/carve1",
-"sounds/block/pumpkin/carve2",
-"sounds/block/resin/break1",
-"sounds/block/resin/break2",
-"sounds/block/resin/break3",
-"sounds/block/resin/break4",
-"sounds/block/resin/break5",
-"sounds/block/resin/fall",
-"sounds/block/resin/hit1",
-"sounds/block/resin/hit2",
-"sounds/block/resin/hit3",
-"sounds/block/resin/hit4",
-"sounds/block/resin/hit5",
-"sounds/block/resin/place1",
-"sounds/block/resin/place2",
-"sounds/block/resin/place3",
-"sounds/block/resin/place4",
-"sounds/block/resin/step1",
-"sounds/block/resin/step2",
-"sounds/block/resin/step3",
-"sounds/block/resin/step4",
-"sounds/block/resin/step5",
-"sounds/block/resin_brick/break",
-"sounds/block/resin_brick/fall",
-"sounds/block/resin_brick/hit1",
-"sounds/block/resin_brick/hit2",
-"sounds/block/resin_brick/hit3",
-"sounds/block/resin_brick/hit4",
-"sounds/block/resin_brick/hit5",
-"sounds/block/resin_brick/place1",
-"sounds/block/resin_brick/place2",
-"sounds/block/resin_brick/place3",
-"sounds/block/resin_brick/place4",
-"sounds/block/resin_brick/place5",
-"sounds/block/resin_brick/step1",
-"sounds/block/resin_brick/step2",
-"sounds/block/resin_brick/step3",
-"sounds/block/resin_brick/step4",
-"sounds/block/resin_brick/step5",
-"sounds/block/respawn_anchor/ambient1",
-"sounds/block/respawn_anchor/ambient2",
-"sounds/block/respawn_anchor/ambient3",
-"sounds/block/respawn_anchor/charge1",
-"sounds/block/respawn_anchor/charge2",
-"sounds/block/respawn_anchor/charge3",
-"sounds/block/respawn_anchor/deplete1",
-"sounds/block/respawn_anchor/deplete2",
-"sounds/block/respawn_anchor/set_spawn1",
-"sounds/block/respawn_anchor/set_spawn2",
-"sounds/block/respawn_anchor/set_spawn3",
-"sounds/block/rooted_dirt/break1",
-"sounds/block/rooted_dirt/break2",
-"sounds/block/rooted_dirt/break3",
-"sounds/block/rooted_dirt/break4",
-"sounds/block/rooted_dirt/step1",
-"sounds/block/rooted_dirt/step2",
-"sounds/block/rooted_dirt/step3",
-"sounds/block/rooted_dirt/step4",
-"sounds/block/rooted_dirt/step5",
-"sounds/block/rooted_dirt/step6",
-"sounds/block/roots/break1",
-"sounds/block/roots/break2",
-"sounds/block/roots/break3",
-"sounds/block/roots/break4",
-"sounds/block/roots/break5",
-"sounds/block/roots/break6",
-"sounds/block/roots/step1",
-"sounds/block/roots/step2",
-"sounds/block/roots/step3",
-"sounds/block/roots/step4",
-"sounds/block/roots/step5",
-"sounds/block/sand/sand1",
-"sounds/block/sand/sand10",
-"sounds/block/sand/sand11",
-"sounds/block/sand/sand12",
-"sounds/block/sand/sand13",
-"sounds/block/sand/sand14",
-"sounds/block/sand/sand15",
-"sounds/block/sand/sand16",
-"sounds/block/sand/sand17",
-"sounds/block/sand/sand18",
-"sounds/block/sand/sand19",
-"sounds/block/sand/sand2",
-"sounds/block/sand/sand20",
-"sounds/block/sand/sand21",
-"sounds/block/sand/sand3",
-"sounds/block/sand/sand4",
-"sounds/block/sand/sand5",
-"sounds/block/sand/sand6",
-"sounds/block/sand/sand7",
-"sounds/block/sand/sand8",
-"sounds/block/sand/sand9",
-"sounds/block/sand/wind1",
-"sounds/block/sand/wind10",
-"sounds/block/sand/wind11",
-"sounds/block/sand/wind12",
-"sounds/block/sand/wind2",
-"sounds/block/sand/wind3",
-"sounds/block/sand/wind4",
-"sounds/block/sand/wind5",
-"sounds/block/sand/wind6",
-"sounds/block/sand/wind7",
-"sounds/block/sand/wind8",
-"sounds/block/sand/wind9",
-"sounds/block/scaffold/place1",
-"sounds/block/scaffold/place2",
-"sounds/block/scaffold/place3",
-"sounds/block/scaffold/place4",
-"sounds/block/sculk/break1",
-"sounds/block/sculk/break10",
-"sounds/block/sculk/break11",
-"sounds/block/sculk/break12",
-"sounds/block/sculk/break13",
-"sounds/block/sculk/break14",
-"sounds/block/sculk/break2",
-"sounds/block/sculk/break3",
-"sounds/block/sculk/break4",
-"sounds/block/sculk/break5",
-"sounds/block/sculk/break6",
-"sounds/block/sculk/break7",
-"sounds/block/sculk/break8",
-"sounds/block/sculk/break9",
-"sounds/block/sculk/charge1",
-"sounds/block/sculk/charge2",
-"sounds/block/sculk/charge3",
-"sounds/block/sculk/charge4",
-"sounds/block/sculk/charge5",
-"sounds/block/sculk/place1",
-"sounds/block/sculk/place2",
-"sounds/block/sculk/place3",
-"sounds/block/sculk/place4",
-"sounds/block/sculk/place5",
-"sounds/block/sculk/spread1",
-"sounds/block/sculk/spread2",
-"sounds/block/sculk/spread3",
-"sounds/block/sculk/spread4",
-"sounds/block/sculk/spread5",
-"sounds/block/sculk/step1",
-"sounds/block/sculk/step2",
-"sounds/block/sculk/step3",
-"sounds/block/sculk/step4",
-"sounds/block/sculk/step5",
-"sounds/block/sculk/step6",
-"sounds/block/sculk_catalyst/break1",
-"sounds/block/sculk_catalyst/break10",
-"sounds/block/sculk_catalyst/break2",
-"sounds/block/sculk_catalyst/break3",
-"sounds/block/sculk_catalyst/break4",
-"sounds/block/sculk_catalyst/break5",
-"sounds/block/sculk_catalyst/break6",
-"sounds/block/sculk_catalyst/break7",
-"sounds/block/sculk_catalyst/break8",
-"sounds/block/sculk_catalyst/break9",
-"sounds/block/sculk_catalyst/place1",
-"sounds/block/sculk_catalyst/place2",
-"sounds/block/sculk_catalyst/place3",
-"sounds/block/sculk_catalyst/place4",
-"sounds/block/sculk_catalyst/place5",
-"sounds/block/sculk_catalyst/step1",
-"sounds/block/sculk_catalyst/step2",
-"sounds/block/sculk_catalyst/step3",
-"sounds/block/sculk_catalyst/step4",
-"sounds/block/sculk_catalyst/step5",
-"sounds/block/sculk_catalyst/step6",
-"sounds/block/sculk_sensor/break1",
-"sounds/block/sculk_sensor/break2",
-"sounds/block/sculk_sensor/break3",
-"sounds/block/sculk_sensor/break4",
-"sounds/block/sculk_sensor/break5",
-"sounds/block/sculk_sensor/place1",
-"sounds/block/sculk_sensor/place2",
-"sounds/block/sculk_sensor/place3",
-"sounds/block/sculk_sensor/place4",
-"sounds/block/sculk_sensor/place5",
-"sounds/block/sculk_sensor/sculk_clicking1",
-"sounds/block/sculk_sensor/sculk_clicking2",
-"sounds/block/sculk_sensor/sculk_clicking3",
-"sounds/block/sculk_sensor/sculk_clicking4",
-"sounds/block/sculk_sensor/sculk_clicking5",
-"sounds/block/sculk_sensor/sculk_clicking6",
-"sounds/block/sculk_sensor/sculk_clicking_stop1",
-"sounds/block/sculk_sensor/sculk_clicking_stop2",
-"sounds/block/sculk_sensor/sculk_clicking_stop3",
-"sounds/block/sculk_sensor/sculk_clicking_stop4",
-"sounds/block/sculk_sensor/sculk_clicking_stop5",
-"sounds/block/sculk_sensor/step1",
-"sounds/block/sculk_sensor/step2",
-"sounds/block/sculk_sensor/step3",
-"sounds/block/sculk_sensor/step4",
-"sounds/block/sculk_sensor/step5",
-"sounds/block/sculk_sensor/step6",
-"sounds/block/sculk_shrieker/break1",
-"sounds/block/sculk_shrieker/break2",
-"sounds/block/sculk_shrieker/break3",
-"sounds/block/sculk_shrieker/break4",
-"sounds/block/sculk_shrieker/break5",
-"sounds/block/sculk_shrieker/break6",
-"sounds/block/sculk_shrieker/place1",
-"sounds/block/sculk_shrieker/place2",
-"sounds/block/sculk_shrieker/place3",
-"sounds/block/sculk_shrieker/place4",
-"sounds/block/sculk_shrieker/place5",
-"sounds/block/sculk_shrieker/shriek1",
-"sounds/block/sculk_shrieker/shriek2",
-"sounds/block/sculk_shrieker/shriek3",
-"sounds/block/sculk_shrieker/shriek4",
-"sounds/block/sculk_shrieker/shriek5",
-"sounds/block/sculk_vein/break1",
-"sounds/block/sculk_vein/break2",
-"sounds/block/sculk_vein/break3",
-"sounds/block/sculk_vein/break4",
-"sounds/block/sculk_vein/break5",
-"sounds/block/shelf/activate/activate1",
-"sounds/block/shelf/activate/activate2",
-"sounds/block/shelf/activate/activate3",
-"sounds/block/shelf/break/break1",
-"sounds/block/shelf/break/break2",
-"sounds/block/shelf/break/break3",
-"sounds/block/shelf/break/break4",
-"sounds/block/shelf/break/break5",
-"sounds/block/shelf/break/break6",
-"sounds/block/shelf/deactivate/deactivate1",
-"sounds/block/shelf/deactivate/deactivate2",
-"sounds/block/shelf/deactivate/deactivate3",
-"sounds/block/shelf/multi_swap/multi_swap1",
-"sounds/block/shelf/multi_swap/multi_swap2",
-"sounds/block/shelf/multi_swap/multi_swap3",
-"sounds/block/shelf/place_item/place_item1",
-"sounds/block/shelf/place_item/place_item2",
-"sounds/block/shelf/place_item/place_item3",
-"sounds/block/shelf/place_item/place_item4",
-"sounds/block/shelf/single_swap/single_swap1",
-"sounds/block/shelf/single_swap/single_swap2",
-"sounds/block/shelf/single_swap/single_swap3",
-"sounds/block/shelf/single_swap/single_swap4",
-"sounds/block/shulker_box/close",
-"sounds/block/shulker_box/open",
-"sounds/block/sign/waxed_interact_fail1",
-"sounds/block/sign/waxed_interact_fail2",
-"sounds/block/sign/waxed_interact_fail3",
-"sounds/block/smoker/smoke1",
-"sounds/block/smoker/smoke2",
-"sounds/block/sponge/absorb1",
-"sounds/block/sponge/absorb2",
-"sounds/block/sponge/absorb3",
-"sounds/block/sponge/break1",
-"sounds/block/sponge/break2",
-"sounds/block/sponge/break3",
-"sounds/block/sponge/break4",
-"sounds/block/sponge/step1",
-"sounds/block/sponge/step2",
-"sounds/block/sponge/step3",
-"sounds/block/sponge/step4",
-"sounds/block/sponge/step5",
-"sounds/block/sponge/step6",
-"sounds/block/sponge/wet_sponge/break1",
-"sounds/block/sponge/wet_sponge/break2",
-"sounds/block/sponge/wet_sponge/break3",
-"sounds/block/sponge/wet_sponge/break4",
-"sounds/block/sponge/wet_sponge/step1",
-"sounds/block/sponge/wet_sponge/step2",
-"sounds/block/sponge/wet_sponge/step3",
-"sounds/block/sponge/wet_sponge/step4",
-"sounds/block/spore_blossom/break1",
-"sounds/block/spore_blossom/break2",
-"sounds/block/spore_blossom/break3",
-"sounds/block/spore_blossom/break4",
-"sounds/block/spore_blossom/break5",
-"sounds/block/spore_blossom/step1",
-"sounds/block/spore_blossom/step2",
-"sounds/block/spore_blossom/step3",
-"sounds/block/spore_blossom/step4",
-"sounds/block/spore_blossom/step5",
-"sounds/block/spore_blossom/step6",
-"sounds/block/stonecutter/cut1",
-"sounds/block/stonecutter/cut2",
-"sounds/block/suspicious_gravel/break1",
-"sounds/block/suspicious_gravel/break2",
-"sounds/block/suspicious_gravel/break3",
-"sounds/block/suspicious_gravel/break4",
-"sounds/block/suspicious_gravel/break5",
-"sounds/block/suspicious_gravel/break6",
-"sounds/block/suspicious_gravel/place1",
-"sounds/block/suspicious_gravel/place2",
-"sounds/block/suspicious_gravel/place3",
-"sounds/block/suspicious_gravel/place4",
-"sounds/block/suspicious_gravel/step1",
-"sounds/block/suspicious_gravel/step2",
-"sounds/block/suspicious_gravel/step3",
-"sounds/block/suspicious_gravel/step4",
-"sounds/block/suspicious_sand/break1",
-"sounds/block/suspicious_sand/break2",
-"sounds/block/suspicious_sand/break3",
-"sounds/block/suspicious_sand/break4",
-"sounds/block/suspicious_sand/break5",
-"sounds/block/suspicious_sand/break6",
-"sounds/block/suspicious_sand/place1",
-"sounds/block/suspicious_sand/place2",
-"sounds/block/suspicious_sand/place3",
-"sounds/block/suspicious_sand/place4",
-"sounds/block/suspicious_sand/place5",
-"sounds/block/suspicious_sand/step1",
-"sounds/block/suspicious_sand/step2",
-"sounds/block/suspicious_sand/step3",
-"sounds/block/suspicious_sand/step4",
-"sounds/block/suspicious_sand/step5",
-"sounds/block/sweet_berry_bush/berrybush_hurt1",
-"sounds/block/sweet_berry_bush/berrybush_hurt2",
-"sounds/block/sweet_berry_bush/break1",
-"sounds/block/sweet_berry_bush/break2",
-"sounds/block/sweet_berry_bush/break3",
-"sounds/block/sweet_berry_bush/break4",
-"sounds/block/sweet_berry_bush/pick_from_bush1",
-"sounds/block/sweet_berry_bush/pick_from_bush2",
-"sounds/block/sweet_berry_bush/place1",
-"sounds/block/sweet_berry_bush/place2",
-"sounds/block/sweet_berry_bush/place3",
-"sounds/block/sweet_berry_bush/place4",
-"sounds/block/sweet_berry_bush/place5",
-"sounds/block/sweet_berry_bush/place6",
-"sounds/block/trial_spawner/about_to_spawn_item",
-"sounds/block/trial_spawner/ambient1",
-"sounds/block/trial_spawner/ambient2",
-"sounds/block/trial_spawner/ambient3",
-"sounds/block/trial_spawner/ambient4",
-"sounds/block/trial_spawner/ambient5",
-"sounds/block/trial_spawner/ambient_ominous1",
-"sounds/block/trial_spawner/ambient_ominous2",
-"sounds/block/trial_spawner/ambient_ominous3",
-"sounds/block/trial_spawner/ambient_ominous4",
-"sounds/block/trial_spawner/ambient_ominous5",
-"sounds/block/trial_spawner/break1",
-"sounds/block/trial_spawner/break2",
-"sounds/block/trial_spawner/break3",
-"sounds/block/trial_spawner/charge_activate",
-"sounds/block/trial_spawner/close_shutter",
-"sounds/block/trial_spawner/detect_player1",
-"sounds/block/trial_spawner/detect_player2",
-"sounds/block/trial_spawner/detect_player3",
-"sounds/block/trial_spawner/eject_item1",
-"sounds/block/trial_spawner/open_shutter",
-"sounds/block/trial_spawner/place1",
-"sounds/block/trial_spawner/place2",
-"sounds/block/trial_spawner/place3",
-"sounds/block/trial_spawner/spawn1",
-"sounds/block/trial_spawner/spawn2",
-"sounds/block/trial_spawner/spawn3",
-"sounds/block/trial_spawner/spawn4",
-"sounds/block/trial_spawner/spawn_item1",
-"sounds/block/trial_spawner/spawn_item2",
-"sounds/block/trial_spawner/spawn_item3",
-"sounds/block/trial_spawner/spawn_item_begin1",
-"sounds/block/trial_spawner/spawn_item_begin2",
-"sounds/block/trial_spawner/spawn_item_begin3",
-"sounds/block/trial_spawner/step1",
-"sounds/block/trial_spawner/step2",
-"sounds/block/trial_spawner/step3",
-"sounds/block/trial_spawner/step4",
-"sounds/block/trial_spawner/step5",
-"sounds/block/tuff/break1",
-"sounds/block/tuff/break2",
-"sounds/block/tuff/break3",
-"sounds/block/tuff/break4",
-"sounds/block/tuff/step1",
-"sounds/block/tuff/step2",
-"sounds/block/tuff/step3",
-"sounds/block/tuff/step4",
-"sounds/block/tuff/step5",
-"sounds/block/tuff/step6",
-"sounds/block/tuff_bricks/place1",
-"sounds/block/tuff_bricks/place2",
-"sounds/block/tuff_bricks/place3",
-"sounds/block/tuff_bricks/place4",
-"sounds/block/tuff_bricks/place5",
-"sounds/block/tuff_bricks/step1",
-"sounds/block/tuff_bricks/step2",
-"sounds/block/tuff_bricks/step3",
-"sounds/block/tuff_bricks/step4",
-"sounds/block/tuff_bricks/step5",
-"sounds/block/tuff_bricks/step6",
-"sounds/block/turtle_egg/drop_egg1",
-"sounds/block/turtle_egg/drop_egg2",
-"sounds/block/turtle_egg/egg_break1",
-"sounds/block/turtle_egg/egg_break2",
-"sounds/block/turtle_egg/egg_crack1",
-"sounds/block/turtle_egg/egg_crack2",
-"sounds/block/turtle_egg/egg_crack3",
-"sounds/block/turtle_egg/egg_crack4",
-"sounds/block/turtle_egg/egg_crack5",
-"sounds/block/turtle_egg/jump_egg1",
-"sounds/block/turtle_egg/jump_egg2",
-"sounds/block/turtle_egg/jump_egg3",
-"sounds/block/turtle_egg/jump_egg4",
-"sounds/block/vault/activate",
-"sounds/block/vault/ambient1",
-"sounds/block/vault/ambient2",
-"sounds/block/vault/ambient3",
-"sounds/block/vault/break1",
-"sounds/block/vault/break2",
-"sounds/block/vault/break3",
-"sounds/block/vault/break4",
-"sounds/block/vault/deactivate",
-"sounds/block/vault/eject_item1",
-"sounds/block/vault/eject_item2",
-"sounds/block/vault/eject_item3",
-"sounds/block/vault/insert",
-"sounds/block/vault/insert_fail",
-"sounds/block/vault/open_shutter",
-"sounds/block/vault/place1",
-"sounds/block/vault/place2",
-"sounds/block/vault/place3",
-"sounds/block/vault/place4",
-"sounds/block/vault/reject_rewarded_player",
-"sounds/block/vault/step1",
-"sounds/block/vault/step2",
-"sounds/block/vault/step3",
-"sounds/block/vault/step4",
-"sounds/block/vault/step5",
-"sounds/block/vault/step6",
-"sounds/block/vault/step7",
-"sounds/block/vault/step8",
-"sounds/block/vine/break1",
-"sounds/block/vine/break2",
-"sounds/block/vine/break3",
-"sounds/block/vine/break4",
-"sounds/block/web/break1",
-"sounds/block/web/break2",
-"sounds/block/web/break3",
-"sounds/block/web/break4",
-"sounds/block/web/break5",
-"sounds/block/web/break6",
-"sounds/block/web/step1",
-"sounds/block/web/step2",
-"sounds/block/web/step3",
-"sounds/block/web/step4",
-"sounds/block/web/step5",
-"sounds/block/web/step6",
-"sounds/block/wooden_door/close1",
-"sounds/block/wooden_door/close2",
-"sounds/block/wooden_door/close3",
-"sounds/block/wooden_door/open1",
-"sounds/block/wooden_door/open2",
-"sounds/block/wooden_trapdoor/close1",
-"sounds/block/wooden_trapdoor/close2",
-"sounds/block/wooden_trapdoor/close3",
-"sounds/block/wooden_trapdoor/open1",
-"sounds/block/wooden_trapdoor/open2",
-"sounds/block/wooden_trapdoor/open3",
-"sounds/block/wooden_trapdoor/open4",
-"sounds/block/wooden_trapdoor/open5",
-"sounds/bottle/empty1",
-"sounds/bottle/empty2",
-"sounds/bottle/fill1",
-"sounds/bottle/fill2",
-"sounds/bottle/fill3",
-"sounds/bottle/fill4",
-"sounds/bottle/fill_dragonbreath1",
-"sounds/bottle/fill_dragonbreath2",
-"sounds/bubbles/bubble1",
-"sounds/bubbles/bubble2",
-"sounds/bubbles/bubble3",
-"sounds/bubbles/hud_bubble",
-"sounds/bubbles/upwards_ambient1",
-"sounds/bubbles/upwards_ambient2",
-"sounds/bubbles/upwards_ambient3",
-"sounds/bubbles/upwards_ambient4",
-"sounds/bubbles/upwards_ambient5",
-"sounds/bubbles/upwards_inside",
-"sounds/bubbles/whirlpool_ambient1",
-"sounds/bubbles/whirlpool_ambient2",
-"sounds/bubbles/whirlpool_ambient3",
-"sounds/bubbles/whirlpool_ambient4",
-"sounds/bubbles/whirlpool_ambient5",
-"sounds/bubbles/whirlpool_inside",
-"sounds/bucket/empty1",
-"sounds/bucket/empty2",
-"sounds/bucket/empty3",
-"sounds/bucket/empty_fish1",
-"sounds/bucket/empty_fish2",
-"sounds/bucket/empty_fish3",
-"sounds/bucket/empty_lava1",
-"sounds/bucket/empty_lava2",
-"sounds/bucket/empty_lava3",
-"sounds/bucket/empty_powder_snow1",
-"sounds/bucket/empty_powder_snow2",
-"sounds/bucket/fill1",
-"sounds/bucket/fill2",
-"sounds/bucket/fill3",
-"sounds/bucket/fill_fish1",
-"sounds/bucket/fill_fish2",
-"sounds/bucket/fill_fish3",
-"sounds/bucket/fill_lava1",
-"sounds/bucket/fill_lava2",
-"sounds/bucket/fill_lava3",
-"sounds/bucket/fill_powder_snow1",
-"sounds/bucket/fill_powder_snow2",
-"sounds/camera/camera_snap1",
-"sounds/camera/camera_snap2",
-"sounds/camera/camera_snap3",
-"sounds/cave/cave1",
-"sounds/cave/cave10",
-"sounds/cave/cave11",
-"sounds/cave/cave12",
-"sounds/cave/cave13",
-"sounds/cave/cave14",
-"sounds/cave/cave15",
-"sounds/cave/cave16",
-"sounds/cave/cave17",
-"sounds/cave/cave18",
-"sounds/cave/cave19",
-"sounds/cave/cave2",
-"sounds/cave/cave20",
-"sounds/cave/cave21",
-"sounds/cave/cave22",
-"sounds/cave/cave23",
-"sounds/cave/cave3",
-"sounds/cave/cave4",
-"sounds/cave/cave5",
-"sounds/cave/cave6",
-"sounds/cave/cave7",
-"sounds/cave/cave8",
-"sounds/cave/cave9",
-"sounds/component/jump_to_block/jump1",
-"sounds/component/jump_to_block/jump2",
-"sounds/crossbow/loading_end",
-"sounds/crossbow/loading_middle1",
-"sounds/crossbow/loading_middle2",
-"sounds/crossbow/loading_middle3",
-"sounds/crossbow/loading_middle4",
-"sounds/crossbow/loading_start",
-"sounds/crossbow/quick_charge/quick1_1",
-"sounds/crossbow/quick_charge/quick1_2",
-"sounds/crossbow/quick_charge/quick1_3",
-"sounds/crossbow/quick_charge/quick2_1",
-"sounds/crossbow/quick_charge/quick2_2",
-"sounds/crossbow/quick_charge/quick2_3",
-"sounds/crossbow/quick_charge/quick3_1",
-"sounds/crossbow/quick_charge/quick3_2",
-"sounds/crossbow/quick_charge/quick3_3",
-"sounds/crossbow/shoot1",
-"sounds/crossbow/shoot2",
-"sounds/crossbow/shoot3",
-"sounds/damage/fallbig",
-"sounds/damage/fallsmall",
-"sounds/damage/hit1",
-"sounds/damage/hit2",
-"sounds/damage/hit3",
-"sounds/dig/ancient_debris1",
-"sounds/dig/ancient_debris2",
-"sounds/dig/ancient_debris3",
-"sounds/dig/ancient_debris4",
-"sounds/dig/ancient_debris5",
-"sounds/dig/basalt1",
-"sounds/dig/basalt2",
-"sounds/dig/basalt3",
-"sounds/dig/basalt4",
-"sounds/dig/basalt5",
-"sounds/dig/bone_block1",
-"sounds/dig/bone_block2",
-"sounds/dig/bone_block3",
-"sounds/dig/bone_block4",
-"sounds/dig/bone_block5",
-"sounds/dig/chain1",
-"sounds/dig/chain2",
-"sounds/dig/chain3",
-"sounds/dig/chain4",
-"sounds/dig/cloth1",
-"sounds/dig/cloth2",
-"sounds/dig/cloth3",
-"sounds/dig/cloth4",
-"sounds/dig/coral1",
-"sounds/dig/coral2",
-"sounds/dig/coral3",
-"sounds/dig/coral4",
-"sounds/dig/fungus1",
-"sounds/dig/fungus2",
-"sounds/dig/fungus3",
-"sounds/dig/fungus4",
-"sounds/dig/fungus5",
-"sounds/dig/fungus6",
-"sounds/dig/grass1",
-"sounds/dig/grass2",
-"sounds/dig/grass3",
-"sounds/dig/grass4",
-"sounds/dig/gravel1",
-"sounds/dig/gravel2",
-"sounds/dig/gravel3",
-"sounds/dig/gravel4",
-"sounds/dig/honey_block1",
-"sounds/dig/honey_block2",
-"sounds/dig/honey_block3",
-"sounds/dig/honey_block4",
-"sounds/dig/honey_block5",
-"sounds/dig/lodestone1",
-"sounds/dig/lodestone2",
-"sounds/dig/lodestone3",
-"sounds/dig/lodestone4",
-"sounds/dig/nether_brick1",
-"sounds/dig/nether_brick2",
-"sounds/dig/nether_brick3",
-"sounds/dig/nether_brick4",
-"sounds/dig/nether_brick5",
-"sounds/dig/nether_brick6",
-"sounds/dig/nether_gold_ore1",
-"sounds/dig/nether_gold_ore2",
-"sounds/dig/nether_gold_ore3",
-"sounds/dig/nether_gold_ore4",
-"sounds/dig/nether_sprouts1",
-"sounds/dig/nether_sprouts2",
-"sounds/dig/nether_sprouts3",
-"sounds/dig/nether_sprouts4",
-"sounds/dig/nether_wart1",
-"sounds/dig/nether_wart2",
-"sounds/dig/nether_wart3",
-"sounds/dig/nether_wart4",
-"sounds/dig/nether_wart5",
-"sounds/dig/nether_wart6",
-"sounds/dig/netherite1",
-"sounds/dig/netherite2",
-"sounds/dig/netherite3",
-"sounds/dig/netherite4",
-"sounds/dig/netherrack1",
-"sounds/dig/netherrack2",
-"sounds/dig/netherrack3",
-"sounds/dig/netherrack4",
-"sounds/dig/netherrack5",
-"sounds/dig/netherrack6",
-"sounds/dig/nylium1",
-"sounds/dig/nylium2",
-"sounds/dig/nylium3",
-"sounds/dig/nylium4",
-"sounds/dig/nylium5",
-"sounds/dig/nylium6",
-"sounds/dig/roots1",
-"sounds/dig/roots2",
-"sounds/dig/roots3",
-"sounds/dig/roots4",
-"sounds/dig/roots5",
-"sounds/dig/roots6",
-"sounds/dig/sand1",
-"sounds/dig/sand2",
-"sounds/dig/sand3",
-"sounds/dig/sand4",
-"sounds/dig/shroomlight1",
-"sounds/dig/shroomlight2",
-"sounds/dig/shroomlight3",
-"sounds/dig/shroomlight4",
-"sounds/dig/shroomlight5",
-"sounds/dig/snow1",
-"sounds/dig/snow2",
-"sounds/dig/snow3",
-"sounds/dig/snow4",
-"sounds/dig/soul_sand1",
-"sounds/dig/soul_sand2",
-"sounds/dig/soul_sand3",
-"sounds/dig/soul_sand4",
-"sounds/dig/soul_sand5",
-"sounds/dig/soul_sand6",
-"sounds/dig/soul_sand7",
-"sounds/dig/soul_sand8",
-"sounds/dig/soul_sand9",
-"sounds/dig/soul_soil1",
-"sounds/dig/soul_soil2",
-"sounds/dig/soul_soil3",
-"sounds/dig/soul_soil4",
-"sounds/dig/soul_soil5",
-"sounds/dig/soul_soil6",
-"sounds/dig/stem1",
-"sounds/dig/stem2",
-"sounds/dig/stem3",
-"sounds/dig/stem4",
-"sounds/dig/stem5",
-"sounds/dig/stem6",
-"sounds/dig/stone1",
-"sounds/dig/stone2",
-"sounds/dig/stone3",
-"sounds/dig/stone4",
-"sounds/dig/vines1",
-"sounds/dig/vines2",
-"sounds/dig/vines3",
-"sounds/dig/vines4",
-"sounds/dig/vines5",
-"sounds/dig/wood1",
-"sounds/dig/wood2",
-"sounds/dig/wood3",
-"sounds/dig/wood4",
-"sounds/elytra/elytra_loop",
-"sounds/enchant/thorns/hit1",
-"sounds/enchant/thorns/hit2",
-"sounds/enchant/thorns/hit3",
-"sounds/enchant/thorns/hit4",
-"sounds/event/mob_effects/bad_omen",
-"sounds/event/mob_effects/raid_omen",
-"sounds/event/mob_effects/trial_omen",
-"sounds/event/raid/raidhorn_01",
-"sounds/event/raid/raidhorn_02",
-"sounds/event/raid/raidhorn_03",
-"sounds/event/raid/raidhorn_04",
-"sounds/fire/fire",
-"sounds/fire/ignite",
-"sounds/fireworks/blast1",
-"sounds/fireworks/largeBlast1",
-"sounds/fireworks/launch1",
-"sounds/fireworks/twinkle1",
-"sounds/item/axe/scrape1",
-"sounds/item/axe/scrape2",
-"sounds/item/axe/scrape3",
-"sounds/item/axe/strip1",
-"sounds/item/axe/strip2",
-"sounds/item/axe/strip3",
-"sounds/item/axe/strip4",
-"sounds/item/axe/wax_off1",
-"sounds/item/axe/wax_off2",
-"sounds/item/axe/wax_off3",
-"sounds/item/bonemeal/bonemeal1",
-"sounds/item/bonemeal/bonemeal2",
-"sounds/item/bonemeal/bonemeal3",
-"sounds/item/bonemeal/bonemeal4",
-"sounds/item/bonemeal/bonemeal5",
-"sounds/item/book/close_put1",
-"sounds/item/book/close_put2",
-"sounds/item/book/open_flip1",
-"sounds/item/book/open_flip2",
-"sounds/item/book/open_flip3",
-"sounds/item/brush/brushing_generic1",
-"sounds/item/brush/brushing_generic2",
-"sounds/item/brush/brushing_generic3",
-"sounds/item/brush/brushing_generic4",
-"sounds/item/brush/brushing_gravel1",
-"sounds/item/brush/brushing_gravel2",
-"sounds/item/brush/brushing_gravel3",
-"sounds/item/brush/brushing_gravel4",
-"sounds/item/brush/brushing_gravel_complete1",
-"sounds/item/brush/brushing_gravel_complete2",
-"sounds/item/brush/brushing_gravel_complete3",
-"sounds/item/brush/brushing_gravel_complete4",
-"sounds/item/brush/brushing_gravel_complete5",
-"sounds/item/brush/brushing_sand1",
-"sounds/item/brush/brushing_sand2",
-"sounds/item/brush/brushing_sand3",
-"sounds/item/brush/brushing_sand4",
-"sounds/item/brush/brushing_sand_complete1",
-"sounds/item/brush/brushing_sand_complete2",
-"sounds/item/brush/brushing_sand_complete3",
-"sounds/item/brush/brushing_sand_complete4",
-"sounds/item/brush/brushing_sand_complete5",
-"sounds/item/bundle/drop_contents1",
-"sounds/item/bundle/drop_contents2",
-"sounds/item/bundle/drop_contents3",
-"sounds/item/bundle/insert1",
-"sounds/item/bundle/insert2",
-"sounds/item/bundle/insert3",
-"sounds/item/bundle/insert_fail",
-"sounds/item/bundle/remove_one1",
-"sounds/item/bundle/remove_one2",
-"sounds/item/bundle/remove_one3",
-"sounds/item/dye/dye",
-"sounds/item/honeycomb/wax_on1",
-"sounds/item/honeycomb/wax_on2",
-"sounds/item/honeycomb/wax_on3",
-"sounds/item/horn/call0",
-"sounds/item/horn/call1",
-"sounds/item/horn/call2",
-"sounds/item/horn/call3",
-"sounds/item/horn/call4",
-"sounds/item/horn/call5",
-"sounds/item/horn/call6",
-"sounds/item/horn/call7",
-"sounds/item/ink_sac/ink_sac1",
-"sounds/item/ink_sac/ink_sac2",
-"sounds/item/ink_sac/ink_sac3",
-"sounds/item/lock_compass1",
-"sounds/item/lock_compass2",
-"sounds/item/mace/smash_air1",
-"sounds/item/mace/smash_air2",
-"sounds/item/mace/smash_air3",
-"sounds/item/mace/smash_ground1",
-"sounds/item/mace/smash_ground2",
-"sounds/item/mace/smash_ground3",
-"sounds/item/mace/smash_ground4",
-"sounds/item/mace/smash_ground_heavy",
-"sounds/item/ominous_bottle/dispose",
-"sounds/item/shield/block1",
-"sounds/item/shield/block2",
-"sounds/item/shield/block3",
-"sounds/item/shield/block4",
-"sounds/item/shield/block5",
-"sounds/item/spyglass/stop",
-"sounds/item/spyglass/use",
-"sounds/item/trident/ground_impact1",
-"sounds/item/trident/ground_impact2",
-"sounds/item/trident/ground_impact3",
-"sounds/item/trident/ground_impact4",
-"sounds/item/trident/pierce1",
-"sounds/item/trident/pierce2",
-"sounds/item/trident/pierce3",
-"sounds/item/trident/return1",
-"sounds/item/trident/return2",
-"sounds/item/trident/return3",
-"sounds/item/trident/riptide_mono1",
-"sounds/item/trident/riptide_mono2",
-"sounds/item/trident/riptide_mono3",
-"sounds/item/trident/throw1",
-"sounds/item/trident/throw2",
-"sounds/item/trident/thunder1",
-"sounds/item/trident/thunder2",
-"sounds/item/wind_charge/wind_burst1",
-"sounds/item/wind_charge/wind_burst2",
-"sounds/item/wind_charge/wind_burst3",
-"sounds/jump/cloth1",
-"sounds/jump/cloth2",
-"sounds/jump/cloth3",
-"sounds/jump/cloth4",
-"sounds/jump/grass1",
-"sounds/jump/grass2",
-"sounds/jump/grass3",
-"sounds/jump/grass4",
-"sounds/jump/gravel1",
-"sounds/jump/gravel2",
-"sounds/jump/gravel3",
-"sounds/jump/gravel4",
-"sounds/jump/sand1",
-"sounds/jump/sand2",
-"sounds/jump/sand3",
-"sounds/jump/sand4",
-"sounds/jump/snow1",
-"sounds/jump/snow2",
-"sounds/jump/snow3",
-"sounds/jump/snow4",
-"sounds/jump/stone1",
-"sounds/jump/stone2",
-"sounds/jump/stone3",
-"sounds/jump/stone4",
-"sounds/jump/wood1",
-"sounds/jump/wood2",
-"sounds/jump/wood3",
-"sounds/jump/wood4",
-"sounds/lead/break",
-"sounds/leashknot/break1",
-"sounds/leashknot/break2",
-"sounds/leashknot/break3",
-"sounds/leashknot/place1",
-"sounds/leashknot/place2",
-"sounds/leashknot/place3",
-"sounds/liquid/lava",
-"sounds/liquid/lavapop",
-"sounds/liquid/splash",
-"sounds/liquid/splash2",
-"sounds/liquid/water",
-"sounds/minecart/base",
-"sounds/minecart/inside",
-"sounds/mob/allay/death1",
-"sounds/mob/allay/death2",
-"sounds/mob/allay/hurt1",
-"sounds/mob/allay/hurt2",
-"sounds/mob/allay/idle_with_item1",
-"sounds/mob/allay/idle_with_item2",
-"sounds/mob/allay/idle_with_item3",
-"sounds/mob/allay/idle_with_item4",
-"sounds/mob/allay/idle_without_item1",
-"sounds/mob/allay/idle_without_item2",
-"sounds/mob/allay/idle_without_item3",
-"sounds/mob/allay/idle_without_item4",
-"sounds/mob/allay/item_given1",
-"sounds/mob/allay/item_given2",
-"sounds/mob/allay/item_given3",
-"sounds/mob/allay/item_given4",
-"sounds/mob/allay/item_taken1",
-"sounds/mob/allay/item_taken2",
-"sounds/mob/allay/item_taken3",
-"sounds/mob/allay/item_taken4",
-"sounds/mob/allay/throw",
-"sounds/mob/armadillo/ambient1",
-"sounds/mob/armadillo/ambient2",
-"sounds/mob/armadillo/ambient3",
-"sounds/mob/armadillo/ambient4",
-"sounds/mob/armadillo/ambient5",
-"sounds/mob/armadillo/ambient6",
-"sounds/mob/armadillo/ambient7",
-"sounds/mob/armadillo/ambient8",
-"sounds/mob/armadillo/brush_armadillo1",
-"sounds/mob/armadillo/brush_armadillo2",
-"sounds/mob/armadillo/death1",
-"sounds/mob/armadillo/death2",
-"sounds/mob/armadillo/death3",
-"sounds/mob/armadillo/death4",
-"sounds/mob/armadillo/eat1",
-"sounds/mob/armadillo/eat2",
-"sounds/mob/armadillo/eat3",
-"sounds/mob/armadillo/hurt1",
-"sounds/mob/armadillo/hurt2",
-"sounds/mob/armadillo/hurt3",
-"sounds/mob/armadillo/hurt4",
-"sounds/mob/armadillo/hurt5",
-"sounds/mob/armadillo/hurt_reduced1",
-"sounds/mob/armadillo/hurt_reduced2",
-"sounds/mob/armadillo/hurt_reduced3",
-"sounds/mob/armadillo/hurt_reduced4",
-"sounds/mob/armadillo/land1",
-"sounds/mob/armadillo/land2",
-"sounds/mob/armadillo/land3",
-"sounds/mob/armadillo/land4",
-"sounds/mob/armadillo/peek",
-"sounds/mob/armadillo/roll1",
-"sounds/mob/armadillo/roll2",
-"sounds/mob/armadillo/roll3",
-"sounds/mob/armadillo/roll4",
-"sounds/mob/armadillo/scute_drop1",
-"sounds/mob/armadillo/scute_drop2",
-"sounds/mob/armadillo/step1",
-"sounds/mob/armadillo/step2",
-"sounds/mob/armadillo/step3",
-"sounds/mob/armadillo/step4",
-"sounds/mob/armadillo/step5",
-"sounds/mob/armadillo/unroll_finish1",
-"sounds/mob/armadillo/unroll_finish2",
-"sounds/mob/armadillo/unroll_start",
-"sounds/mob/armor_stand/break1",
-"sounds/mob/armor_stand/break2",
-"sounds/mob/armor_stand/break3",
-"sounds/mob/armor_stand/break4",
-"sounds/mob/armor_stand/hit1",
-"sounds/mob/armor_stand/hit2",
-"sounds/mob/armor_stand/hit3",
-"sounds/mob/armor_stand/hit4",
-"sounds/mob/axolotl/attack1",
-"sounds/mob/axolotl/attack2",
-"sounds/mob/axolotl/attack3",
-"sounds/mob/axolotl/attack4",
-"sounds/mob/axolotl/death1",
-"sounds/mob/axolotl/death2",
-"sounds/mob/axolotl/hurt1",
-"sounds/mob/axolotl/hurt2",
-"sounds/mob/axolotl/hurt3",
-"sounds/mob/axolotl/hurt4",
-"sounds/mob/axolotl/idle1",
-"sounds/mob/axolotl/idle2",
-"sounds/mob/axolotl/idle3",
-"sounds/mob/axolotl/idle4",
-"sounds/mob/axolotl/idle5",
-"sounds/mob/axolotl/idle_air1",
-"sounds/mob/axolotl/idle_air2",
-"sounds/mob/axolotl/idle_air3",
-"sounds/mob/axolotl/idle_air4",
-"sounds/mob/axolotl/idle_air5",
-"sounds/mob/axolotl/splash1",
-"sounds/mob/axolotl/splash2",
-"sounds/mob/axolotl/splash3",
-"sounds/mob/axolotl/swim1",
-"sounds/mob/axolotl/swim2",
-"sounds/mob/axolotl/swim3",
-"sounds/mob/axolotl/swim4",
-"sounds/mob/axolotl/swim5",
-"sounds/mob/axolotl/swim6",
-"sounds/mob/axolotl/swim7",
-"sounds/mob/bat/death",
-"sounds/mob/bat/hurt1",
-"sounds/mob/bat/hurt2",
-"sounds/mob/bat/hurt3",
-"sounds/mob/bat/hurt4",
-"sounds/mob/bat/idle1",
-"sounds/mob/bat/idle2",
-"sounds/mob/bat/idle3",
-"sounds/mob/bat/idle4",
-"sounds/mob/bat/takeoff",
-"sounds/mob/bee/aggressive1",
-"sounds/mob/bee/aggressive2",
-"sounds/mob/bee/aggressive3",
-"sounds/mob/bee/death1",
-"sounds/mob/bee/death2",
-"sounds/mob/bee/hurt1",
-"sounds/mob/bee/hurt2",
-"sounds/mob/bee/hurt3",
-"sounds/mob/bee/loop1",
-"sounds/mob/bee/loop2",
-"sounds/mob/bee/loop3",
-"sounds/mob/bee/loop4",
-"sounds/mob/bee/loop5",
-"sounds/mob/bee/pollinate1",
-"sounds/mob/bee/pollinate2",
-"sounds/mob/bee/pollinate3",
-"sounds/mob/bee/pollinate4",
-"sounds/mob/bee/sting",
-"sounds/mob/blaze/breathe1",
-"sounds/mob/blaze/breathe2",
-"sounds/mob/blaze/breathe3",
-"sounds/mob/blaze/breathe4",
-"sounds/mob/blaze/death",
-"sounds/mob/blaze/hit1",
-"sounds/mob/blaze/hit2",
-"sounds/mob/blaze/hit3",
-"sounds/mob/blaze/hit4",
-"sounds/mob/bogged/ambient1",
-"sounds/mob/bogged/ambient2",
-"sounds/mob/bogged/ambient3",
-"sounds/mob/bogged/ambient4",
-"sounds/mob/bogged/death",
-"sounds/mob/bogged/hurt1",
-"sounds/mob/bogged/hurt2",
-"sounds/mob/bogged/hurt3",
-"sounds/mob/bogged/hurt4",
-"sounds/mob/bogged/step1",
-"sounds/mob/bogged/step2",
-"sounds/mob/bogged/step3",
-"sounds/mob/bogged/step4",
-"sounds/mob/breeze/charge1",
-"sounds/mob/breeze/charge2",
-"sounds/mob/breeze/charge3",
-"sounds/mob/breeze/death1",
-"sounds/mob/breeze/death2",
-"sounds/mob/breeze/deflect1",
-"sounds/mob/breeze/deflect2",
-"sounds/mob/breeze/deflect3",
-"sounds/mob/breeze/hurt1",
-"sounds/mob/breeze/hurt2",
-"sounds/mob/breeze/hurt3",
-"sounds/mob/breeze/idle1",
-"sounds/mob/breeze/idle2",
-"sounds/mob/breeze/idle3",
-"sounds/mob/breeze/idle4",
-"sounds/mob/breeze/idle_air1",
-"sounds/mob/breeze/idle_air2",
-"sounds/mob/breeze/idle_air3",
-"sounds/mob/breeze/idle_air4",
-"sounds/mob/breeze/inhale1",
-"sounds/mob/breeze/inhale2",
-"sounds/mob/breeze/jump1",
-"sounds/mob/breeze/jump2",
-"sounds/mob/breeze/land1",
-"sounds/mob/breeze/land2",
-"sounds/mob/breeze/shoot",
-"sounds/mob/breeze/slide1",
-"sounds/mob/breeze/slide2",
-"sounds/mob/breeze/slide3",
-"sounds/mob/breeze/slide4",
-"sounds/mob/breeze/whirl1",
-"sounds/mob/breeze/whirl2",
-"sounds/mob/breeze/whirl3",
-"sounds/mob/breeze/whirl4",
-"sounds/mob/breeze/whirl5",
-"sounds/mob/breeze/wind_burst1",
-"sounds/mob/breeze/wind_burst2",
-"sounds/mob/breeze/wind_burst3",
-"sounds/mob/camel/ambient1",
-"sounds/mob/camel/ambient2",
-"sounds/mob/camel/ambient3",
-"sounds/mob/camel/ambient4",
-"sounds/mob/camel/ambient5",
-"sounds/mob/camel/ambient6",
-"sounds/mob/camel/ambient7",
-"sounds/mob/camel/ambient8",
-"sounds/mob/camel/dash1",
-"sounds/mob/camel/dash2",
-"sounds/mob/camel/dash3",
-"sounds/mob/camel/dash4",
-"sounds/mob/camel/dash5",
-"sounds/mob/camel/dash6",
-"sounds/mob/camel/dash_ready1",
-"sounds/mob/camel/death1",
-"sounds/mob/camel/death2",
-"sounds/mob/camel/eat1",
-"sounds/mob/camel/eat2",
-"sounds/mob/camel/eat3",
-"sounds/mob/camel/eat4",
-"sounds/mob/camel/eat5",
-"sounds/mob/camel/hurt1",
-"sounds/mob/camel/hurt2",
-"sounds/mob/camel/hurt3",
-"sounds/mob/camel/hurt4",
-"sounds/mob/camel/sit1",
-"sounds/mob/camel/sit2",
-"sounds/mob/camel/sit3",
-"sounds/mob/camel/sit4",
-"sounds/mob/camel/stand1",
-"sounds/mob/camel/stand2",
-"sounds/mob/camel/stand3",
-"sounds/mob/camel/stand4",
-"sounds/mob/camel/stand5",
-"sounds/mob/camel/step1",
-"sounds/mob/camel/step2",
-"sounds/mob/camel/step3",
-"sounds/mob/camel/step4",
-"sounds/mob/camel/step5",
-"sounds/mob/camel/step6",
-"sounds/mob/camel/step_sand1",
-"sounds/mob/camel/step_sand2",
-"sounds/mob/camel/step_sand3",
-"sounds/mob/camel/step_sand4",
-"sounds/mob/camel/step_sand5",
-"sounds/mob/camel/step_sand6",
-"sounds/mob/cat/beg1",
-"sounds/mob/cat/beg2",
-"sounds/mob/cat/beg3",
-"sounds/mob/cat/eat1",
-"sounds/mob/cat/eat2",
-"sounds/mob/cat/hiss1",
-"sounds/mob/cat/hiss2",
-"sounds/mob/cat/hiss3",
-"sounds/mob/cat/hitt1",
-"sounds/mob/cat/hitt2",
-"sounds/mob/cat/hitt3",
-"sounds/mob/cat/meow1",
-"sounds/mob/cat/meow2",
-"sounds/mob/cat/meow3",
-"sounds/mob/cat/meow4",
-"sounds/mob/cat/ocelot/death1",
-"sounds/mob/cat/ocelot/death2",
-"sounds/mob/cat/ocelot/death3",
-"sounds/mob/cat/ocelot/idle1",
-"sounds/mob/cat/ocelot/idle2",
-"sounds/mob/cat/ocelot/idle3",
-"sounds/mob/cat/ocelot/idle4",
-"sounds/mob/cat/purr1",
-"sounds/mob/cat/purr2",
-"sounds/mob/cat/purr3",
-"sounds/mob/cat/purreow1",
-"sounds/mob/cat/purreow2",
-"sounds/mob/cat/stray/idle1",
-"sounds/mob/cat/stray/idle2",
-"sounds/mob/cat/stray/idle3",
-"sounds/mob/cat/stray/idle4",
-"sounds/mob/chicken/hurt1",
-"sounds/mob/chicken/hurt2",
-"sounds/mob/chicken/plop",
-"sounds/mob/chicken/say1",
-"sounds/mob/chicken/say2",
-"sounds/mob/chicken/say3",
-"sounds/mob/chicken/step1",
-"sounds/mob/chicken/step2",
-"sounds/mob/copper_golem/chest_interaction/put_item",
-"sounds/mob/copper_golem/chest_interaction/put_item_fail",
-"sounds/mob/copper_golem/chest_interaction/take_item",
-"sounds/mob/copper_golem/chest_interaction/take_item_fail",
-"sounds/mob/copper_golem/oxidized/death",
-"sounds/mob/copper_golem/oxidized/hurt1",
-"sounds/mob/copper_golem/oxidized/hurt2",
-"sounds/mob/copper_golem/oxidized/hurt3",
-"sounds/mob/copper_golem/oxidized/hurt4",
-"sounds/mob/copper_golem/oxidized/spin1",
-"sounds/mob/copper_golem/oxidized/spin2",
-"sounds/mob/copper_golem/oxidized/spin3",
-"sounds/mob/copper_golem/oxidized/spin4",
-"sounds/mob/copper_golem/oxidized/spin5",
-"sounds/mob/copper_golem/oxidized/spin6",
-"sounds/mob/copper_golem/oxidized/spin7",
-"sounds/mob/copper_golem/oxidized/step1",
-"sounds/mob/copper_golem/oxidized/step2",
-"sounds/mob/copper_golem/oxidized/step3",
-"sounds/mob/copper_golem/oxidized/step4",
-"sounds/mob/copper_golem/oxidized/step5",
-"sounds/mob/copper_golem/oxidized/step6",
-"sounds/mob/copper_golem/oxidized/step7",
-"sounds/mob/copper_golem/oxidized/step8",
-"sounds/mob/copper_golem/oxidized/step9",
-"sounds/mob/copper_golem/regular/become_statue1",
-"sounds/mob/copper_golem/regular/become_statue2",
-"sounds/mob/copper_golem/regular/become_statue3",
-"sounds/mob/copper_golem/regular/become_statue4",
-"sounds/mob/copper_golem/regular/death",
-"sounds/mob/copper_golem/regular/hurt1",
-"sounds/mob/copper_golem/regular/hurt2",
-"sounds/mob/copper_golem/regular/hurt3",
-"sounds/mob/copper_golem/regular/hurt4",
-"sounds/mob/copper_golem/regular/spawn",
-"sounds/mob/copper_golem/regular/spin1",
-"sounds/mob/copper_golem/regular/spin2",
-"sounds/mob/copper_golem/regular/spin3",
-"sounds/mob/copper_golem/regular/spin4",
-"sounds/mob/copper_golem/regular/spin5",
-"sounds/mob/copper_golem/regular/spin6",
-"sounds/mob/copper_golem/regular/spin7",
-"sounds/mob/copper_golem/regular/step1",
-"sounds/mob/copper_golem/regular/step2",
-"sounds/mob/copper_golem/regular/step3",
-"sounds/mob/copper_golem/regular/step4",
-"sounds/mob/copper_golem/regular/step5",
-"sounds/mob/copper_golem/regular/step6",
-"sounds/mob/copper_golem/regular/step7",
-"sounds/mob/copper_golem/regular/step8",
-"sounds/mob/copper_golem/regular/step9",
-"sounds/mob/copper_golem/weathered/death",
-"sounds/mob/copper_golem/weathered/hurt1",
-"sounds/mob/copper_golem/weathered/hurt2",
-"sounds/mob/copper_golem/weathered/hurt3",
-"sounds/mob/copper_golem/weathered/hurt4",
-"sounds/mob/copper_golem/weathered/spin1",
-"sounds/mob/copper_golem/weathered/spin2",
-"sounds/mob/copper_golem/weathered/spin3",
-"sounds/mob/copper_golem/weathered/spin4",
-"sounds/mob/copper_golem/weathered/spin5",
-"sounds/mob/copper_golem/weathered/spin6",
-"sounds/mob/copper_golem/weathered/spin7",
-"sounds/mob/copper_golem/weathered/step1",
-"sounds/mob/copper_golem/weathered/step2",
-"sounds/mob/copper_golem/weathered/step3",
-"sounds/mob/copper_golem/weathered/step4",
-"sounds/mob/copper_golem/weathered/step5",
-"sounds/mob/copper_golem/weathered/step6",
-"sounds/mob/copper_golem/weathered/step7",
-"sounds/mob/copper_golem/weathered/step8",
-"sounds/mob/copper_golem/weathered/step9",
-"sounds/mob/cow/hurt1",
-"sounds/mob/cow/hurt2",
-"sounds/mob/cow/hurt3",
-"sounds/mob/cow/milk1",
-"sounds/mob/cow/milk2",
-"sounds/mob/cow/milk3",
-"sounds/mob/cow/say1",
-"sounds/mob/cow/say2",
-"sounds/mob/cow/say3",
-"sounds/mob/cow/say4",
-"sounds/mob/cow/step1",
-"sounds/mob/cow/step2",
-"sounds/mob/cow/step3",
-"sounds/mob/cow/step4",
-"sounds/mob/creaking/activate",
-"sounds/mob/creaking/attack1",
-"sounds/mob/creaking/attack2",
-"sounds/mob/creaking/attack3",
-"sounds/mob/creaking/attack4",
-"sounds/mob/creaking/deactivate",
-"sounds/mob/creaking/death",
-"sounds/mob/creaking/freeze1",
-"sounds/mob/creaking/freeze2",
-"sounds/mob/creaking/freeze3",
-"sounds/mob/creaking/freeze4",
-"sounds/mob/creaking/idle1",
-"sounds/mob/creaking/idle2",
-"sounds/mob/creaking/idle3",
-"sounds/mob/creaking/idle4",
-"sounds/mob/creaking/idle5",
-"sounds/mob/creaking/idle6",
-"sounds/mob/creaking/spawn",
-"sounds/mob/creaking/step1",
-"sounds/mob/creaking/step2",
-"sounds/mob/creaking/step3",
-"sounds/mob/creaking/step4",
-"sounds/mob/creaking/step5",
-"sounds/mob/creaking/sway1",
-"sounds/mob/creaking/sway2",
-"sounds/mob/creaking/sway3",
-"sounds/mob/creaking/sway4",
-"sounds/mob/creaking/twitch",
-"sounds/mob/creaking/unfreeze1",
-"sounds/mob/creaking/unfreeze2",
-"sounds/mob/creaking/unfreeze3",
-"sounds/mob/creeper/death",
-"sounds/mob/creeper/say1",
-"sounds/mob/creeper/say2",
-"sounds/mob/creeper/say3",
-"sounds/mob/creeper/say4",
-"sounds/mob/dolphin/attack1",
-"sounds/mob/dolphin/attack2",
-"sounds/mob/dolphin/attack3",
-"sounds/mob/dolphin/blowhole1",
-"sounds/mob/dolphin/blowhole2",
-"sounds/mob/dolphin/death1",
-"sounds/mob/dolphin/death2",
-"sounds/mob/dolphin/eat1",
-"sounds/mob/dolphin/eat2",
-"sounds/mob/dolphin/eat3",
-"sounds/mob/dolphin/hurt1",
-"sounds/mob/dolphin/hurt2",
-"sounds/mob/dolphin/hurt3",
-"sounds/mob/dolphin/idle2",
-"sounds/mob/dolphin/idle3",
-"sounds/mob/dolphin/idle4",
-"sounds/mob/dolphin/idle5",
-"sounds/mob/dolphin/idle6",
-"sounds/mob/dolphin/jump1",
-"sounds/mob/dolphin/jump2",
-"sounds/mob/dolphin/jump3",
-"sounds/mob/dolphin/play1",
-"sounds/mob/dolphin/play2",
-"sounds/mob/dolphin/splash1",
-"sounds/mob/dolphin/splash2",
-"sounds/mob/dolphin/splash3",
-"sounds/mob/dolphin/swim1",
-"sounds/mob/dolphin/swim2",
-"sounds/mob/dolphin/swim3",
-"sounds/mob/dolphin/swim4",
-"sounds/mob/dolphin/water/idle1",
-"sounds/mob/dolphin/water/idle10",
-"sounds/mob/dolphin/water/idle2",
-"sounds/mob/dolphin/water/idle3",
-"sounds/mob/dolphin/water/idle4",
-"sounds/mob/dolphin/water/idle5",
-"sounds/mob/dolphin/water/idle6",
-"sounds/mob/dolphin/water/idle7",
-"sounds/mob/dolphin/water/idle8",
-"sounds/mob/dolphin/water/idle9",
-"sounds/mob/drowned/convert1",
-"sounds/mob/drowned/convert2",
-"sounds/mob/drowned/convert3",
-"sounds/mob/drowned/death1",
-"sounds/mob/drowned/death2",
-"sounds/mob/drowned/hurt1",
-"sounds/mob/drowned/hurt2",
-"sounds/mob/drowned/hurt3",
-"sounds/mob/drowned/idle1",
-"sounds/mob/drowned/idle2",
-"sounds/mob/drowned/idle3",
-"sounds/mob/drowned/idle4",
-"sounds/mob/drowned/idle5",
-"sounds/mob/drowned/step1",
-"sounds/mob/drowned/step2",
-"sounds/mob/drowned/step3",
-"sounds/mob/drowned/step4",
-"sounds/mob/drowned/step5",
-"sounds/mob/drowned/water/death1",
-"sounds/mob/drowned/water/death2",
-"sounds/mob/drowned/water/hurt1",
-"sounds/mob/drowned/water/hurt2",
-"sounds/mob/drowned/water/hurt3",
-"sounds/mob/drowned/water/idle1",
-"sounds/mob/drowned/water/idle2",
-"sounds/mob/drowned/water/idle3",
-"sounds/mob/drowned/water/idle4",
-"sounds/mob/enderdragon/end",
-"sounds/mob/enderdragon/growl1",
-"sounds/mob/enderdragon/growl2",
-"sounds/mob/enderdragon/growl3",
-"sounds/mob/enderdragon/growl4",
-"sounds/mob/enderdragon/hit1",
-"sounds/mob/enderdragon/hit2",
-"sounds/mob/enderdragon/hit3",
-"sounds/mob/enderdragon/hit4",
-"sounds/mob/enderdragon/wings1",
-"sounds/mob/enderdragon/wings2",
-"sounds/mob/enderdragon/wings3",
-"sounds/mob/enderdragon/wings4",
-"sounds/mob/enderdragon/wings5",
-"sounds/mob/enderdragon/wings6",
-"sounds/mob/endermen/death",
-"sounds/mob/endermen/hit1",
-"sounds/mob/endermen/hit2",
-"sounds/mob/endermen/hit3",
-"sounds/mob/endermen/hit4",
-"sounds/mob/endermen/idle1",
-"sounds/mob/endermen/idle2",
-"sounds/mob/endermen/idle3",
-"sounds/mob/endermen/idle4",
-"sounds/mob/endermen/idle5",
-"sounds/mob/endermen/portal",
-"sounds/mob/endermen/portal2",
-"sounds/mob/endermen/scream1",
-"sounds/mob/endermen/scream2",
-"sounds/mob/endermen/scream3",
-"sounds/mob/endermen/scream4",
-"sounds/mob/endermen/stare",
-"sounds/mob/evocation_illager/cast1",
-"sounds/mob/evocation_illager/cast2",
-"sounds/mob/evocation_illager/celebrate",
-"sounds/mob/evocation_illager/death1",
-"sounds/mob/evocation_illager/death2",
-"sounds/mob/evocation_illager/fangs",
-"sounds/mob/evocation_illager/hurt1",
-"sounds/mob/evocation_illager/hurt2",
-"sounds/mob/evocation_illager/idle1",
-"sounds/mob/evocation_illager/idle2",
-"sounds/mob/evocation_illager/idle3",
-"sounds/mob/evocation_illager/idle4",
-"sounds/mob/evocation_illager/prepare_attack1",
-"sounds/mob/evocation_illager/prepare_attack2",
-"sounds/mob/evocation_illager/prepare_summon",
-"sounds/mob/evocation_illager/prepare_wololo",
-"sounds/mob/fish/flop1",
-"sounds/mob/fish/flop2",
-"sounds/mob/fish/flop3",
-"sounds/mob/fish/flop4",
-"sounds/mob/fish/hurt1",
-"sounds/mob/fish/hurt2",
-"sounds/mob/fish/hurt3",
-"sounds/mob/fish/hurt4",
-"sounds/mob/fish/swim1",
-"sounds/mob/fish/swim2",
-"sounds/mob/fish/swim3",
-"sounds/mob/fish/swim4",
-"sounds/mob/fish/swim5",
-"sounds/mob/fish/swim6",
-"sounds/mob/fish/swim7",
-"sounds/mob/fox/aggro1",
-"sounds/mob/fox/aggro2",
-"sounds/mob/fox/aggro3",
-"sounds/mob/fox/aggro4",
-"sounds/mob/fox/aggro5",
-"sounds/mob/fox/aggro6",
-"sounds/mob/fox/aggro7",
-"sounds/mob/fox/bite1",
-"sounds/mob/fox/bite2",
-"sounds/mob/fox/bite3",
-"sounds/mob/fox/death1",
-"sounds/mob/fox/death2",
-"sounds/mob/fox/eat1",
-"sounds/mob/fox/eat2",
-"sounds/mob/fox/eat3",
-"sounds/mob/fox/hurt1",
-"sounds/mob/fox/hurt2",
-"sounds/mob/fox/hurt3",
-"sounds/mob/fox/hurt4",
-"sounds/mob/fox/idle1",
-"sounds/mob/fox/idle2",
-"sounds/mob/fox/idle3",
-"sounds/mob/fox/idle4",
-"sounds/mob/fox/idle5",
-"sounds/mob/fox/idle6",
-"sounds/mob/fox/screech1",
-"sounds/mob/fox/screech2",
-"sounds/mob/fox/screech3",
-"sounds/mob/fox/screech4",
-"sounds/mob/fox/sleep1",
-"sounds/mob/fox/sleep2",
-"sounds/mob/fox/sleep3",
-"sounds/mob/fox/sleep4",
-"sounds/mob/fox/sleep5",
-"sounds/mob/fox/sniff1",
-"sounds/mob/fox/sniff2",
-"sounds/mob/fox/sniff3",
-"sounds/mob/fox/sniff4",
-"sounds/mob/fox/spit1",
-"sounds/mob/fox/spit2",
-"sounds/mob/fox/spit3",
-"sounds/mob/frog/death1",
-"sounds/mob/frog/death2",
-"sounds/mob/frog/death3",
-"sounds/mob/frog/eat1",
-"sounds/mob/frog/eat2",
-"sounds/mob/frog/eat3",
-"sounds/mob/frog/eat4",
-"sounds/mob/frog/hurt1",
-"sounds/mob/frog/hurt2",
-"sounds/mob/frog/hurt3",
-"sounds/mob/frog/hurt4",
-"sounds/mob/frog/hurt5",
-"sounds/mob/frog/idle1",
-"sounds/mob/frog/idle2",
-"sounds/mob/frog/idle3",
-"sounds/mob/frog/idle4",
-"sounds/mob/frog/idle5",
-"sounds/mob/frog/idle6",
-"sounds/mob/frog/idle7",
-"sounds/mob/frog/idle8",
-"sounds/mob/frog/lay_spawn1",
-"sounds/mob/frog/lay_spawn2",
-"sounds/mob/frog/long_jump1",
-"sounds/mob/frog/long_jump2",
-"sounds/mob/frog/long_jump3",
-"sounds/mob/frog/long_jump4",
-"sounds/mob/frog/step1",
-"sounds/mob/frog/step2",
-"sounds/mob/frog/step3",
-"sounds/mob/frog/step4",
-"sounds/mob/frog/tongue1",
-"sounds/mob/frog/tongue2",
-"sounds/mob/frog/tongue3",
-"sounds/mob/frog/tongue4",
-"sounds/mob/ghast/affectionate_scream",
-"sounds/mob/ghast/charge",
-"sounds/mob/ghast/death",
-"sounds/mob/ghast/fireball4",
-"sounds/mob/ghast/moan1",
-"sounds/mob/ghast/moan2",
-"sounds/mob/ghast/moan3",
-"sounds/mob/ghast/moan4",
-"sounds/mob/ghast/moan5",
-"sounds/mob/ghast/moan6",
-"sounds/mob/ghast/moan7",
-"sounds/mob/ghast/scream1",
-"sounds/mob/ghast/scream2",
-"sounds/mob/ghast/scream3",
-"sounds/mob/ghast/scream4",
-"sounds/mob/ghast/scream5",
-"sounds/mob/ghastling/ambient1",
-"sounds/mob/ghastling/ambient2",
-"sounds/mob/ghastling/ambient3",
-"sounds/mob/ghastling/ambient4",
-"sounds/mob/ghastling/ambient5",
-"sounds/mob/ghastling/ambient6",
-"sounds/mob/ghastling/ambient7",
-"sounds/mob/ghastling/death",
-"sounds/mob/ghastling/hurt1",
-"sounds/mob/ghastling/hurt2",
-"sounds/mob/ghastling/hurt3",
-"sounds/mob/ghastling/hurt4",
-"sounds/mob/ghastling/hurt5",
-"sounds/mob/ghastling/spawn",
-"sounds/mob/glow_squid/ambient1",
-"sounds/mob/glow_squid/ambient2",
-"sounds/mob/glow_squid/ambient3",
-"sounds/mob/glow_squid/ambient4",
-"sounds/mob/glow_squid/ambient5",
-"sounds/mob/glow_squid/death1",
-"sounds/mob/glow_squid/death2",
-"sounds/mob/glow_squid/death3",
-"sounds/mob/glow_squid/hurt1",
-"sounds/mob/glow_squid/hurt2",
-"sounds/mob/glow_squid/hurt3",
-"sounds/mob/glow_squid/hurt4",
-"sounds/mob/glow_squid/squirt1",
-"sounds/mob/glow_squid/squirt2",
-"sounds/mob/glow_squid/squirt3",
-"sounds/mob/goat/death1",
-"sounds/mob/goat/death2",
-"sounds/mob/goat/death3",
-"sounds/mob/goat/death4",
-"sounds/mob/goat/death5",
-"sounds/mob/goat/eat1",
-"sounds/mob/goat/eat2",
-"sounds/mob/goat/eat3",
-"sounds/mob/goat/horn_break1",
-"sounds/mob/goat/horn_break2",
-"sounds/mob/goat/horn_break3",
-"sounds/mob/goat/horn_break4",
-"sounds/mob/goat/hurt1",
-"sounds/mob/goat/hurt2",
-"sounds/mob/goat/hurt3",
-"sounds/mob/goat/hurt4",
-"sounds/mob/goat/idle1",
-"sounds/mob/goat/idle2",
-"sounds/mob/goat/idle3",
-"sounds/mob/goat/idle4",
-"sounds/mob/goat/idle5",
-"sounds/mob/goat/idle6",
-"sounds/mob/goat/idle7",
-"sounds/mob/goat/idle8",
-"sounds/mob/goat/impact1",
-"sounds/mob/goat/impact2",
-"sounds/mob/goat/impact3",
-"sounds/mob/goat/pre_ram1",
-"sounds/mob/goat/pre_ram2",
-"sounds/mob/goat/pre_ram3",
-"sounds/mob/goat/pre_ram4",
-"sounds/mob/goat/scream1",
-"sounds/mob/goat/scream2",
-"sounds/mob/goat/scream3",
-"sounds/mob/goat/scream4",
-"sounds/mob/goat/scream5",
-"sounds/mob/goat/scream6",
-"sounds/mob/goat/scream7",
-"sounds/mob/goat/scream8",
-"sounds/mob/goat/scream9",
-"sounds/mob/goat/screaming_death1",
-"sounds/mob/goat/screaming_death2",
-"sounds/mob/goat/screaming_death3",
-"sounds/mob/goat/screaming_hurt1",
-"sounds/mob/goat/screaming_hurt2",
-"sounds/mob/goat/screaming_hurt3",
-"sounds/mob/goat/screaming_milk1",
-"sounds/mob/goat/screaming_milk2",
-"sounds/mob/goat/screaming_milk3",
-"sounds/mob/goat/screaming_milk4",
-"sounds/mob/goat/screaming_milk5",
-"sounds/mob/goat/screaming_pre_ram1",
-"sounds/mob/goat/screaming_pre_ram2",
-"sounds/mob/goat/screaming_pre_ram3",
-"sounds/mob/goat/screaming_pre_ram4",
-"sounds/mob/goat/screaming_pre_ram5",
-"sounds/mob/goat/step1",
-"sounds/mob/goat/step2",
-"sounds/mob/goat/step3",
-"sounds/mob/goat/step4",
-"sounds/mob/goat/step5",
-"sounds/mob/goat/step6",
-"sounds/mob/guardian/ambient1",
-"sounds/mob/guardian/ambient2",
-"sounds/mob/guardian/ambient3",
-"sounds/mob/guardian/ambient4",
-"sounds/mob/guardian/attack_loop",
-"sounds/mob/guardian/curse",
-"sounds/mob/guardian/elder_death",
-"sounds/mob/guardian/elder_hit1",
-"sounds/mob/guardian/elder_hit2",
-"sounds/mob/guardian/elder_hit3",
-"sounds/mob/guardian/elder_hit4",
-"sounds/mob/guardian/elder_idle1",
-"sounds/mob/guardian/elder_idle2",
-"sounds/mob/guardian/elder_idle3",
-"sounds/mob/guardian/elder_idle4",
-"sounds/mob/guardian/flop1",
-"sounds/mob/guardian/flop2",
-"sounds/mob/guardian/flop3",
-"sounds/mob/guardian/flop4",
-"sounds/mob/guardian/guardian_death",
-"sounds/mob/guardian/guardian_hit1",
-"sounds/mob/guardian/guardian_hit2",
-"sounds/mob/guardian/guardian_hit3",
-"sounds/mob/guardian/guardian_hit4",
-"sounds/mob/guardian/land_death",
-"sounds/mob/guardian/land_hit1",
-"sounds/mob/guardian/land_hit2",
-"sounds/mob/guardian/land_hit3",
-"sounds/mob/guardian/land_hit4",
-"sounds/mob/guardian/land_idle1",
-"sounds/mob/guardian/land_idle2",
-"sounds/mob/guardian/land_idle3",
-"sounds/mob/guardian/land_idle4",
-"sounds/mob/happy_ghast/ambient1",
-"sounds/mob/happy_ghast/ambient10",
-"sounds/mob/happy_ghast/ambient11",
-"sounds/mob/happy_ghast/ambient12",
-"sounds/mob/happy_ghast/ambient13",
-"sounds/mob/happy_ghast/ambient14",
-"sounds/mob/happy_ghast/ambient2",
-"sounds/mob/happy_ghast/ambient3",
-"sounds/mob/happy_ghast/ambient4",
-"sounds/mob/happy_ghast/ambient5",
-"sounds/mob/happy_ghast/ambient6",
-"sounds/mob/happy_ghast/ambient7",
-"sounds/mob/happy_ghast/ambient8",
-"sounds/mob/happy_ghast/ambient9",
-"sounds/mob/happy_ghast/death",
-"sounds/mob/happy_ghast/ghast_ride",
-"sounds/mob/happy_ghast/goggles_down",
-"sounds/mob/happy_ghast/goggles_up",
-"sounds/mob/happy_ghast/harness_equip",
-"sounds/mob/happy_ghast/harness_unequip",
-"sounds/mob/happy_ghast/hurt1",
-"sounds/mob/happy_ghast/hurt2",
-"sounds/mob/happy_ghast/hurt3",
-"sounds/mob/happy_ghast/hurt4",
-"sounds/mob/happy_ghast/hurt5",
-"sounds/mob/happy_ghast/hurt6",
-"sounds/mob/hoglin/angry1",
-"sounds/mob/hoglin/angry2",
-"sounds/mob/hoglin/angry3",
-"sounds/mob/hoglin/angry4",
-"sounds/mob/hoglin/angry5",
-"sounds/mob/hoglin/angry6",
-"sounds/mob/hoglin/attack1",
-"sounds/mob/hoglin/attack2",
-"sounds/mob/hoglin/converted1",
-"sounds/mob/hoglin/converted2",
-"sounds/mob/hoglin/death1",
-"sounds/mob/hoglin/death2",
-"sounds/mob/hoglin/death3",
-"sounds/mob/hoglin/howl1",
-"sounds/mob/hoglin/howl2",
-"sounds/mob/hoglin/howl3",
-"sounds/mob/hoglin/howl4",
-"sounds/mob/hoglin/howl5",
-"sounds/mob/hoglin/hurt1",
-"sounds/mob/hoglin/hurt2",
-"sounds/mob/hoglin/hurt3",
-"sounds/mob/hoglin/hurt4",
-"sounds/mob/hoglin/idle1",
-"sounds/mob/hoglin/idle10",
-"sounds/mob/hoglin/idle11",
-"sounds/mob/hoglin/idle2",
-"sounds/mob/hoglin/idle3",
-"sounds/mob/hoglin/idle4",
-"sounds/mob/hoglin/idle5",
-"sounds/mob/hoglin/idle6",
-"sounds/mob/hoglin/idle7",
-"sounds/mob/hoglin/idle8",
-"sounds/mob/hoglin/idle9",
-"sounds/mob/hoglin/retreat1",
-"sounds/mob/hoglin/retreat2",
-"sounds/mob/hoglin/retreat3",
-"sounds/mob/hoglin/step1",
-"sounds/mob/hoglin/step2",
-"sounds/mob/hoglin/step3",
-"sounds/mob/hoglin/step4",
-"sounds/mob/hoglin/step5",
-"sounds/mob/hoglin/step6",
-"sounds/mob/horse/angry1",
-"sounds/mob/horse/armor",
-"sounds/mob/horse/breathe1",
-"sounds/mob/horse/breathe2",
-"sounds/mob/horse/breathe3",
-"sounds/mob/horse/death",
-"sounds/mob/horse/donkey/angry1",
-"sounds/mob/horse/donkey/angry2",
-"sounds/mob/horse/donkey/death",
-"sounds/mob/horse/donkey/hit1",
-"sounds/mob/horse/donkey/hit2",
-"sounds/mob/horse/donkey/hit3",
-"sounds/mob/horse/donkey/idle1",
-"sounds/mob/horse/donkey/idle2",
-"sounds/mob/horse/donkey/idle3",
-"sounds/mob/horse/eat1",
-"sounds/mob/horse/eat2",
-"sounds/mob/horse/eat3",
-"sounds/mob/horse/eat4",
-"sounds/mob/horse/eat5",
-"sounds/mob/horse/gallop1",
-"sounds/mob/horse/gallop2",
-"sounds/mob/horse/gallop3",
-"sounds/mob/horse/gallop4",
-"sounds/mob/horse/hit1",
-"sounds/mob/horse/hit2",
-"sounds/mob/horse/hit3",
-"sounds/mob/horse/hit4",
-"sounds/mob/horse/horse_armor_unequip",
-"sounds/mob/horse/idle1",
-"sounds/mob/horse/idle2",
-"sounds/mob/horse/idle3",
-"sounds/mob/horse/jump",
-"sounds/mob/horse/land",
-"sounds/mob/horse/leather",
-"sounds/mob/horse/skeleton/death",
-"sounds/mob/horse/skeleton/hit1",
-"sounds/mob/horse/skeleton/hit2",
-"sounds/mob/horse/skeleton/hit3",
-"sounds/mob/horse/skeleton/hit4",
-"sounds/mob/horse/skeleton/idle1",
-"sounds/mob/horse/skeleton/idle2",
-"sounds/mob/horse/skeleton/idle3",
-"sounds/mob/horse/soft1",
-"sounds/mob/horse/soft2",
-"sounds/mob/horse/soft3",
-"sounds/mob/horse/soft4",
-"sounds/mob/horse/soft5",
-"sounds/mob/horse/soft6",
-"sounds/mob/horse/wood1",
-"sounds/mob/horse/wood2",
-"sounds/mob/horse/wood3",
-"sounds/mob/horse/wood4",
-"sounds/mob/horse/wood5",
-"sounds/mob/horse/wood6",
-"sounds/mob/horse/zombie/death",
-"sounds/mob/horse/zombie/hit1",
-"sounds/mob/horse/zombie/hit2",
-"sounds/mob/horse/zombie/hit3",
-"sounds/mob/horse/zombie/hit4",
-"sounds/mob/horse/zombie/idle1",
-"sounds/mob/horse/zombie/idle2",
-"sounds/mob/horse/zombie/idle3",
-"sounds/mob/husk/convert1",
-"sounds/mob/husk/convert2",
-"sounds/mob/husk/death1",
-"sounds/mob/husk/death2",
-"sounds/mob/husk/hurt1",
-"sounds/mob/husk/hurt2",
-"sounds/mob/husk/idle1",
-"sounds/mob/husk/idle2",
-"sounds/mob/husk/idle3",
-"sounds/mob/husk/step1",
-"sounds/mob/husk/step2",
-"sounds/mob/husk/step3",
-"sounds/mob/husk/step4",
-"sounds/mob/husk/step5",
-"sounds/mob/irongolem/crack1",
-"sounds/mob/irongolem/crack2",
-"sounds/mob/irongolem/death",
-"sounds/mob/irongolem/hit1",
-"sounds/mob/irongolem/hit2",
-"sounds/mob/irongolem/hit3",
-"sounds/mob/irongolem/hit4",
-"sounds/mob/irongolem/repair",
-"sounds/mob/irongolem/throw",
-"sounds/mob/irongolem/walk1",
-"sounds/mob/irongolem/walk2",
-"sounds/mob/irongolem/walk3",
-"sounds/mob/irongolem/walk4",
-"sounds/mob/llama/angry1",
-"sounds/mob/llama/carpet_unequip",
-"sounds/mob/llama/death1",
-"sounds/mob/llama/death2",
-"sounds/mob/llama/eat1",
-"sounds/mob/llama/eat2",
-"sounds/mob/llama/eat3",
-"sounds/mob/llama/hurt1",
-"sounds/mob/llama/hurt2",
-"sounds/mob/llama/hurt3",
-"sounds/mob/llama/idle1",
-"sounds/mob/llama/idle2",
-"sounds/mob/llama/idle3",
-"sounds/mob/llama/idle4",
-"sounds/mob/llama/idle5",
-"sounds/mob/llama/spit1",
-"sounds/mob/llama/spit2",
-"sounds/mob/llama/step1",
-"sounds/mob/llama/step2",
-"sounds/mob/llama/step3",
-"sounds/mob/llama/step4",
-"sounds/mob/llama/step5",
-"sounds/mob/llama/swag",
-"sounds/mob/magmacube/big1",
-"sounds/mob/magmacube/big2",
-"sounds/mob/magmacube/big3",
-"sounds/mob/magmacube/big4",
-"sounds/mob/magmacube/jump1",
-"sounds/mob/magmacube/jump2",
-"sounds/mob/magmacube/jump3",
-"sounds/mob/magmacube/jump4",
-"sounds/mob/magmacube/small1",
-"sounds/mob/magmacube/small2",
-"sounds/mob/magmacube/small3",
-"sounds/mob/magmacube/small4",
-"sounds/mob/magmacube/small5",
-"sounds/mob/mooshroom/convert1",
-"sounds/mob/mooshroom/convert2",
-"sounds/mob/mooshroom/eat1",
-"sounds/mob/mooshroom/eat2",
-"sounds/mob/mooshroom/eat3",
-"sounds/mob/mooshroom/eat4",
-"sounds/mob/mooshroom/milk1",
-"sounds/mob/mooshroom/milk2",
-"sounds/mob/mooshroom/milk3",
-"sounds/mob/panda/aggressive1",
-"sounds/mob/panda/aggressive2",
-"sounds/mob/panda/aggressive3",
-"sounds/mob/panda/aggressive4",
-"sounds/mob/panda/bite1",
-"sounds/mob/panda/bite2",
-"sounds/mob/panda/bite3",
-"sounds/mob/panda/cant_breed1",
-"sounds/mob/panda/cant_breed2",
-"sounds/mob/panda/cant_breed3",
-"sounds/mob/panda/cant_breed4",
-"sounds/mob/panda/cant_breed5",
-"sounds/mob/panda/death1",
-"sounds/mob/panda/death2",
-"sounds/mob/panda/death3",
-"sounds/mob/panda/death4",
-"sounds/mob/panda/eat1",
-"sounds/mob/panda/eat10",
-"sounds/mob/panda/eat11",
-"sounds/mob/panda/eat12",
-"sounds/mob/panda/eat2",
-"sounds/mob/panda/eat3",
-"sounds/mob/panda/eat4",
-"sounds/mob/panda/eat5",
-"sounds/mob/panda/eat6",
-"sounds/mob/panda/eat7",
-"sounds/mob/panda/eat8",
-"sounds/mob/panda/eat9",
-"sounds/mob/panda/hurt1",
-"sounds/mob/panda/hurt2",
-"sounds/mob/panda/hurt3",
-"sounds/mob/panda/hurt4",
-"sounds/mob/panda/hurt5",
-"sounds/mob/panda/hurt6",
-"sounds/mob/panda/idle1",
-"sounds/mob/panda/idle2",
-"sounds/mob/panda/idle3",
-"sounds/mob/panda/idle4",
-"sounds/mob/panda/nosebreath1",
-"sounds/mob/panda/nosebreath2",
-"sounds/mob/panda/nosebreath3",
-"sounds/mob/panda/pant1",
-"sounds/mob/panda/pant2",
-"sounds/mob/panda/pre_sneeze",
-"sounds/mob/panda/sneeze1",
-"sounds/mob/panda/sneeze2",
-"sounds/mob/panda/sneeze3",
-"sounds/mob/panda/step1",
-"sounds/mob/panda/step2",
-"sounds/mob/panda/step3",
-"sounds/mob/panda/step4",
-"sounds/mob/panda/step5",
-"sounds/mob/panda/worried2",
-"sounds/mob/panda/worried3",
-"sounds/mob/panda/worried4",
-"sounds/mob/panda/worried5",
-"sounds/mob/panda/worried6",
-"sounds/mob/parrot/death1",
-"sounds/mob/parrot/death2",
-"sounds/mob/parrot/death3",
-"sounds/mob/parrot/death4",
-"sounds/mob/parrot/eat1",
-"sounds/mob/parrot/eat2",
-"sounds/mob/parrot/eat3",
-"sounds/mob/parrot/fly1",
-"sounds/mob/parrot/fly2",
-"sounds/mob/parrot/fly3",
-"sounds/mob/parrot/fly4",
-"sounds/mob/parrot/fly5",
-"sounds/mob/parrot/fly6",
-"sounds/mob/parrot/fly7",
-"sounds/mob/parrot/fly8",
-"sounds/mob/parrot/hurt1",
-"sounds/mob/parrot/hurt2",
-"sounds/mob/parrot/idle1",
-"sounds/mob/parrot/idle2",
-"sounds/mob/parrot/idle3",
-"sounds/mob/parrot/idle4",
-"sounds/mob/parrot/idle5",
-"sounds/mob/parrot/idle6",
-"sounds/mob/parrot/imitate_creaking",
-"sounds/mob/parrot/step1",
-"sounds/mob/parrot/step2",
-"sounds/mob/parrot/step3",
-"sounds/mob/parrot/step4",
-"sounds/mob/parrot/step5",
-"sounds/mob/phantom/bite1",
-"sounds/mob/phantom/bite2",
-"sounds/mob/phantom/death1",
-"sounds/mob/phantom/death2",
-"sounds/mob/phantom/death3",
-"sounds/mob/phantom/flap1",
-"sounds/mob/phantom/flap2",
-"sounds/mob/phantom/flap3",
-"sounds/mob/phantom/flap4",
-"sounds/mob/phantom/flap5",
-"sounds/mob/phantom/flap6",
-"sounds/mob/phantom/hurt1",
-"sounds/mob/phantom/hurt2",
-"sounds/mob/phantom/hurt3",
-"sounds/mob/phantom/idle1",
-"sounds/mob/phantom/idle2",
-"sounds/mob/phantom/idle3",
-"sounds/mob/phantom/idle4",
-"sounds/mob/phantom/idle5",
-"sounds/mob/phantom/swoop1",
-"sounds/mob/phantom/swoop2",
-"sounds/mob/phantom/swoop3",
-"sounds/mob/phantom/swoop4",
-"sounds/mob/pig/boost1",
-"sounds/mob/pig/boost2",
-"sounds/mob/pig/boost3",
-"sounds/mob/pig/boost4long",
-"sounds/mob/pig/boost5long",
-"sounds/mob/pig/death",
-"sounds/mob/pig/say1",
-"sounds/mob/pig/say2",
-"sounds/mob/pig/say3",
-"sounds/mob/pig/step1",
-"sounds/mob/pig/step2",
-"sounds/mob/pig/step3",
-"sounds/mob/pig/step4",
-"sounds/mob/pig/step5",
-"sounds/mob/piglin/admire1",
-"sounds/mob/piglin/admire2",
-"sounds/mob/piglin/angry1",
-"sounds/mob/piglin/angry2",
-"sounds/mob/piglin/angry3",
-"sounds/mob/piglin/angry4",
-"sounds/mob/piglin/celebrate1",
-"sounds/mob/piglin/celebrate2",
-"sounds/mob/piglin/celebrate3",
-"sounds/mob/piglin/celebrate4",
-"sounds/mob/piglin/converted1",
-"sounds/mob/piglin/converted2",
-"sounds/mob/piglin/death1",
-"sounds/mob/piglin/death2",
-"sounds/mob/piglin/death3",
-"sounds/mob/piglin/death4",
-"sounds/mob/piglin/hurt1",
-"sounds/mob/piglin/hurt2",
-"sounds/mob/piglin/hurt3",
-"sounds/mob/piglin/idle1",
-"sounds/mob/piglin/idle2",
-"sounds/mob/piglin/idle3",
-"sounds/mob/piglin/idle4",
-"sounds/mob/piglin/idle5",
-"sounds/mob/piglin/jealous1",
-"sounds/mob/piglin/jealous2",
-"sounds/mob/piglin/jealous3",
-"sounds/mob/piglin/jealous4",
-"sounds/mob/piglin/jealous5",
-"sounds/mob/piglin/retreat1",
-"sounds/mob/piglin/retreat2",
-"sounds/mob/piglin/retreat3",
-"sounds/mob/piglin/retreat4",
-"sounds/mob/piglin/step1",
-"sounds/mob/piglin/step2",
-"sounds/mob/piglin/step3",
-"sounds/mob/piglin/step4",
-"sounds/mob/piglin/step5",
-"sounds/mob/piglin_brute/angry1",
-"sounds/mob/piglin_brute/angry2",
-"sounds/mob/piglin_brute/angry3",
-"sounds/mob/piglin_brute/angry4",
-"sounds/mob/piglin_brute/death1",
-"sounds/mob/piglin_brute/death2",
-"sounds/mob/piglin_brute/death3",
-"sounds/mob/piglin_brute/hurt1",
-"sounds/mob/piglin_brute/hurt2",
-"sounds/mob/piglin_brute/hurt3",
-"sounds/mob/piglin_brute/idle1",
-"sounds/mob/piglin_brute/idle2",
-"sounds/mob/piglin_brute/idle3",
-"sounds/mob/piglin_brute/idle4",
-"sounds/mob/piglin_brute/idle5",
-"sounds/mob/piglin_brute/step1",
-"sounds/mob/piglin_brute/step2",
-"sounds/mob/piglin_brute/step3",
-"sounds/mob/piglin_brute/step4",
-"sounds/mob/piglin_brute/step5",
-"sounds/mob/pillager/celebrate1",
-"sounds/mob/pillager/celebrate2",
-"sounds/mob/pillager/celebrate3",
-"sounds/mob/pillager/celebrate4",
-"sounds/mob/pillager/death1",
-"sounds/mob/pillager/death2",
-"sounds/mob/pillager/horn_celebrate",
-"sounds/mob/pillager/hurt1",
-"sounds/mob/pillager/hurt2",
-"sounds/mob/pillager/hurt3",
-"sounds/mob/pillager/idle1",
-"sounds/mob/pillager/idle2",
-"sounds/mob/pillager/idle3",
-"sounds/mob/pillager/idle4",
-"sounds/mob/player/attack/strong1",
-"sounds/mob/player/attack/strong2",
-"sounds/mob/player/attack/strong3",
-"sounds/mob/player/attack/strong4",
-"sounds/mob/player/attack/strong5",
-"sounds/mob/player/attack/strong6",
-"sounds/mob/player/attack/weak1",
-"sounds/mob/player/attack/weak2",
-"sounds/mob/player/attack/weak3",
-"sounds/mob/player/attack/weak4",
-"sounds/mob/player/hurt/drown1",
-"sounds/mob/player/hurt/drown2",
-"sounds/mob/player/hurt/drown3",
-"sounds/mob/player/hurt/drown4",
-"sounds/mob/player/hurt/fire_hurt1",
-"sounds/mob/player/hurt/fire_hurt2",
-"sounds/mob/player/hurt/fire_hurt3",
-"sounds/mob/player/hurt/freeze_hurt1",
-"sounds/mob/player/hurt/freeze_hurt2",
-"sounds/mob/player/hurt/freeze_hurt3",
-"sounds/mob/player/hurt/freeze_hurt4",
-"sounds/mob/player/hurt/freeze_hurt5",
-"sounds/mob/polarbear/death1",
-"sounds/mob/polarbear/death2",
-"sounds/mob/polarbear/death3",
-"sounds/mob/polarbear/hurt1",
-"sounds/mob/polarbear/hurt2",
-"sounds/mob/polarbear/hurt3",
-"sounds/mob/polarbear/hurt4",
-"sounds/mob/polarbear/idle1",
-"sounds/mob/polarbear/idle2",
-"sounds/mob/polarbear/idle3",
-"sounds/mob/polarbear/idle4",
-"sounds/mob/polarbear/step1",
-"sounds/mob/polarbear/step2",
-"sounds/mob/polarbear/step3",
-"sounds/mob/polarbear/step4",
-"sounds/mob/polarbear/warning1",
-"sounds/mob/polarbear/warning2",
-"sounds/mob/polarbear/warning3",
-"sounds/mob/polarbear/warning4",
-"sounds/mob/polarbear_baby/idle1",
-"sounds/mob/polarbear_baby/idle2",
-"sounds/mob/polarbear_baby/idle3",
-"sounds/mob/polarbear_baby/idle4",
-"sounds/mob/rabbit/bunnymurder",
-"sounds/mob/rabbit/hop1",
-"sounds/mob/rabbit/hop2",
-"sounds/mob/rabbit/hop3",
-"sounds/mob/rabbit/hop4",
-"sounds/mob/rabbit/hurt1",
-"sounds/mob/rabbit/hurt2",
-"sounds/mob/rabbit/hurt3",
-"sounds/mob/rabbit/hurt4",
-"sounds/mob/rabbit/idle1",
-"sounds/mob/rabbit/idle2",
-"sounds/mob/rabbit/idle3",
-"sounds/mob/rabbit/idle4",
-"sounds/mob/ravager/bite1",
-"sounds/mob/ravager/bite2",
-"sounds/mob/ravager/bite3",
-"sounds/mob/ravager/celebrate1",
-"sounds/mob/ravager/celebrate2",
-"sounds/mob/ravager/death1",
-"sounds/mob/ravager/death2",
-"sounds/mob/ravager/death3",
-"sounds/mob/ravager/hurt1",
-"sounds/mob/ravager/hurt2",
-"sounds/mob/ravager/hurt3",
-"sounds/mob/ravager/hurt4",
-"sounds/mob/ravager/idle1",
-"sounds/mob/ravager/idle2",
-"sounds/mob/ravager/idle3",
-"sounds/mob/ravager/idle4",
-"sounds/mob/ravager/idle5",
-"sounds/mob/ravager/idle6",
-"sounds/mob/ravager/idle7",
-"sounds/mob/ravager/idle8",
-"sounds/mob/ravager/roar1",
-"sounds/mob/ravager/roar2",
-"sounds/mob/ravager/roar3",
-"sounds/mob/ravager/roar4",
-"sounds/mob/ravager/step1",
-"sounds/mob/ravager/step2",
-"sounds/mob/ravager/step3",
-"sounds/mob/ravager/step4",
-"sounds/mob/ravager/step5",
-"sounds/mob/ravager/stun1",
-"sounds/mob/ravager/stun2",
-"sounds/mob/ravager/stun3",
-"sounds/mob/sheep/say1",
-"sounds/mob/sheep/say2",
-"sounds/mob/sheep/say3",
-"sounds/mob/sheep/shear",
-"sounds/mob/sheep/step1",
-"sounds/mob/sheep/step2",
-"sounds/mob/sheep/step3",
-"sounds/mob/sheep/step4",
-"sounds/mob/sheep/step5",
-"sounds/mob/shulker/ambient1",
-"sounds/mob/shulker/ambient2",
-"sounds/mob/shulker/ambient3",
-"sounds/mob/shulker/ambient4",
-"sounds/mob/shulker/ambient5",
-"sounds/mob/shulker/ambient6",
-"sounds/mob/shulker/ambient7",
-"sounds/mob/shulker/close1",
-"sounds/mob/shulker/close2",
-"sounds/mob/shulker/close3",
-"sounds/mob/shulker/close4",
-"sounds/mob/shulker/close5",
-"sounds/mob/shulker/death1",
-"sounds/mob/shulker/death2",
-"sounds/mob/shulker/death3",
-"sounds/mob/shulker/death4",
-"sounds/mob/shulker/hurt1",
-"sounds/mob/shulker/hurt2",
-"sounds/mob/shulker/hurt3",
-"sounds/mob/shulker/hurt4",
-"sounds/mob/shulker/hurt_close1",
-"sounds/mob/shulker/hurt_close2",
-"sounds/mob/shulker/hurt_close3",
-"sounds/mob/shulker/hurt_close4",
-"sounds/mob/shulker/hurt_close5",
-"sounds/mob/shulker/open1",
-"sounds/mob/shulker/open2",
-"sounds/mob/shulker/open3",
-"sounds/mob/shulker/open4",
-"sounds/mob/shulker/open5",
-"sounds/mob/shulker/shoot1",
-"sounds/mob/shulker/shoot2",
-"sounds/mob/shulker/shoot3",
-"sounds/mob/shulker/shoot4",
-"sounds/mob/shulker/shulker_bullet/hit1",
-"sounds/mob/shulker/shulker_bullet/hit2",
-"sounds/mob/shulker/shulker_bullet/hit3",
-"sounds/mob/shulker/shulker_bullet/hit4",
-"sounds/mob/silverfish/hit1",
-"sounds/mob/silverfish/hit2",
-"sounds/mob/silverfish/hit3",
-"sounds/mob/silverfish/kill",
-"sounds/mob/silverfish/say1",
-"sounds/mob/silverfish/say2",
-"sounds/mob/silverfish/say3",
-"sounds/mob/silverfish/say4",
-"sounds/mob/silverfish/step1",
-"sounds/mob/silverfish/step2",
-"sounds/mob/silverfish/step3",
-"sounds/mob/silverfish/step4",
-"sounds/mob/skeleton/death",
-"sounds/mob/skeleton/hurt1",
-"sounds/mob/skeleton/hurt2",
-"sounds/mob/skeleton/hurt3",
-"sounds/mob/skeleton/hurt4",
-"sounds/mob/skeleton/say1",
-"sounds/mob/skeleton/say2",
-"sounds/mob/skeleton/say3",
-"sounds/mob/skeleton/step1",
-"sounds/mob/skeleton/step2",
-"sounds/mob/skeleton/step3",
-"sounds/mob/skeleton/step4",
-"sounds/mob/slime/attack1",
-"sounds/mob/slime/attack2",
-"sounds/mob/slime/big1",
-"sounds/mob/slime/big2",
-"sounds/mob/slime/big3",
-"sounds/mob/slime/big4",
-"sounds/mob/slime/small1",
-"sounds/mob/slime/small2",
-"sounds/mob/slime/small3",
-"sounds/mob/slime/small4",
-"sounds/mob/slime/small5",
-"sounds/mob/sniffer/death1",
-"sounds/mob/sniffer/death2",
-"sounds/mob/sniffer/digging_stop1",
-"sounds/mob/sniffer/digging_stop2",
-"sounds/mob/sniffer/eat1",
-"sounds/mob/sniffer/eat2",
-"sounds/mob/sniffer/eat3",
-"sounds/mob/sniffer/happy1",
-"sounds/mob/sniffer/happy2",
-"sounds/mob/sniffer/happy3",
-"sounds/mob/sniffer/happy4",
-"sounds/mob/sniffer/happy5",
-"sounds/mob/sniffer/hurt1",
-"sounds/mob/sniffer/hurt2",
-"sounds/mob/sniffer/hurt3",
-"sounds/mob/sniffer/idle1",
-"sounds/mob/sniffer/idle10",
-"sounds/mob/sniffer/idle11",
-"sounds/mob/sniffer/idle2",
-"sounds/mob/sniffer/idle3",
-"sounds/mob/sniffer/idle4",
-"sounds/mob/sniffer/idle5",
-"sounds/mob/sniffer/idle6",
-"sounds/mob/sniffer/idle7",
-"sounds/mob/sniffer/idle8",
-"sounds/mob/sniffer/idle9",
-"sounds/mob/sniffer/longdig1",
-"sounds/mob/sniffer/longdig2",
-"sounds/mob/sniffer/plop",
-"sounds/mob/sniffer/scenting1",
-"sounds/mob/sniffer/scenting2",
-"sounds/mob/sniffer/scenting3",
-"sounds/mob/sniffer/searching1",
-"sounds/mob/sniffer/searching2",
-"sounds/mob/sniffer/searching3",
-"sounds/mob/sniffer/searching4",
-"sounds/mob/sniffer/searching5",
-"sounds/mob/sniffer/searching6",
-"sounds/mob/sniffer/sniffing1",
-"sounds/mob/sniffer/sniffing2",
-"sounds/mob/sniffer/sniffing3",
-"sounds/mob/sniffer/step1",
-"sounds/mob/sniffer/step2",
-"sounds/mob/sniffer/step3",
-"sounds/mob/sniffer/step4",
-"sounds/mob/sniffer/step5",
-"sounds/mob/sniffer/step6",
-"sounds/mob/snowgolem/death1",
-"sounds/mob/snowgolem/death2",
-"sounds/mob/snowgolem/death3",
-"sounds/mob/snowgolem/hurt1",
-"sounds/mob/snowgolem/hurt2",
-"sounds/mob/snowgolem/hurt3",
-"sounds/mob/spider/death",
-"sounds/mob/spider/say1",
-"sounds/mob/spider/say2",
-"sounds/mob/spider/say3",
-"sounds/mob/spider/say4",
-"sounds/mob/spider/step1",
-"sounds/mob/spider/step2",
-"sounds/mob/spider/step3",
-"sounds/mob/spider/step4",
-"sounds/mob/squid/ambient1",
-"sounds/mob/squid/ambient2",
-"sounds/mob/squid/ambient3",
-"sounds/mob/squid/ambient4",
-"sounds/mob/squid/ambient5",
-"sounds/mob/squid/death1",
-"sounds/mob/squid/death2",
-"sounds/mob/squid/death3",
-"sounds/mob/squid/hurt1",
-"sounds/mob/squid/hurt2",
-"sounds/mob/squid/hurt3",
-"sounds/mob/squid/hurt4",
-"sounds/mob/squid/squirt1",
-"sounds/mob/squid/squirt2",
-"sounds/mob/squid/squirt3",
-"sounds/mob/stray/convert1",
-"sounds/mob/stray/convert2",
-"sounds/mob/stray/convert3",
-"sounds/mob/stray/death1",
-"sounds/mob/stray/death2",
-"sounds/mob/stray/hurt1",
-"sounds/mob/stray/hurt2",
-"sounds/mob/stray/hurt3",
-"sounds/mob/stray/hurt4",
-"sounds/mob/stray/idle1",
-"sounds/mob/stray/idle2",
-"sounds/mob/stray/idle3",
-"sounds/mob/stray/idle4",
-"sounds/mob/stray/step1",
-"sounds/mob/stray/step2",
-"sounds/mob/stray/step3",
-"sounds/mob/stray/step4",
-"sounds/mob/strider/death1",
-"sounds/mob/strider/death2",
-"sounds/mob/strider/death3",
-"sounds/mob/strider/death4",
-"sounds/mob/strider/eat1",
-"sounds/mob/strider/eat2",
-"sounds/mob/strider/eat3",
-"sounds/mob/strider/hurt1",
-"sounds/mob/strider/hurt2",
-"sounds/mob/strider/hurt3",
-"sounds/mob/strider/hurt4",
-"sounds/mob/strider/idle1",
-"sounds/mob/strider/idle2",
-"sounds/mob/strider/idle3",
-"sounds/mob/strider/idle4",
-"sounds/mob/strider/idle5",
-"sounds/mob/strider/idle6",
-"sounds/mob/strider/panic1",
-"sounds/mob/strider/panic2",
-"sounds/mob/strider/panic3",
-"sounds/mob/strider/panic4",
-"sounds/mob/strider/panic5",
-"sounds/mob/strider/step1",
-"sounds/mob/strider/step2",
-"sounds/mob/strider/step3",
-"sounds/mob/strider/step4",
-"sounds/mob/strider/step5",
-"sounds/mob/strider/step_lava1",
-"sounds/mob/strider/step_lava2",
-"sounds/mob/strider/step_lava3",
-"sounds/mob/strider/step_lava4",
-"sounds/mob/strider/step_lava5",
-"sounds/mob/strider/step_lava6",
-"sounds/mob/strider/tempt1",
-"sounds/mob/strider/tempt2",
-"sounds/mob/strider/tempt3",
-"sounds/mob/strider/tempt4",
-"sounds/mob/strider/tempt5",
-"sounds/mob/tadpole/death1",
-"sounds/mob/tadpole/death2",
-"sounds/mob/tadpole/hurt1",
-"sounds/mob/tadpole/hurt2",
-"sounds/mob/tadpole/hurt3",
-"sounds/mob/tadpole/hurt4",
-"sounds/mob/turtle/death1",
-"sounds/mob/turtle/death2",
-"sounds/mob/turtle/death3",
-"sounds/mob/turtle/hurt1",
-"sounds/mob/turtle/hurt2",
-"sounds/mob/turtle/hurt3",
-"sounds/mob/turtle/hurt4",
-"sounds/mob/turtle/hurt5",
-"sounds/mob/turtle/idle1",
-"sounds/mob/turtle/idle2",
-"sounds/mob/turtle/idle3",
-"sounds/mob/turtle/swim1",
-"sounds/mob/turtle/swim2",
-"sounds/mob/turtle/swim3",
-"sounds/mob/turtle/swim4",
-"sounds/mob/turtle/swim5",
-"sounds/mob/turtle/walk1",
-"sounds/mob/turtle/walk2",
-"sounds/mob/turtle_baby/death1",
-"sounds/mob/turtle_baby/death2",
-"sounds/mob/turtle_baby/egg_hatched1",
-"sounds/mob/turtle_baby/egg_hatched2",
-"sounds/mob/turtle_baby/egg_hatched3",
-"sounds/mob/turtle_baby/hurt1",
-"sounds/mob/turtle_baby/hurt2",
-"sounds/mob/turtle_baby/shamble1",
-"sounds/mob/turtle_baby/shamble2",
-"sounds/mob/turtle_baby/shamble3",
-"sounds/mob/turtle_baby/shamble4",
-"sounds/mob/vex/charge1",
-"sounds/mob/vex/charge2",
-"sounds/mob/vex/charge3",
-"sounds/mob/vex/death1",
-"sounds/mob/vex/death2",
-"sounds/mob/vex/hurt1",
-"sounds/mob/vex/hurt2",
-"sounds/mob/vex/idle1",
-"sounds/mob/vex/idle2",
-"sounds/mob/vex/idle3",
-"sounds/mob/vex/idle4",
-"sounds/mob/villager/death",
-"sounds/mob/villager/haggle1",
-"sounds/mob/villager/haggle2",
-"sounds/mob/villager/haggle3",
-"sounds/mob/villager/hit1",
-"sounds/mob/villager/hit2",
-"sounds/mob/villager/hit3",
-"sounds/mob/villager/hit4",
-"sounds/mob/villager/idle1",
-"sounds/mob/villager/idle2",
-"sounds/mob/villager/idle3",
-"sounds/mob/villager/no1",
-"sounds/mob/villager/no2",
-"sounds/mob/villager/no3",
-"sounds/mob/villager/yes1",
-"sounds/mob/villager/yes2",
-"sounds/mob/villager/yes3",
-"sounds/mob/vindication_illager/celebrate1",
-"sounds/mob/vindication_illager/celebrate2",
-"sounds/mob/vindication_illager/death1",
-"sounds/mob/vindication_illager/death2",
-"sounds/mob/vindication_illager/hurt1",
-"sounds/mob/vindication_illager/hurt2",
-"sounds/mob/vindication_illager/hurt3",
-"sounds/mob/vindication_illager/idle1",
-"sounds/mob/vindication_illager/idle2",
-"sounds/mob/vindication_illager/idle3",
-"sounds/mob/vindication_illager/idle4",
-"sounds/mob/vindication_illager/idle5",
-"sounds/mob/wandering_trader/death",
-"sounds/mob/wandering_trader/disappeared1",
-"sounds/mob/wandering_trader/disappeared2",
-"sounds/mob/wandering_trader/drink_milk1",
-"sounds/mob/wandering_trader/drink_milk2",
-"sounds/mob/wandering_trader/drink_milk3",
-"sounds/mob/wandering_trader/drink_milk4",
-"sounds/mob/wandering_trader/drink_milk5",
-"sounds/mob/wandering_trader/drink_potion",
-"sounds/mob/wandering_trader/haggle1",
-"sounds/mob/wandering_trader/haggle2",
-"sounds/mob/wandering_trader/haggle3",
-"sounds/mob/wandering_trader/hurt1",
-"sounds/mob/wandering_trader/hurt2",
-"sounds/mob/wandering_trader/hurt3",
-"sounds/mob/wandering_trader/hurt4",
-"sounds/mob/wandering_trader/idle1",
-"sounds/mob/wandering_trader/idle2",
-"sounds/mob/wandering_trader/idle3",
-"sounds/mob/wandering_trader/idle4",
-"sounds/mob/wandering_trader/idle5",
-"sounds/mob/wandering_trader/no1",
-"sounds/mob/wandering_trader/no2",
-"sounds/mob/wandering_trader/no3",
-"sounds/mob/wandering_trader/no4",
-"sounds/mob/wandering_trader/no5",
-"sounds/mob/wandering_trader/reappeared1",
-"sounds/mob/wandering_trader/reappeared2",
-"sounds/mob/wandering_trader/yes1",
-"sounds/mob/wandering_trader/yes2",
-"sounds/mob/wandering_trader/yes3",
-"sounds/mob/wandering_trader/yes4",
-"sounds/mob/warden/agitated_1",
-"sounds/mob/warden/agitated_2",
-"sounds/mob/warden/agitated_3",
-"sounds/mob/warden/agitated_4",
-"sounds/mob/warden/agitated_5",
-"sounds/mob/warden/agitated_6",
-"sounds/mob/warden/angry_1",
-"sounds/mob/warden/angry_2",
-"sounds/mob/warden/angry_3",
-"sounds/mob/warden/angry_4",
-"sounds/mob/warden/angry_5",
-"sounds/mob/warden/angry_6",
-"sounds/mob/warden/attack_impact_1",
-"sounds/mob/warden/attack_impact_2",
-"sounds/mob/warden/death_1",
-"sounds/mob/warden/death_2",
-"sounds/mob/warden/dig",
-"sounds/mob/warden/emerge",
-"sounds/mob/warden/heartbeat_1",
-"sounds/mob/warden/heartbeat_2",
-"sounds/mob/warden/heartbeat_3",
-"sounds/mob/warden/heartbeat_4",
-"sounds/mob/warden/hurt_1",
-"sounds/mob/warden/hurt_2",
-"sounds/mob/warden/hurt_3",
-"sounds/mob/warden/hurt_4",
-"sounds/mob/warden/idle_1",
-"sounds/mob/warden/idle_10",
-"sounds/mob/warden/idle_11",
-"sounds/mob/warden/idle_12",
-"sounds/mob/warden/idle_2",
-"sounds/mob/warden/idle_3",
-"sounds/mob/warden/idle_4",
-"sounds/mob/warden/idle_5",
-"sounds/mob/warden/idle_6",
-"sounds/mob/warden/idle_7",
-"sounds/mob/warden/idle_8",
-"sounds/mob/warden/idle_9",
-"sounds/mob/warden/listening_1",
-"sounds/mob/warden/listening_2",
-"sounds/mob/warden/listening_3",
-"sounds/mob/warden/listening_4",
-"sounds/mob/warden/listening_5",
-"sounds/mob/warden/listening_angry_1",
-"sounds/mob/warden/listening_angry_2",
-"sounds/mob/warden/listening_angry_3",
-"sounds/mob/warden/listening_angry_4",
-"sounds/mob/warden/listening_angry_5",
-"sounds/mob/warden/nearby_close_1",
-"sounds/mob/warden/nearby_close_2",
-"sounds/mob/warden/nearby_close_3",
-"sounds/mob/warden/nearby_close_4",
-"sounds/mob/warden/nearby_closer_1",
-"sounds/mob/warden/nearby_closer_2",
-"sounds/mob/warden/nearby_closer_3",
-"sounds/mob/warden/nearby_closest_1",
-"sounds/mob/warden/nearby_closest_2",
-"sounds/mob/warden/nearby_closest_3",
-"sounds/mob/warden/roar_1",
-"sounds/mob/warden/roar_2",
-"sounds/mob/warden/roar_3",
-"sounds/mob/warden/roar_4",
-"sounds/mob/warden/roar_5",
-"sounds/mob/warden/sniff_1",
-"sounds/mob/warden/sniff_2",
-"sounds/mob/warden/sniff_3",
-"sounds/mob/warden/sniff_4",
-"sounds/mob/warden/sonic_boom1",
-"sounds/mob/warden/sonic_boom2",
-"sounds/mob/warden/sonic_boom3",
-"sounds/mob/warden/sonic_boom4",
-"sounds/mob/warden/sonic_charge1",
-"sounds/mob/warden/sonic_charge2",
-"sounds/mob/warden/sonic_charge3",
-"sounds/mob/warden/sonic_charge4",
-"sounds/mob/warden/step_1",
-"sounds/mob/warden/step_2",
-"sounds/mob/warden/step_3",
-"sounds/mob/warden/step_4",
-"sounds/mob/warden/tendril_clicks_1",
-"sounds/mob/warden/tendril_clicks_2",
-"sounds/mob/warden/tendril_clicks_3",
-"sounds/mob/warden/tendril_clicks_4",
-"sounds/mob/warden/tendril_clicks_5",
-"sounds/mob/warden/tendril_clicks_6",
-"sounds/mob/witch/ambient1",
-"sounds/mob/witch/ambient2",
-"sounds/mob/witch/ambient3",
-"sounds/mob/witch/ambient4",
-"sounds/mob/witch/ambient5",
-"sounds/mob/witch/celebrate",
-"sounds/mob/witch/death1",
-"sounds/mob/witch/death2",
-"sounds/mob/witch/death3",
-"sounds/mob/witch/drink1",
-"sounds/mob/witch/drink2",
-"sounds/mob/witch/drink3",
-"sounds/mob/witch/drink4",
-"sounds/mob/witch/hurt1",
-"sounds/mob/witch/hurt2",
-"sounds/mob/witch/hurt3",
-"sounds/mob/witch/throw1",
-"sounds/mob/witch/throw2",
-"sounds/mob/witch/throw3",
-"sounds/mob/wither/death",
-"sounds/mob/wither/hurt1",
-"sounds/mob/wither/hurt2",
-"sounds/mob/wither/hurt3",
-"sounds/mob/wither/hurt4",
-"sounds/mob/wither/idle1",
-"sounds/mob/wither/idle2",
-"sounds/mob/wither/idle3",
-"sounds/mob/wither/idle4",
-"sounds/mob/wither/shoot",
-"sounds/mob/wither/spawn",
-"sounds/mob/wither_skeleton/death1",
-"sounds/mob/wither_skeleton/death2",
-"sounds/mob/wither_skeleton/hurt1",
-"sounds/mob/wither_skeleton/hurt2",
-"sounds/mob/wither_skeleton/hurt3",
-"sounds/mob/wither_skeleton/hurt4",
-"sounds/mob/wither_skeleton/idle1",
-"sounds/mob/wither_skeleton/idle2",
-"sounds/mob/wither_skeleton/idle3",
-"sounds/mob/wither_skeleton/step1",
-"sounds/mob/wither_skeleton/step2",
-"sounds/mob/wither_skeleton/step3",
-"sounds/mob/wither_skeleton/step4",
-"sounds/mob/wolf/bark1",
-"sounds/mob/wolf/bark2",
-"sounds/mob/wolf/bark3",
-"sounds/mob/wolf/big/bark1",
-"sounds/mob/wolf/big/bark2",
-"sounds/mob/wolf/big/bark3",
-"sounds/mob/wolf/big/death",
-"sounds/mob/wolf/big/growl1",
-"sounds/mob/wolf/big/growl2",
-"sounds/mob/wolf/big/growl3",
-"sounds/mob/wolf/big/hurt1",
-"sounds/mob/wolf/big/hurt2",
-"sounds/mob/wolf/big/hurt3",
-"sounds/mob/wolf/big/panting",
-"sounds/mob/wolf/big/whine",
-"sounds/mob/wolf/cute/bark1",
-"sounds/mob/wolf/cute/bark2",
-"sounds/mob/wolf/cute/bark3",
-"sounds/mob/wolf/cute/death",
-"sounds/mob/wolf/cute/growl1",
-"sounds/mob/wolf/cute/growl2",
-"sounds/mob/wolf/cute/growl3",
-"sounds/mob/wolf/cute/hurt1",
-"sounds/mob/wolf/cute/hurt2",
-"sounds/mob/wolf/cute/hurt3",
-"sounds/mob/wolf/cute/panting",
-"sounds/mob/wolf/cute/whine",
-"sounds/mob/wolf/death",
-"sounds/mob/wolf/growl1",
-"sounds/mob/wolf/growl2",
-"sounds/mob/wolf/growl3",
-"sounds/mob/wolf/grumpy/bark1",
-"sounds/mob/wolf/grumpy/bark2",
-"sounds/mob/wolf/grumpy/bark3",
-"sounds/mob/wolf/grumpy/death",
-"sounds/mob/wolf/grumpy/growl1",
-"sounds/mob/wolf/grumpy/growl2",
-"sounds/mob/wolf/grumpy/growl3",
-"sounds/mob/wolf/grumpy/hurt1",
-"sounds/mob/wolf/grumpy/hurt2",
-"sounds/mob/wolf/grumpy/hurt3",
-"sounds/mob/wolf/grumpy/panting",
-"sounds/mob/wolf/grumpy/whine",
-"sounds/mob/wolf/hurt1",
-"sounds/mob/wolf/hurt2",
-"sounds/mob/wolf/hurt3",
-"sounds/mob/wolf/mad/bark1",
-"sounds/mob/wolf/mad/bark2",
-"sounds/mob/wolf/mad/bark3",
-"sounds/mob/wolf/mad/death",
-"sounds/mob/wolf/mad/growl1",
-"sounds/mob/wolf/mad/growl2",
-"sounds/mob/wolf/mad/growl3",
-"sounds/mob/wolf/mad/hurt1",
-"sounds/mob/wolf/mad/hurt2",
-"sounds/mob/wolf/mad/hurt3",
-"sounds/mob/wolf/mad/panting",
-"sounds/mob/wolf/mad/whine",
-"sounds/mob/wolf/panting",
-"sounds/mob/wolf/puglin/bark1",
-"sounds/mob/wolf/puglin/bark2",
-"sounds/mob/wolf/puglin/bark3",
-"sounds/mob/wolf/puglin/death",
-"sounds/mob/wolf/puglin/growl1",
-"sounds/mob/wolf/puglin/growl2",
-"sounds/mob/wolf/puglin/growl3",
-"sounds/mob/wolf/puglin/hurt1",
-"sounds/mob/wolf/puglin/hurt2",
-"sounds/mob/wolf/puglin/hurt3",
-"sounds/mob/wolf/puglin/panting",
-"sounds/mob/wolf/puglin/whine",
-"sounds/mob/wolf/sad/bark1",
-"sounds/mob/wolf/sad/bark2",
-"sounds/mob/wolf/sad/bark3",
-"sounds/mob/wolf/sad/death",
-"sounds/mob/wolf/sad/growl1",
-"sounds/mob/wolf/sad/growl2",
-"sounds/mob/wolf/sad/growl3",
-"sounds/mob/wolf/sad/hurt1",
-"sounds/mob/wolf/sad/hurt2",
-"sounds/mob/wolf/sad/hurt3",
-"sounds/mob/wolf/sad/panting",
-"sounds/mob/wolf/sad/whine",
-"sounds/mob/wolf/shake",
-"sounds/mob/wolf/step1",
-"sounds/mob/wolf/step2",
-"sounds/mob/wolf/step3",
-"sounds/mob/wolf/step4",
-"sounds/mob/wolf/step5",
-"sounds/mob/wolf/whine",
-"sounds/mob/zoglin/angry1",
-"sounds/mob/zoglin/angry2",
-"sounds/mob/zoglin/angry3",
-"sounds/mob/zoglin/attack1",
-"sounds/mob/zoglin/attack2",
-"sounds/mob/zoglin/death1",
-"sounds/mob/zoglin/death2",
-"sounds/mob/zoglin/death3",
-"sounds/mob/zoglin/hurt1",
-"sounds/mob/zoglin/hurt2",
-"sounds/mob/zoglin/hurt3",
-"sounds/mob/zoglin/idle1",
-"sounds/mob/zoglin/idle2",
-"sounds/mob/zoglin/idle3",
-"sounds/mob/zoglin/idle4",
-"sounds/mob/zoglin/idle5",
-"sounds/mob/zoglin/idle6",
-"sounds/mob/zoglin/step1",
-"sounds/mob/zoglin/step2",
-"sounds/mob/zoglin/step3",
-"sounds/mob/zoglin/step4",
-"sounds/mob/zoglin/step5",
-"sounds/mob/zombie/death",
-"sounds/mob/zombie/hurt1",
-"sounds/mob/zombie/hurt2",
-"sounds/mob/zombie/remedy",
-"sounds/mob/zombie/say1",
-"sounds/mob/zombie/say2",
-"sounds/mob/zombie/say3",
-"sounds/mob/zombie/step1",
-"sounds/mob/zombie/step2",
-"sounds/mob/zombie/step3",
-"sounds/mob/zombie/step4",
-"sounds/mob/zombie/step5",
-"sounds/mob/zombie/unfect",
-"sounds/mob/zombie/wood1",
-"sounds/mob/zombie/wood2",
-"sounds/mob/zombie/wood3",
-"sounds/mob/zombie/wood4",
-"sounds/mob/zombie/woodbreak",
-"sounds/mob/zombie_villager/death",
-"sounds/mob/zombie_villager/hurt1",
-"sounds/mob/zombie_villager/hurt2",
-"sounds/mob/zombie_villager/say1",
-"sounds/mob/zombie_villager/say2",
-"sounds/mob/zombie_villager/say3",
-"sounds/mob/zombiepig/zpig1",
-"sounds/mob/zombiepig/zpig2",
-"sounds/mob/zombiepig/zpig3",
-"sounds/mob/zombiepig/zpig4",
-"sounds/mob/zombiepig/zpigangry1",
-"sounds/mob/zombiepig/zpigangry2",
-"sounds/mob/zombiepig/zpigangry3",
-"sounds/mob/zombiepig/zpigangry4",
-"sounds/mob/zombiepig/zpigdeath",
-"sounds/mob/zombiepig/zpighurt1",
-"sounds/mob/zombiepig/zpighurt2",
-"sounds/music/game/aerie",
-"sounds/music/game/an_ordinary_day",
-"sounds/music/game/ancestry",
-"sounds/music/game/below_and_above",
-"sounds/music/game/broken_clocks",
-"sounds/music/game/bromeliad",
-"sounds/music/game/calm1",
-"sounds/music/game/calm2",
-"sounds/music/game/calm3",
-"sounds/music/game/comforting_memories",
-"sounds/music/game/creative/creative1",
-"sounds/music/game/creative/creative2",
-"sounds/music/game/creative/creative3",
-"sounds/music/game/creative/creative4",
-"sounds/music/game/creative/creative5",
-"sounds/music/game/creative/creative6",
-"sounds/music/game/crescent_dunes",
-"sounds/music/game/deeper",
-"sounds/music/game/echo_in_the_wind",
-"sounds/music/game/eld_unknown",
-"sounds/music/game/end/boss",
-"sounds/music/game/end/credits",
-"sounds/music/game/end/end",
-"sounds/music/game/endless",
-"sounds/music/game/featherfall",
-"sounds/music/game/firebugs",
-"sounds/music/game/fireflies",
-"sounds/music/game/floating_dream",
-"sounds/music/game/hal1",
-"sounds/music/game/hal2",
-"sounds/music/game/hal3",
-"sounds/music/game/hal4",
-"sounds/music/game/infinite_amethyst",
-"sounds/music/game/komorebi",
-"sounds/music/game/labyrinthine",
-"sounds/music/game/left_to_bloom",
-"sounds/music/game/lilypad",
-"sounds/music/game/nether/chrysopoeia",
-"sounds/music/game/nether/nether1",
-"sounds/music/game/nether/nether2",
-"sounds/music/game/nether/nether3",
-"sounds/music/game/nether/nether4",
-"sounds/music/game/nether/rubedo",
-"sounds/music/game/nether/so_below",
-"sounds/music/game/nuance1",
-"sounds/music/game/nuance2",
-"sounds/music/game/one_more_day",
-"sounds/music/game/os_piano",
-"sounds/music/game/piano1",
-"sounds/music/game/piano2",
-"sounds/music/game/piano3",
-"sounds/music/game/pokopoko",
-"sounds/music/game/puzzlebox",
-"sounds/music/game/records/11",
-"sounds/music/game/records/13",
-"sounds/music/game/records/5",
-"sounds/music/game/records/blocks",
-"sounds/music/game/records/cat",
-"sounds/music/game/records/chirp",
-"sounds/music/game/records/creator",
-"sounds/music/game/records/creator_music_box",
-"sounds/music/game/records/far",
-"sounds/music/game/records/lava_chicken",
-"sounds/music/game/records/mall",
-"sounds/music/game/records/mellohi",
-"sounds/music/game/records/otherside",
-"sounds/music/game/records/pigstep_master",
-"sounds/music/game/records/precipice",
-"sounds/music/game/records/relic",
-"sounds/music/game/records/stal",
-"sounds/music/game/records/strad",
-"sounds/music/game/records/tears",
-"sounds/music/game/records/wait",
-"sounds/music/game/records/ward",
-"sounds/music/game/stand_tall",
-"sounds/music/game/watcher",
-"sounds/music/game/water/axolotl",
-"sounds/music/game/water/dragon_fish",
-"sounds/music/game/water/shuniji",
-"sounds/music/game/wending",
-"sounds/music/game/yakusoku",
-"sounds/music/menu/menu1",
-"sounds/music/menu/menu2",
-"sounds/music/menu/menu3",
-"sounds/music/menu/menu4",
-"sounds/note/banjo",
-"sounds/note/bass",
-"sounds/note/bassattack",
-"sounds/note/bd",
-"sounds/note/bell",
-"sounds/note/bit",
-"sounds/note/cow_bell",
-"sounds/note/didgeridoo",
-"sounds/note/flute",
-"sounds/note/guitar",
-"sounds/note/harp",
-"sounds/note/hat",
-"sounds/note/icechime",
-"sounds/note/iron_xylophone",
-"sounds/note/pling",
-"sounds/note/snare",
-"sounds/note/xylobone",
-"sounds/particle/soulspeed1",
-"sounds/particle/soulspeed10",
-"sounds/particle/soulspeed11",
-"sounds/particle/soulspeed12",
-"sounds/particle/soulspeed13",
-"sounds/particle/soulspeed2",
-"sounds/particle/soulspeed3",
-"sounds/particle/soulspeed4",
-"sounds/particle/soulspeed5",
-"sounds/particle/soulspeed6",
-"sounds/particle/soulspeed7",
-"sounds/particle/soulspeed8",
-"sounds/particle/soulspeed9",
-"sounds/portal/portal",
-"sounds/portal/travel",
-"sounds/portal/trigger",
-"sounds/random/anvil_break",
-"sounds/random/anvil_land",
-"sounds/random/anvil_use",
-"sounds/random/bow",
-"sounds/random/bowhit1",
-"sounds/random/bowhit2",
-"sounds/random/bowhit3",
-"sounds/random/bowhit4",
-"sounds/random/break",
-"sounds/random/burp",
-"sounds/random/chestclosed",
-"sounds/random/chestopen",
-"sounds/random/click",
-"sounds/random/door_close",
-"sounds/random/door_open",
-"sounds/random/drink",
-"sounds/random/drink_honey1",
-"sounds/random/drink_honey2",
-"sounds/random/drink_honey3",
-"sounds/random/eat1",
-"sounds/random/eat2",
-"sounds/random/eat3",
-"sounds/random/explode1",
-"sounds/random/explode2",
-"sounds/random/explode3",
-"sounds/random/explode4",
-"sounds/random/fizz",
-"sounds/random/fuse",
-"sounds/random/glass1",
-"sounds/random/glass2",
-"sounds/random/glass3",
-"sounds/random/happy_cam3",
-"sounds/random/hurt",
-"sounds/random/levelup",
-"sounds/random/orb",
-"sounds/random/pop",
-"sounds/random/pop2",
-"sounds/random/smithing_table1",
-"sounds/random/smithing_table2",
-"sounds/random/smithing_table3",
-"sounds/random/splash",
-"sounds/random/swim1",
-"sounds/random/swim2",
-"sounds/random/swim3",
-"sounds/random/swim4",
-"sounds/random/toast",
-"sounds/random/toast_recipe_unlocking_in",
-"sounds/random/toast_recipe_unlocking_out",
-"sounds/random/use_totem",
-"sounds/random/wood_click",
-"sounds/step/ancient_debris1",
-"sounds/step/ancient_debris2",
-"sounds/step/ancient_debris3",
-"sounds/step/ancient_debris4",
-"sounds/step/ancient_debris5",
-"sounds/step/basalt1",
-"sounds/step/basalt2",
-"sounds/step/basalt3",
-"sounds/step/basalt4",
-"sounds/step/basalt5",
-"sounds/step/basalt6",
-"sounds/step/bone_block1",
-"sounds/step/bone_block2",
-"sounds/step/bone_block3",
-"sounds/step/bone_block4",
-"sounds/step/bone_block5",
-"sounds/step/chain1",
-"sounds/step/chain2",
-"sounds/step/chain3",
-"sounds/step/chain4",
-"sounds/step/chain5",
-"sounds/step/chain6",
-"sounds/step/cloth1",
-"sounds/step/cloth2",
-"sounds/step/cloth3",
-"sounds/step/cloth4",
-"sounds/step/coral1",
-"sounds/step/coral2",
-"sounds/step/coral3",
-"sounds/step/coral4",
-"sounds/step/coral5",
-"sounds/step/coral6",
-"sounds/step/grass1",
-"sounds/step/grass2",
-"sounds/step/grass3",
-"sounds/step/grass4",
-"sounds/step/grass5",
-"sounds/step/grass6",
-"sounds/step/gravel1",
-"sounds/step/gravel2",
-"sounds/step/gravel3",
-"sounds/step/gravel4",
-"sounds/step/honey_block1",
-"sounds/step/honey_block2",
-"sounds/step/honey_block3",
-"sounds/step/honey_block4",
-"sounds/step/honey_block5",
-"sounds/step/ladder1",
-"sounds/step/ladder2",
-"sounds/step/ladder3",
-"sounds/step/ladder4",
-"sounds/step/ladder5",
-"sounds/step/nether_brick1",
-"sounds/step/nether_brick2",
-"sounds/step/nether_brick3",
-"sounds/step/nether_brick4",
-"sounds/step/nether_brick5",
-"sounds/step/nether_brick6",
-"sounds/step/nether_gold_ore1",
-"sounds/step/nether_gold_ore2",
-"sounds/step/nether_gold_ore3",
-"sounds/step/nether_gold_ore4",
-"sounds/step/nether_gold_ore5",
-"sounds/step/nether_sprouts1",
-"sounds/step/nether_sprouts2",
-"sounds/step/nether_sprouts3",
-"sounds/step/nether_sprouts4",
-"sounds/step/nether_sprouts5",
-"sounds/step/nether_wart1",
-"sounds/step/nether_wart2",
-"sounds/step/nether_wart3",
-"sounds/step/nether_wart4",
-"sounds/step/nether_wart5",
-"sounds/step/netherite1",
-"sounds/step/netherite2",
-"sounds/step/netherite3",
-"sounds/step/netherite4",
-"sounds/step/netherite5",
-"sounds/step/netherite6",
-"sounds/step/netherrack1",
-"sounds/step/netherrack2",
-"sounds/step/netherrack3",
-"sounds/step/netherrack4",
-"sounds/step/netherrack5",
-"sounds/step/netherrack6",
-"sounds/step/nylium1",
-"sounds/step/nylium2",
-"sounds/step/nylium3",
-"sounds/step/nylium4",
-"sounds/step/nylium5",
-"sounds/step/nylium6",
-"sounds/step/roots1",
-"sounds/step/roots2",
-"sounds/step/roots3",
-"sounds/step/roots4",
-"sounds/step/roots5",
-"sounds/step/sand1",
-"sounds/step/sand2",
-"sounds/step/sand3",
-"sounds/step/sand4",
-"sounds/step/sand5",
-"sounds/step/scaffold1",
-"sounds/step/scaffold2",
-"sounds/step/scaffold3",
-"sounds/step/scaffold4",
-"sounds/step/scaffold5",
-"sounds/step/scaffold6",
-"sounds/step/scaffold7",
-"sounds/step/shroomlight1",
-"sounds/step/shroomlight2",
-"sounds/step/shroomlight3",
-"sounds/step/shroomlight4",
-"sounds/step/shroomlight5",
-"sounds/step/shroomlight6",
-"sounds/step/snow1",
-"sounds/step/snow2",
-"sounds/step/snow3",
-"sounds/step/snow4",
-"sounds/step/soul_sand1",
-"sounds/step/soul_sand2",
-"sounds/step/soul_sand3",
-"sounds/step/soul_sand4",
-"sounds/step/soul_sand5",
-"sounds/step/soul_soil1",
-"sounds/step/soul_soil2",
-"sounds/step/soul_soil3",
-"sounds/step/soul_soil4",
-"sounds/step/soul_soil5",
-"sounds/step/stem1",
-"sounds/step/stem2",
-"sounds/step/stem3",
-"sounds/step/stem4",
-"sounds/step/stem5",
-"sounds/step/stem6",
-"sounds/step/stone1",
-"sounds/step/stone2",
-"sounds/step/stone3",
-"sounds/step/stone4",
-"sounds/step/stone5",
-"sounds/step/stone6",
-"sounds/step/vines1",
-"sounds/step/vines2",
-"sounds/step/vines3",
-"sounds/step/vines4",
-"sounds/step/vines5",
-"sounds/step/wood1",
-"sounds/step/wood2",
-"sounds/step/wood3",
-"sounds/step/wood4",
-"sounds/step/wood5",
-"sounds/step/wood6",
-"sounds/tile/piston/in",
-"sounds/tile/piston/out",
-"sounds/ui/cartography_table/drawmap1",
-"sounds/ui/cartography_table/drawmap2",
-"sounds/ui/cartography_table/drawmap3",
-"sounds/ui/drawer/drawer_close",
-"sounds/ui/drawer/drawer_open",
-"sounds/ui/hardcore/hardcore_disable",
-"sounds/ui/hardcore/hardcore_enable",
-"sounds/ui/loom/select_pattern1",
-"sounds/ui/loom/select_pattern2",
-"sounds/ui/loom/select_pattern3",
-"sounds/ui/loom/select_pattern4",
-"sounds/ui/loom/select_pattern5",
-"sounds/ui/loom/take_result1",
-"sounds/ui/loom/take_result2",
-"sounds/ui/stonecutter/cut1",
-"sounds/ui/stonecutter/cut2",
-"sounds/vr/turn1",
-"sounds/vr/turn2",
-"sounds/vr/turn3",
-"sounds/vr/turn4",
-"sounds/vr/turn5",
-]
\ No newline at end of file
@@ -0,0 +1,182 @@
+import os
+import threading
+import weakref
+
+import data
+import documents
+import incremental
+import instrumentation
+import pack_index
+import utils
+import verbose_json
+
+
+def read_identifier(text, root_prefix):
+    """Return {"id": identifier, "type": root field} or {"unsupported":
+    types} for the text of a definition whose root field starts with
+    `root_prefix`. Raises if it isn't a valid definition.
+
+    The file is only scanned up to `description.identifier`, everything else
+    is skipped.
+    """
+    reader = verbose_json.StringReader(text)
+    verbose_json.skipWhitespace(reader)
+    other_types = []
+    for name in verbose_json.iterFields(reader):
+        if name.startswith(root_prefix):
+            for field in verbose_json.iterFields(reader):
+                if field != "description":
+                    verbose_json.skipValue(reader)
+                    continue
+                for description_field in verbose_json.iterFields(reader):
+                    if description_field == "identifier":
+                        identifier = verbose_json.readString(reader)
+                        if identifier is not None:
+                            return {"id": identifier, "type": name}
+                    verbose_json.skipValue(reader)
+            raise Exception(f"{name} has no description.identifier")
+        if name.startswith("minecraft:"):
+            other_types.append(name)
+        verbose_json.skipValue(reader)
+    return {"unsupported": other_types}
+
+
+def read_identifier_of_file(path, root_prefix):
+    """Like `read_identifier`, but returns {"error": message} instead of
+    raising, so that a pool can go on with the other files."""
+    try:
+        # Decoding the bytes at once is faster than a text mode file
+        with open(path, "rb") as f:
+            return read_identifier(f.read().decode("utf8"), root_prefix)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def read_identifier_of_document(path, root_prefix, stat=None):
+    """Like `read_identifier_of_file`, but reads the file through the shared
+    document cache, so that other checks don't read it again."""
+    try:
+        return read_identifier(documents.cache.get_text(path, stat), root_prefix)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def read_identifiers_of_files(paths, root_prefixes, total_size, workers=None, stats=None):
+    """Return the identifier of each of the files, in the same order, like
+    `read_identifier_of_file`.
+
+    When there is enough to read, the files are parsed on a pool of `workers`
+    processes (None means one per CPU). Otherwise they are read through the
+    document cache. `stats` are the stats of the files, if already known.
+    """
+    if stats is None:
+        stats = [None] * len(paths)
+    workers = utils.process_pool_size(len(paths), total_size, workers)
+    if workers <= 1:
+        return [
+            read_identifier_of_document(path, root_prefix, stat)
+            for path, root_prefix, stat in zip(paths, root_prefixes, stats)
+        ]
+    # Definitions are small, so they are sent to the workers in batches
+    results = utils.map_on_processes(
+        read_identifier_of_file,
+        workers,
+        paths,
+        root_prefixes,
+        chunksize=max(1, len(paths) // (workers * 4)),
+    )
+    for path, stat in zip(paths, stats):
+        instrumentation.record_read(
+            stat.st_size if stat is not None else os.path.getsize(path)
+        )
+    return results
+
+
+class IdentifierRegistry(object):
+    """Identifiers of the definitions of a behavior pack.
+
+    Each kind of definition (a folder of `data.BP_DEFINITIONS`) has its own
+    identifiers, mapped to the file that defines them first, so lookups are
+    a single dict access.
+    """
+
+    def __init__(self):
+        # kind -> {identifier: first file defining it}
+        self.identifiers = {kind: {} for kind in data.BP_DEFINITIONS}
+        # kind -> [(file, result of read_identifier_of_file)], in pack order
+        self.files = {kind: [] for kind in data.BP_DEFINITIONS}
+        # (kind, identifier, first file, file) of each repeated definition
+        self.collisions = []
+
+    def add(self, kind, file, result):
+        self.files[kind].append((file, result))
+        identifier = result.get("id")
+        if identifier is None:
+            return
+        first = self.identifiers[kind].setdefault(identifier, file)
+        if first != file:
+            self.collisions.append((kind, identifier, first, file))
+
+    def exists(self, kind, identifier):
+        return identifier in self.identifiers[kind]
+
+    def first_file(self, kind, identifier):
+        """Return the file defining the identifier first, or None."""
+        return self.identifiers[kind].get(identifier)
+
+
+def build(root="BP", workers=None):
+    """Read the identifiers of all definitions of the pack at `root`. With
+    the incremental cache, unchanged files aren't read again."""
+    index = pack_index.get(root)
+    registry = IdentifierRegistry()
+    files = []
+    results = {}
+    unread = []
+    unread_size = 0
+    for kind, root_prefix in data.BP_DEFINITIONS.items():
+        for file in index.files_with_extension(["json"], os.path.join(root, kind)):
+            files.append((kind, file))
+            result = incremental.cache.get("identifiers", file, index.stat(file))
+            if result is None:
+                unread.append((file, root_prefix))
+                unread_size += index.stat(file).st_size
+            else:
+                results[file] = result
+    read_results = read_identifiers_of_files(
+        [file for file, root_prefix in unread],
+        [root_prefix for file, root_prefix in unread],
+        unread_size,
+        workers,
+        [index.stat(file) for file, root_prefix in unread],
+    )
+    for (file, root_prefix), result in zip(unread, read_results):
+        # Failures aren't cached, so that they are reported again
+        if "error" not in result:
+            incremental.cache.put("identifiers", file, index.stat(file), result)
+        results[file] = result
+    for kind, file in files:
+        registry.add(kind, file, results[file])
+    return registry
+
+
+# PackIndex -> IdentifierRegistry built from it
+_registries = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get(root="BP", workers=None):
+    """Return the shared registry of the pack at `root`, building it on first
+    use. It is rebuilt along with the pack index after `pack_index.clear`."""
+    index = pack_index.get(root)
+    with _lock:
+        registry = _registries.get(index)
+        if registry is None:
+            registry = build(root, workers)
+            _registries[index] = registry
+    return registry
+
+
+def clear():
+    with _lock:
+        _registries.clear()
@@ -0,0 +1,83 @@
+import json
+import threading
+
+import utils
+
+CACHE_VERSION = 5
+
+
+class ResultCache(object):
+    """Per-file check results of the previous run.
+
+    Results are stored per check and are keyed by the file path. They are only
+    reused when the size and modification time of the file didn't change.
+    Results must be JSON serializable and must not be None. Without a `path`
+    the cache is disabled: nothing is loaded and nothing is stored.
+    """
+
+    def __init__(self, path=None, fingerprint=None):
+        self.path = path
+        self.fingerprint = fingerprint
+        # check name -> {file path: [size, mtime_ns, result]}
+        self.previous = {}
+        self.current = {}
+        self.lock = threading.Lock()
+        if path is not None:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(cached, dict):
+            return
+        if cached.get("version") != CACHE_VERSION:
+            return
+        if cached.get("fingerprint") != self.fingerprint:
+            return
+        self.previous = cached.get("checks", {})
+
+    def get(self, check, file, stat):
+        """Return the cached result for an unchanged file, otherwise None."""
+        if self.path is None:
+            return None
+        with self.lock:
+            entry = self.previous.get(check, {}).get(file)
+            if entry is None:
+                return None
+            if entry[0] != stat.st_size or entry[1] != stat.st_mtime_ns:
+                return None
+            self.current.setdefault(check, {})[file] = entry
+            return entry[2]
+
+    def put(self, check, file, stat, result):
+        if self.path is None:
+            return
+        with self.lock:
+            self.current.setdefault(check, {})[file] = [
+                stat.st_size,
+                stat.st_mtime_ns,
+                result,
+            ]
+
+    def save(self):
+        """Write the results of this run. Results of checks that didn't run
+        are kept, entries of files no longer seen by a check are dropped."""
+        if self.path is None:
+            return
+        with self.lock:
+            checks = dict(self.previous)
+            checks.update(self.current)
+            content = json.dumps(
+                {
+                    "version": CACHE_VERSION,
+                    "fingerprint": self.fingerprint,
+                    "checks": checks,
+                }
+            )
+        utils.write_text_atomic(self.path, content)
+
+
+cache = ResultCache()
@@ -0,0 +1,122 @@
+import cProfile
+import os
+import threading
+import time
+import tracemalloc
+
+_local = threading.local()
+
+
+class CheckStats(object):
+    """Resources used by a single check."""
+
+    def __init__(self, name):
+        self.name = name
+        self.wall_time = 0.0
+        # CPU time of the thread running the check. Work the check hands to
+        # other threads or processes isn't included.
+        self.cpu_time = 0.0
+        self.files_read = 0
+        self.bytes_read = 0
+        # Peak of memory allocated by the check, only known when profiling
+        self.peak_memory = None
+
+    def to_dict(self):
+        return {
+            "seconds": round(self.wall_time, 6),
+            "cpu_seconds": round(self.cpu_time, 6),
+            "files_read": self.files_read,
+            "bytes_read": self.bytes_read,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class Instrumentation(object):
+    """Measures checks. With a `profile_path`, each check also runs under
+    cProfile, its statistics are written to `<profile_path>/<check>.prof`,
+    and its peak memory is traced. Both are process-wide, so profiled checks
+    must not run concurrently."""
+
+    def __init__(self, profile_path=None):
+        self.profile_path = profile_path
+
+    def measure(self, name):
+        return _Measurement(self, name)
+
+
+class _Measurement(object):
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.stats = CheckStats(name)
+        self.profiler = None
+
+    def __enter__(self):
+        _local.stats = self.stats
+        if self.instrumentation.profile_path is not None:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self.memory_start = tracemalloc.get_traced_memory()[0]
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+        return self.stats
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stats.wall_time = time.perf_counter() - self.wall_start
+        self.stats.cpu_time = time.thread_time() - self.cpu_start
+        _local.stats = None
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.stats.peak_memory = max(
+                0, tracemalloc.get_traced_memory()[1] - self.memory_start
+            )
+            profile_path = self.instrumentation.profile_path
+            os.makedirs(profile_path, exist_ok=True)
+            self.profiler.dump_stats(
+                os.path.join(profile_path, self.stats.name + ".prof")
+            )
+        return False
+
+
+def record_read(size):
+    """Count a file of `size` bytes as read by the running check."""
+    stats = getattr(_local, "stats", None)
+    if stats is not None:
+        stats.files_read += 1
+        stats.bytes_read += size
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_table(stats):
+    """Return a table of the stats of each check, slowest first."""
+    rows = [("check", "wall", "cpu", "files", "read", "peak memory")]
+    for s in sorted(stats, key=lambda s: s.wall_time, reverse=True):
+        rows.append(
+            (
+                s.name,
+                f"{s.wall_time:.3f} s",
+                f"{s.cpu_time:.3f} s",
+                str(s.files_read),
+                format_size(s.bytes_read),
+                "-" if s.peak_memory is None else format_size(s.peak_memory),
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+        cells = [row[0].ljust(widths[0])]
+        cells.extend(cell.rjust(width) for cell, width in zip(row[1:], widths[1:]))
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
+
+
+current = Instrumentation()
@@ -0,0 +1,95 @@
+import utils
+
+
+def read_lang_keys(path):
+    """Return the keys of a .lang file in order, reading it line by line.
+
+    Comments, blank lines and lines without a `=` are skipped.
+    """
+    keys = []
+    with open(path, "r", encoding="utf8") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            key, separator, value = line.partition("=")
+            if separator:
+                keys.append(key)
+    return keys
+
+
+def read_lang_keys_of_files(paths, total_size, workers=None):
+    """Return the keys of each of the files, in the same order.
+
+    Parsing is CPU-bound, so when there is enough to read the files are
+    parsed on a pool of `workers` processes (None means one per CPU).
+    """
+    workers = utils.process_pool_size(len(paths), total_size, workers)
+    if workers <= 1:
+        return [read_lang_keys(path) for path in paths]
+    return [
+        joined.split("\n") if count > 0 else []
+        for count, joined in utils.map_on_processes(_read_joined_lang_keys, workers, paths)
+    ]
+
+
+def _read_joined_lang_keys(path):
+    # One string pickles much faster than a list of thousands. Keys can't
+    # contain a line break.
+    keys = read_lang_keys(path)
+    return len(keys), "\n".join(keys)
+
+
+# Turns a byte per key into the binary digits of a bitset
+_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+class TranslationMatrix(object):
+    """Which language files define which translation keys.
+
+    Keys are interned to indices in the order they are first seen. Each
+    language is a bitset (a Python int) of the indices of its keys, so the
+    keys missing from a language are a single `all_keys & ~bitset`.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.key_ids = {}
+        # language -> bitset of key indices
+        self.languages = {}
+
+    def add(self, language, keys):
+        key_ids = self.key_ids
+        for key in keys:
+            if key not in key_ids:
+                key_ids[key] = len(self.keys)
+                self.keys.append(key)
+        # Setting the bits of an int one by one would copy it for every key,
+        # so set a byte per key and convert them in one go
+        flags = bytearray(len(self.keys))
+        for key_id in map(key_ids.__getitem__, keys):
+            flags[key_id] = 1
+        bitset = 0
+        if len(flags) > 0:
+            bitset = int(flags[::-1].translate(_DIGITS), 2)
+        self.languages[language] = self.languages.get(language, 0) | bitset
+
+    def missing_bitset(self, language):
+        all_keys = (1 << len(self.keys)) - 1
+        return all_keys & ~self.languages.get(language, 0)
+
+    def missing_count(self, language):
+        return bin(self.missing_bitset(language)).count("1")
+
+    def missing(self, language, limit=None):
+        """Return the keys missing from a language, in the order they were
+        first seen. Stops after `limit` keys."""
+        # Binary digits from the lowest bit, so that digit i is key i
+        digits = bin(self.missing_bitset(language))[:1:-1]
+        missing = []
+        key_id = digits.find("1")
+        while key_id != -1:
+            if limit is not None and len(missing) >= limit:
+                break
+            missing.append(self.keys[key_id])
+            key_id = digits.find("1", key_id + 1)
+        return missing
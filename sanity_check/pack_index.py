@@ -0,0 +1,137 @@
+import os
+import threading
+
+
+class PackIndex(object):
+    """Snapshot of a pack's file tree, built with a single ``os.scandir`` walk.
+
+    Checks query the index instead of the file system, so each pack is walked
+    once per run no matter how many checks inspect it. Paths are keyed the same
+    way ``os.path.join(root, ...)`` builds them, so callers can keep passing
+    the paths they already construct.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.normpath(root)
+        # directory path -> sorted list of subdirectory names
+        self.directories = {}
+        # directory path -> {file name: os.DirEntry}
+        self.files = {}
+        # lower-case extension (with the dot) -> list of file paths
+        self.extensions = {}
+        # file path -> stat result of files rewritten after the scan
+        self.updated = {}
+        self._scan()
+
+    def _scan(self):
+        stack = [self.root]
+        while len(stack) > 0:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            dirs = []
+            files = {}
+            scanned_dirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                    # Like os.walk, symlinked directories are listed but not
+                    # scanned, so links out of the pack or loops aren't followed
+                    is_link = is_dir and not entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    dirs.append(entry.name)
+                    if is_link:
+                        self.directories[entry.path] = []
+                        self.files[entry.path] = {}
+                    else:
+                        scanned_dirs.append(entry.path)
+                else:
+                    files[entry.name] = entry
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    self.extensions.setdefault(ext, []).append(entry.path)
+            self.directories[directory] = dirs
+            self.files[directory] = files
+            # Reversed, so that directories are visited in sorted order
+            stack.extend(reversed(scanned_dirs))
+
+    def isdir(self, path):
+        return os.path.normpath(path) in self.directories
+
+    def isfile(self, path):
+        return self.entry(path) is not None
+
+    def exists(self, path):
+        return self.isdir(path) or self.isfile(path)
+
+    def entry(self, path):
+        """Return the cached ``os.DirEntry`` of a file, or None."""
+        parent, name = os.path.split(os.path.normpath(path))
+        return self.files.get(parent, {}).get(name)
+
+    def stat(self, path):
+        """Return the stat result of a file. ``os.DirEntry`` caches it."""
+        updated = self.updated.get(os.path.normpath(path))
+        if updated is not None:
+            return updated
+        entry = self.entry(path)
+        if entry is None:
+            raise FileNotFoundError(path)
+        return entry.stat()
+
+    def update(self, path):
+        """Refresh the stat result of a file after a check rewrote it."""
+        self.updated[os.path.normpath(path)] = os.stat(path)
+
+    def list_dirs(self, path):
+        return list(self.directories.get(os.path.normpath(path), []))
+
+    def list_files(self, path):
+        return list(self.files.get(os.path.normpath(path), {}).keys())
+
+    def files_with_extension(self, extensions, path=None):
+        """Return all files with one of the extensions, optionally limited to
+        the subtree under ``path``."""
+        prefix = None
+        if path is not None:
+            prefix = os.path.normpath(path) + os.path.sep
+        matching_files = []
+        for ext in extensions:
+            ext = ext.lower()
+            if not ext.startswith("."):
+                ext = "." + ext
+            for f in self.extensions.get(ext, []):
+                if prefix is None or f.startswith(prefix):
+                    matching_files.append(f)
+        return matching_files
+
+
+_indexes = {}
+_locks = {}
+_lock = threading.Lock()
+
+
+def get(root):
+    """Return the shared index for a pack root, building it on first use.
+
+    Safe to call from several threads; each root is only scanned once.
+    """
+    key = (os.getcwd(), os.path.normpath(root))
+    with _lock:
+        lock = _locks.setdefault(key, threading.Lock())
+    with lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = PackIndex(root)
+            _indexes[key] = index
+    return index
+
+
+def clear():
+    with _lock:
+        _indexes.clear()
+        _locks.clear()
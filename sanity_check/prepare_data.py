@@ -3,6 +3,8 @@ import json
 import sys
 from pathlib import Path
 
+import references
+
 repo_dir = Path("bedrock-samples")
 
 if not repo_dir.is_dir():
@@ -28,8 +30,7 @@ else:
         print(f"Git pull failed: {e}", file=sys.stderr)
         # continue — repo may be fine even if pull failed
 
-generated_data = ""
-output_path = Path("generated_data.py")
+output_path = Path("vanilla_sounds.txt")
 
 # Path to sound definitions
 sound_file = repo_dir / "resource_pack" / "sounds" / "sound_definitions.json"
@@ -65,9 +66,38 @@ else:
 
 print(f"Collected {len(all_sounds)} sounds from {sound_file}")
 
-generated_data += "vanilla_sounds = ["
-for sound in sorted(all_sounds):
-    generated_data += "\n\"" + sound + "\","
-generated_data += "\n]"
+# One sorted path per line. The catalogue is only read by find_missing_sounds,
+# see data.vanilla_sounds()
+output_path.write_text("".join(sound + "\n" for sound in sorted(all_sounds)), encoding="utf-8")
+
+# Definitions and asset paths of the vanilla packs, which packs use without
+# defining them. Indexed like the packs themselves, see references.build().
+# The catalogue is only read by find_dangling_references, see
+# data.vanilla_references()
+vanilla_packs = {
+    "BP": repo_dir / "behavior_pack",
+    "RP": repo_dir / "resource_pack",
+}
+all_references = set()
+for pack, folder, index_file in references.INDEXED_FOLDERS:
+    for path in sorted((vanilla_packs[pack] / folder).rglob("*.json")):
+        try:
+            definitions, _ = index_file(json.loads(path.read_text(encoding="utf-8")))
+        except ValueError as e:
+            print(f"Skipping {path}: {e}", file=sys.stderr)
+            continue
+        for kind, identifier in definitions:
+            all_references.add((kind, identifier))
+for pack, folder, kind, extensions, keep_extension in references.PATH_DEFINITIONS:
+    for path in sorted((vanilla_packs[pack] / folder).rglob("*")):
+        if path.is_file() and path.suffix.lower() in extensions:
+            relative_path = path.relative_to(vanilla_packs[pack]).as_posix()
+            all_references.add((kind, references.path_definition(relative_path, keep_extension)))
+
+print(f"Collected {len(all_references)} vanilla definitions from {repo_dir}")
 
-output_path.write_text(generated_data, encoding="utf-8")
\ No newline at end of file
+# One "kind<TAB>identifier" per line
+Path("vanilla_references.txt").write_text(
+    "".join(f"{kind}\t{identifier}\n" for kind, identifier in sorted(all_references)),
+    encoding="utf-8",
+)
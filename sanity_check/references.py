@@ -0,0 +1,384 @@
+import os
+import threading
+import weakref
+
+import data
+import documents
+import incremental
+import pack_index
+from utils import json_pointer
+
+KIND_NAMES = {
+    "entity": "entity",
+    "animation": "animation",
+    "animation_controller": "animation controller",
+    "client_animation": "client animation",
+    "client_animation_controller": "client animation controller",
+    "render_controller": "render controller",
+    "geometry": "geometry",
+    "loot_table": "loot table",
+    "trade_table": "trade table",
+    "texture": "texture",
+}
+
+# Kinds that are only referenced from the files indexed here, so that a
+# definition nothing points to is really unused. Textures and loot tables are
+# also used by items, UI, commands and so on.
+UNREACHABLE_KINDS = [
+    "animation",
+    "animation_controller",
+    "client_animation",
+    "client_animation_controller",
+    "render_controller",
+    "geometry",
+    "trade_table",
+]
+
+TEXTURE_EXTENSIONS = [".png", ".tga", ".jpg", ".jpeg"]
+
+# Components of entities referencing a table by path
+ENTITY_TABLES = [
+    ("minecraft:loot", "loot_table"),
+    ("minecraft:equipment", "loot_table"),
+    ("minecraft:trade_table", "trade_table"),
+    ("minecraft:economy_trade_table", "trade_table"),
+]
+
+
+class ReferenceGraph(object):
+    """Definitions of a behavior and resource pack, and the references
+    between them.
+
+    Definitions are (kind, identifier) nodes, mapped to the file defining
+    them first, and references are edges from a file to a node. Finding
+    dangling references and unreachable definitions is a single pass over
+    the edges with dict and set lookups. References to `vanilla` identifiers
+    (kind -> set of identifiers) aren't dangling.
+    """
+
+    def __init__(self, vanilla=None):
+        # kind -> {identifier: first file defining it}
+        self.definitions = {kind: {} for kind in KIND_NAMES}
+        self.vanilla = vanilla if vanilla is not None else {}
+        # (kind, identifier, file, JSON pointer), in pack order
+        self.references = []
+
+    def add_definition(self, kind, identifier, file):
+        self.definitions[kind].setdefault(identifier, file)
+
+    def add_reference(self, kind, identifier, file, pointer=None):
+        self.references.append((kind, identifier, file, pointer))
+
+    def exists(self, kind, identifier):
+        return identifier in self.definitions[kind]
+
+    def dangling(self):
+        """Return the references to identifiers that neither the packs nor
+        the vanilla packs define."""
+        return [
+            reference
+            for reference in self.references
+            if reference[1] not in self.definitions[reference[0]]
+            and reference[1] not in self.vanilla.get(reference[0], ())
+        ]
+
+    def unreachable(self, kinds=UNREACHABLE_KINDS):
+        """Return (kind, identifier, file) of the definitions of `kinds` that
+        no reference points to."""
+        referenced = {kind: set() for kind in kinds}
+        for kind, identifier, file, pointer in self.references:
+            if kind in referenced:
+                referenced[kind].add(identifier)
+        unreachable = []
+        for kind in kinds:
+            for identifier, file in self.definitions[kind].items():
+                if identifier not in referenced[kind]:
+                    unreachable.append((kind, identifier, file))
+        return unreachable
+
+
+def _object(parent, key):
+    """Return the object in a field, or an empty one if it isn't an object."""
+    value = parent.get(key) if isinstance(parent, dict) else None
+    return value if isinstance(value, dict) else {}
+
+
+def _list(parent, key):
+    value = parent.get(key) if isinstance(parent, dict) else None
+    return value if isinstance(value, list) else []
+
+
+def _animation_kind(identifier, client):
+    controller = identifier.startswith("controller.animation.")
+    if client:
+        return "client_animation_controller" if controller else "client_animation"
+    return "animation_controller" if controller else "animation"
+
+
+def _path(reference):
+    return reference.replace("\\", "/")
+
+
+def path_definition(path, keep_extension):
+    """Return the identifier of a file referenced by its path from the pack
+    root, `path` using slashes."""
+    if keep_extension:
+        return path
+    return os.path.splitext(path)[0]
+
+
+def _texture_path(reference):
+    path = _path(reference)
+    name, ext = os.path.splitext(path)
+    if ext.lower() in TEXTURE_EXTENSIONS:
+        return name
+    return path
+
+
+def _index_animations(tree, client):
+    definitions = []
+    for key in ("animations", "animation_controllers"):
+        for identifier in _object(tree, key):
+            definitions.append([_animation_kind(identifier, client), identifier])
+    return definitions, []
+
+
+def _index_entity(tree):
+    definitions = []
+    references = []
+    entity = _object(tree, "minecraft:entity")
+    description = _object(entity, "description")
+    identifier = description.get("identifier")
+    if isinstance(identifier, str):
+        definitions.append(["entity", identifier])
+    for name, animation in _object(description, "animations").items():
+        if isinstance(animation, str):
+            references.append(
+                [
+                    _animation_kind(animation, False),
+                    animation,
+                    json_pointer(("minecraft:entity", "description", "animations", name)),
+                ]
+            )
+    groups = [(("minecraft:entity", "components"), _object(entity, "components"))]
+    for name, group in _object(entity, "component_groups").items():
+        if isinstance(group, dict):
+            groups.append((("minecraft:entity", "component_groups", name), group))
+    for keys, components in groups:
+        for component, kind in ENTITY_TABLES:
+            table = _object(components, component).get("table")
+            if isinstance(table, str):
+                references.append(
+                    [kind, _path(table), json_pointer(keys + (component, "table"))]
+                )
+    return definitions, references
+
+
+def _index_client_entity(tree, root):
+    """Index a client entity or an attachable, which share their format."""
+    definitions = []
+    references = []
+    description = _object(_object(tree, root), "description")
+    keys = (root, "description")
+    identifier = description.get("identifier")
+    # A client entity renders the entity of the behavior pack with its
+    # identifier. Attachables use the identifier of an item instead.
+    if isinstance(identifier, str) and root == "minecraft:client_entity":
+        references.append(["entity", identifier, json_pointer(keys + ("identifier",))])
+    for name, animation in _object(description, "animations").items():
+        if isinstance(animation, str):
+            references.append(
+                [
+                    _animation_kind(animation, True),
+                    animation,
+                    json_pointer(keys + ("animations", name)),
+                ]
+            )
+    # Older format versions list controllers separately
+    for i, controllers in enumerate(_list(description, "animation_controllers")):
+        if isinstance(controllers, dict):
+            for name, controller in controllers.items():
+                if isinstance(controller, str):
+                    references.append(
+                        [
+                            "client_animation_controller",
+                            controller,
+                            json_pointer(keys + ("animation_controllers", i, name)),
+                        ]
+                    )
+    for name, geometry in _object(description, "geometry").items():
+        if isinstance(geometry, str):
+            references.append(
+                ["geometry", geometry, json_pointer(keys + ("geometry", name))]
+            )
+    for i, controller in enumerate(_list(description, "render_controllers")):
+        # Either a name, or a name with a condition
+        if isinstance(controller, dict) and len(controller) == 1:
+            controller = next(iter(controller))
+        if isinstance(controller, str):
+            references.append(
+                [
+                    "render_controller",
+                    controller,
+                    json_pointer(keys + ("render_controllers", i)),
+                ]
+            )
+    for name, texture in _object(description, "textures").items():
+        # Attachables can use the item atlas instead of a file
+        if isinstance(texture, str) and not texture.startswith("atlas."):
+            references.append(
+                [
+                    "texture",
+                    _texture_path(texture),
+                    json_pointer(keys + ("textures", name)),
+                ]
+            )
+    return definitions, references
+
+
+def _index_render_controllers(tree):
+    return [["render_controller", i] for i in _object(tree, "render_controllers")], []
+
+
+def _index_geometries(tree):
+    definitions = []
+    references = []
+    for geometry in _list(tree, "minecraft:geometry"):
+        identifier = _object(geometry, "description").get("identifier")
+        if isinstance(identifier, str):
+            definitions.append(["geometry", identifier])
+    # Before format 1.12, geometries are root fields, optionally followed by
+    # the geometry they inherit from: "geometry.child:geometry.parent"
+    for key in tree if isinstance(tree, dict) else ():
+        if key.startswith("geometry."):
+            identifier, separator, parent = key.partition(":")
+            definitions.append(["geometry", identifier])
+            if parent:
+                references.append(["geometry", parent, json_pointer((key,))])
+    return definitions, references
+
+
+def _index_block(tree):
+    references = []
+    block = _object(tree, "minecraft:block")
+    groups = [(("minecraft:block", "components"), _object(block, "components"))]
+    for i, permutation in enumerate(_list(block, "permutations")):
+        groups.append(
+            (
+                ("minecraft:block", "permutations", i, "components"),
+                _object(permutation, "components"),
+            )
+        )
+    for keys, components in groups:
+        geometry = components.get("minecraft:geometry")
+        if isinstance(geometry, dict):
+            geometry = geometry.get("identifier")
+            pointer = json_pointer(keys + ("minecraft:geometry", "identifier"))
+        else:
+            pointer = json_pointer(keys + ("minecraft:geometry",))
+        # Unit cubes and cross shapes are built into the game
+        if isinstance(geometry, str) and geometry.startswith("geometry."):
+            references.append(["geometry", geometry, pointer])
+        loot = components.get("minecraft:loot")
+        if isinstance(loot, str):
+            references.append(
+                ["loot_table", _path(loot), json_pointer(keys + ("minecraft:loot",))]
+            )
+    return [], references
+
+
+def _index_loot_table(tree):
+    references = []
+    for i, pool in enumerate(_list(tree, "pools")):
+        for j, entry in enumerate(_list(pool, "entries")):
+            if not isinstance(entry, dict):
+                continue
+            name = entry.get("name")
+            if entry.get("type") == "loot_table" and isinstance(name, str):
+                references.append(
+                    [
+                        "loot_table",
+                        _path(name),
+                        json_pointer(("pools", i, "entries", j, "name")),
+                    ]
+                )
+    return [], references
+
+
+# Folders of JSON files that are read, with the function returning the
+# definitions and references of a file
+INDEXED_FOLDERS = [
+    ("BP", "entities", _index_entity),
+    ("BP", "blocks", _index_block),
+    ("BP", "animations", lambda tree: _index_animations(tree, False)),
+    ("BP", "animation_controllers", lambda tree: _index_animations(tree, False)),
+    ("BP", "loot_tables", _index_loot_table),
+    ("RP", "entity", lambda tree: _index_client_entity(tree, "minecraft:client_entity")),
+    ("RP", "attachables", lambda tree: _index_client_entity(tree, "minecraft:attachable")),
+    ("RP", "animations", lambda tree: _index_animations(tree, True)),
+    ("RP", "animation_controllers", lambda tree: _index_animations(tree, True)),
+    ("RP", "render_controllers", _index_render_controllers),
+    ("RP", "models", _index_geometries),
+]
+
+# Folders of files that are referenced by their path from the pack root,
+# with their kind, extensions and whether references include the extension
+PATH_DEFINITIONS = [
+    ("BP", "loot_tables", "loot_table", [".json"], True),
+    ("BP", "trading", "trade_table", [".json"], True),
+    ("RP", "textures", "texture", TEXTURE_EXTENSIONS, False),
+]
+
+
+def build():
+    """Index the definitions and references of BP and RP. With the
+    incremental cache, unchanged files aren't read again. Files that can't be
+    decoded are left out, the checks validating them report them."""
+    graph = ReferenceGraph(data.vanilla_references())
+    for pack, folder, index_file in INDEXED_FOLDERS:
+        index = pack_index.get(pack)
+        for file in index.files_with_extension(["json"], os.path.join(pack, folder)):
+            stat = index.stat(file)
+            result = incremental.cache.get("references", file, stat)
+            if result is None:
+                try:
+                    definitions, references = index_file(
+                        documents.cache.get_json(file, stat)
+                    )
+                except Exception:
+                    continue
+                result = {"definitions": definitions, "references": references}
+                incremental.cache.put("references", file, stat, result)
+            for kind, identifier in result["definitions"]:
+                graph.add_definition(kind, identifier, file)
+            for kind, identifier, pointer in result["references"]:
+                graph.add_reference(kind, identifier, file, pointer)
+    for pack, folder, kind, extensions, keep_extension in PATH_DEFINITIONS:
+        index = pack_index.get(pack)
+        for file in index.files_with_extension(extensions, os.path.join(pack, folder)):
+            path = os.path.relpath(file, pack).replace(os.path.sep, "/")
+            graph.add_definition(kind, path_definition(path, keep_extension), file)
+    return graph
+
+
+# BP PackIndex -> (RP PackIndex, ReferenceGraph built from both)
+_graphs = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get():
+    """Return the shared reference graph of BP and RP, building it on first
+    use. It is rebuilt along with the pack indexes after `pack_index.clear`."""
+    bp_index = pack_index.get("BP")
+    rp_index = pack_index.get("RP")
+    with _lock:
+        cached = _graphs.get(bp_index)
+        if cached is None or cached[0] is not rp_index:
+            cached = (rp_index, build())
+            _graphs[bp_index] = cached
+    return cached[1]
+
+
+def clear():
+    with _lock:
+        _graphs.clear()
@@ -0,0 +1,121 @@
+import json
+import os
+
+import diagnostics
+import utils
+
+REPORT_VERSION = 1
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+SARIF_LEVELS = {
+    diagnostics.ERROR: "error",
+    diagnostics.WARNING: "warning",
+    diagnostics.FIX: "note",
+    diagnostics.INFO: "note",
+}
+
+
+def check_timings(results):
+    timings = []
+    for result in results:
+        status = "ok"
+        if result.skipped:
+            status = "skipped"
+        elif result.exception is not None:
+            status = "failed"
+        timing = {"name": result.name, "status": status}
+        timing.update(result.stats.to_dict())
+        timings.append(timing)
+    return timings
+
+
+def build_json(collector, results, failed):
+    """Return the report as a JSON serializable dict."""
+    return {
+        "version": REPORT_VERSION,
+        "failed": failed,
+        "summary": {
+            severity: collector.count(severity)
+            for severity in (
+                diagnostics.ERROR,
+                diagnostics.WARNING,
+                diagnostics.FIX,
+                diagnostics.INFO,
+            )
+        },
+        "findings": [
+            {
+                "rule": d.rule,
+                "severity": d.severity,
+                "file": d.file,
+                "pointer": d.pointer,
+                "message": d.message,
+                "fixed": d.fixed,
+            }
+            for d in collector.diagnostics
+        ],
+        "checks": check_timings(results),
+    }
+
+
+def build_sarif(collector, results, failed):
+    """Return the report as a SARIF 2.1.0 log."""
+    rules = []
+    rule_indexes = {}
+    sarif_results = []
+    for d in collector.diagnostics:
+        rule = d.rule or "sanity_check"
+        if rule not in rule_indexes:
+            rule_indexes[rule] = len(rules)
+            rules.append({"id": rule})
+        result = {
+            "ruleId": rule,
+            "ruleIndex": rule_indexes[rule],
+            "level": SARIF_LEVELS[d.severity],
+            "message": {"text": d.message},
+        }
+        if d.file is not None:
+            location = {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": d.file.replace(os.path.sep, "/")}
+                }
+            }
+            if d.pointer is not None:
+                location["logicalLocations"] = [
+                    {"fullyQualifiedName": d.pointer, "kind": "member"}
+                ]
+            result["locations"] = [location]
+        properties = {"severity": d.severity, "fixed": d.fixed}
+        if d.pointer is not None:
+            properties["pointer"] = d.pointer
+        result["properties"] = properties
+        sarif_results.append(result)
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {"driver": {"name": "sanity_check", "rules": rules}},
+                "invocations": [
+                    {
+                        "executionSuccessful": not failed,
+                        "properties": {"checks": check_timings(results)},
+                    }
+                ],
+                "results": sarif_results,
+            }
+        ],
+    }
+
+
+FORMATS = {"json": build_json, "sarif": build_sarif}
+
+
+def write(path, format, collector, results, failed):
+    """Write the report with a single write, replacing the file atomically."""
+    build = FORMATS.get(format)
+    if build is None:
+        raise ValueError(f"Unknown report format {format}.")
+    content = json.dumps(build(collector, results, failed), indent=2)
+    utils.write_text_atomic(path, content)
@@ -1,277 +1,520 @@
 # coding=utf-8
+import concurrent.futures
 import os
 import json
 import sys
 import data
 import config
 import utils
+import pack_index
+import scheduler
+import incremental
 import verbose_json
-import generated_data
+import lang
+import identifiers
+import references
+import diagnostics
+import report
+import instrumentation
+import documents
+
+
+def warn(msg, rule=None, file=None, pointer=None):
+    diagnostics.report(
+        diagnostics.Diagnostic(rule, diagnostics.WARNING, msg, file, pointer)
+    )
 
 
-def warn(msg):
-    print("[WARNING] " + msg, file=sys.stderr)
-    if config.config.fail_on_warnings:
-        sys.exit(1)
+def log_fix(msg, rule=None, file=None, pointer=None):
+    diagnostics.report(
+        diagnostics.Diagnostic(rule, diagnostics.FIX, msg, file, pointer, fixed=True)
+    )
 
 
-def log_fix(msg):
-    if config.config.log_fixes:
-        print("[FIX] " + msg)
+def error(msg, rule=None, file=None, pointer=None):
+    diagnostics.report(
+        diagnostics.Diagnostic(rule, diagnostics.ERROR, msg, file, pointer)
+    )
 
 
-def error(msg):
-    print("[ERROR] " + msg, file=sys.stderr)
-    if config.config.fail_on_errors:
-        sys.exit(1)
+def info(msg, rule=None, file=None):
+    diagnostics.report(diagnostics.Diagnostic(rule, diagnostics.INFO, msg, file))
 
 
 def find_bom(base_path):
-    files = utils.list_files_with_extension(base_path, data.BOM_EXTENSIONS)
+    index = pack_index.get(base_path)
+    files = index.files_with_extension(data.BOM_EXTENSIONS)
+    results = {}
+    unchecked = []
     for f in files:
-        if has_bom(f):
+        bom = incremental.cache.get("find_bom", f, index.stat(f))
+        if bom is None:
+            unchecked.append(f)
+        else:
+            results[f] = bom
+    # Only the headers are read, so do many at a time
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        for f, bom in zip(unchecked, executor.map(has_bom, unchecked)):
+            instrumentation.record_read(len(data.BOM))
+            results[f] = bom
+    for f in files:
+        bom = results[f]
+        if bom:
             if config.config.fixes.remove_bom:
-                log_fix(f"Removing BOM from {f}.")
-                content = None
-                with open(f, "rb") as file:
-                    file.read(3)
-                    content = file.read()
-                with open(f, "wb") as file:
-                    file.write(content)
+                log_fix(f"Removing BOM from {f}.", "bom", f)
+                instrumentation.record_read(index.stat(f).st_size)
+                utils.strip_prefix(f, len(data.BOM))
+                index.update(f)
+                documents.cache.invalidate(f)
+                bom = False
             else:
-                warn(f"{f} has a BOM. This is not allowed.")
+                warn(f"{f} has a BOM. This is not allowed.", "bom", f)
+        incremental.cache.put("find_bom", f, index.stat(f), bom)
 
 
 def find_folder_misspellings(base_path, valid_entries):
-    directories = [
-        d for d in os.listdir(base_path) if os.path.isdir(os.path.join(base_path, d))
-    ]
+    directories = pack_index.get(base_path).list_dirs(base_path)
+    fuzzy = utils.fuzzy_index(valid_entries)
     for directory in directories:
-        if directory not in valid_entries:
-            closest, distance = utils.find_closest(directory, valid_entries)
-            if distance > data.MISSPELLING_THRESHOLD:
+        if directory not in fuzzy:
+            closest, distance = fuzzy.closest(directory, data.MISSPELLING_THRESHOLD)
+            if closest is None:
                 continue
             warn(
-                f"{base_path}{os.path.sep}{directory} is not a valid folder. Did you mean {base_path}{os.path.sep}{closest}?"
+                f"{base_path}{os.path.sep}{directory} is not a valid folder. Did you mean {base_path}{os.path.sep}{closest}?",
+                "folder_misspelling",
+                os.path.join(base_path, directory),
             )
 
 
-def find_file_misspellings(base_path, valid_entries):
+def find_file_misspellings(base_path, valid_entries, valid_set=None):
+    index = pack_index.get(base_path)
+    if valid_set is None:
+        valid_set = frozenset(valid_entries)
+    # Parent directory -> FuzzyIndex of its files, shared by entries in it
+    fuzzy_indexes = {}
     for entry in valid_entries:
-        if os.path.isdir(os.path.join(base_path, entry)):
+        if index.isdir(os.path.join(base_path, entry)):
             continue
-        if not os.path.exists(os.path.join(base_path, entry)):
+        if not index.exists(os.path.join(base_path, entry)):
             parent = os.path.dirname(entry)
             name = os.path.basename(entry)
-            if not os.path.exists(os.path.join(base_path, parent)):
+            if not index.exists(os.path.join(base_path, parent)):
                 continue
-            files = [
-                f
-                for f in os.listdir(os.path.join(base_path, parent))
-                if not os.path.isdir(os.path.join(base_path, parent, f))
-                and os.path.join(parent, f) not in valid_entries
-            ]
-            closest, distance = utils.find_closest(name, files)
-            if distance is None or distance > data.MISSPELLING_THRESHOLD:
+            fuzzy = fuzzy_indexes.get(parent)
+            if fuzzy is None:
+                fuzzy = utils.FuzzyIndex(
+                    f
+                    for f in index.list_files(os.path.join(base_path, parent))
+                    if os.path.join(parent, f) not in valid_set
+                )
+                fuzzy_indexes[parent] = fuzzy
+            closest, distance = fuzzy.closest(name, data.MISSPELLING_THRESHOLD)
+            if closest is None:
                 continue
             warn(
-                f"{base_path}{(os.path.sep if parent != '' else '')}{parent}{os.path.sep}{closest} is not a valid file. Did you mean {base_path}{os.path.sep}{entry}?"
+                f"{base_path}{(os.path.sep if parent != '' else '')}{parent}{os.path.sep}{closest} is not a valid file. Did you mean {base_path}{os.path.sep}{entry}?",
+                "file_misspelling",
+                os.path.join(base_path, parent, closest),
             )
 
 
 def find_incorrect_language_names(base_path):
-    if not os.path.exists(os.path.join(base_path, "texts")):
-        return
-    files = [
-        f
-        for f in os.listdir(os.path.join(base_path, "texts"))
-        if (not os.path.isdir(os.path.join(base_path, f)) and f.endswith(".lang"))
-    ]
+    files = list_lang_files(base_path)
     for file in files:
         split = file.split(".")[0].split("_")
         if len(split) != 2:
             warn(
-                f"{base_path}{os.path.sep}texts{os.path.sep}{file} is not a valid language file."
+                f"{base_path}{os.path.sep}texts{os.path.sep}{file} is not a valid language file.",
+                "language_name",
+                os.path.join(base_path, "texts", file),
             )
             continue
         language = split[0]
         country = split[1]
-        if language not in data.languages:
+        if language not in data.languages_set:
             warn(
-                f"{base_path}{os.path.sep}texts{os.path.sep}{file} is not a valid language file. {language} is not a valid language."
+                f"{base_path}{os.path.sep}texts{os.path.sep}{file} is not a valid language file. {language} is not a valid language.",
+                "language_name",
+                os.path.join(base_path, "texts", file),
             )
             continue
-        if country not in data.countries:
+        if country not in data.countries_set:
             warn(
-                f"{base_path}{os.path.sep}texts{os.path.sep}{file} is not a valid language file. {country} is not a valid country."
+                f"{base_path}{os.path.sep}texts{os.path.sep}{file} is not a valid language file. {country} is not a valid country.",
+                "language_name",
+                os.path.join(base_path, "texts", file),
             )
             continue
 
 
-def load_lang_file(path):
-    with open(path, "r", encoding="utf8") as f:
-        lines = f.readlines()
-        lang_dict = {}
-        for line in lines:
-            # Ignore comments and blank lines
-            if line.startswith("#") or not line.strip():
-                continue
-            key, value = line.split("=", 1)
-            lang_dict[key] = value
-        return lang_dict
-    return {}
+def list_lang_files(base_path):
+    index = pack_index.get(base_path)
+    return [
+        f
+        for f in index.list_files(os.path.join(base_path, "texts"))
+        if f.endswith(".lang")
+    ]
 
 
 def find_missing_translations(base_path):
-    if not os.path.exists(os.path.join(base_path, "texts")):
-        return
-    files = [
-        f
-        for f in os.listdir(os.path.join(base_path, "texts"))
-        if (not os.path.isdir(os.path.join(base_path, f)) and f.endswith(".lang"))
-    ]
-    lang_dict = {}
-    all_keys = set()
+    index = pack_index.get(base_path)
+    files = list_lang_files(base_path)
+    file_keys = {}
+    unread = []
+    unread_size = 0
     for file in files:
-        lang_dict[file] = load_lang_file(os.path.join(base_path, "texts", file))
-        all_keys.update(lang_dict[file].keys())
+        path = os.path.join(base_path, "texts", file)
+        keys = incremental.cache.get("missing_translations", path, index.stat(path))
+        if keys is None:
+            unread.append(file)
+            unread_size += index.stat(path).st_size
+        else:
+            file_keys[file] = keys
+    paths = [os.path.join(base_path, "texts", file) for file in unread]
+    read_keys = lang.read_lang_keys_of_files(
+        paths, unread_size, config.config.lang_workers
+    )
+    for file, path, keys in zip(unread, paths, read_keys):
+        instrumentation.record_read(index.stat(path).st_size)
+        incremental.cache.put("missing_translations", path, index.stat(path), keys)
+        file_keys[file] = keys
 
-    for key in all_keys:
-        for file in files:
-            if key not in lang_dict[file]:
-                warn(
-                    f"{base_path}{os.path.sep}texts{os.path.sep}{file} is missing translation for {key}."
-                )
+    matrix = lang.TranslationMatrix()
+    for file in files:
+        matrix.add(file, file_keys[file])
+
+    summary = config.config.translation_report == "summary"
+    limit = config.config.translation_report_limit
+    for file in files:
+        if summary:
+            count = matrix.missing_count(file)
+            if count == 0:
+                continue
+            keys = matrix.missing(file, limit)
+            listed = ", ".join(keys)
+            if count > len(keys):
+                listed += f" and {count - len(keys)} more"
+            warn(
+                f"{base_path}{os.path.sep}texts{os.path.sep}{file} is missing {count} translations: {listed}.",
+                "missing_translation",
+                os.path.join(base_path, "texts", file),
+            )
+            continue
+        for key in matrix.missing(file):
+            warn(
+                f"{base_path}{os.path.sep}texts{os.path.sep}{file} is missing translation for {key}.",
+                "missing_translation",
+                os.path.join(base_path, "texts", file),
+            )
 
 
 def find_incorrect_property_types():
-    if not os.path.exists(os.path.join("BP", "entities")):
-        return
-    files = utils.list_files_with_extension(
-        os.path.join("BP", "entities"), ["json"]
-    )
+    index = pack_index.get("BP")
+    files = index.files_with_extension(["json"], os.path.join("BP", "entities"))
     for file in files:
-        text = None
-        with open(file, "r", encoding="utf8") as f:
-            text = f.read()
-            listener = verbose_json.PropertyListener(text)
-            try:
-                verbose_json.parseJson(text, listener)
-            except Exception as e:
-                print(e)
-                print('File "{}" has invalid JSON.'.format(file))
-                continue
-            for element in listener.issueList:
-                warn(f"{file} has an incorrect value type. {element.message}.")
-                if config.config.fixes.fix_property_types and element.can_fix():
-                    log_fix(element.message)
-                    text = element.fixFunc(text)
+        cached = incremental.cache.get("incorrect_property_types", file, index.stat(file))
+        if cached is not None:
+            for message, pointer in cached:
+                warn(
+                    f"{file} has an incorrect value type. {message}.",
+                    "property_type",
+                    file,
+                    pointer,
+                )
+            continue
+        text = documents.cache.get_text(file, index.stat(file))
+        # Most files are fine, which the json module confirms much faster
+        if not verbose_json.needs_property_check(text):
+            incremental.cache.put("incorrect_property_types", file, index.stat(file), [])
+            continue
+        listener = verbose_json.PropertyListener(text)
+        try:
+            verbose_json.parseJson(text, listener)
+        except Exception as e:
+            info(str(e), "invalid_json", file)
+            info('File "{}" has invalid JSON.'.format(file), "invalid_json", file)
+            continue
+        remaining = []
+        patch = verbose_json.Patch()
+        for element in listener.issueList:
+            warn(
+                f"{file} has an incorrect value type. {element.message}.",
+                "property_type",
+                file,
+                element.pointer,
+            )
+            if config.config.fixes.fix_property_types and element.edit is not None:
+                log_fix(element.message, "property_type", file, element.pointer)
+                patch.add(*element.edit)
+            else:
+                remaining.append([element.message, element.pointer])
 
-        if config.config.fixes.fix_property_types:
-            with open(file, "w") as f:
-                f.write(text)
+        # Only rewrite changed files, so that unchanged ones keep their
+        # modification time for the incremental cache
+        if len(patch.edits) > 0:
+            with open(file, "w", encoding="utf8") as f:
+                f.write(patch.apply(text))
+            index.update(file)
+            documents.cache.invalidate(file)
+        incremental.cache.put("incorrect_property_types", file, index.stat(file), remaining)
 
 
 def has_bom(path):
-    with open(path, "rb") as f:
-        return f.read(3) == b"\xef\xbb\xbf"
+    return utils.read_header(path, len(data.BOM)) == data.BOM
 
 
 def find_missing_sounds():
+    index = pack_index.get("RP")
     sound_def_path = os.path.join("RP", "sounds", "sound_definitions.json")
-    if not os.path.exists(sound_def_path):
+    if not index.isfile(sound_def_path):
         return
-    with open(sound_def_path, "r", encoding="utf8") as f:
-        data = json.load(f)
-    sound_defs = data.get("sound_definitions", {})
+    definitions = documents.cache.get_json(sound_def_path, index.stat(sound_def_path))
+    sound_defs = definitions.get("sound_definitions", {})
+    vanilla_sounds = data.vanilla_sounds()
+    extensions = "|".join(ext[1:] for ext in data.SOUND_EXTENSIONS)
+    # Directory -> names of the sound files in it, without extension
+    sound_names = {}
     for key, defn in sound_defs.items():
-        for sound in defn.get("sounds", []):
+        for i, sound in enumerate(defn.get("sounds", [])):
             name = sound.get("name") if isinstance(sound, dict) else sound
-            if name in generated_data.vanilla_sounds:
+            if not isinstance(name, str):
+                warn(
+                    f"{sound_def_path} has a sound without a name for sound definition {key}.",
+                    "missing_sound",
+                    sound_def_path,
+                    utils.json_pointer(("sound_definitions", key, "sounds"), i),
+                )
+                continue
+            if name in vanilla_sounds:
                 continue
-            sound_file_ogg = os.path.join("RP", f"{name}.ogg")
-            sound_file_wav = os.path.join("RP", f"{name}.wav")
-            if not os.path.exists(sound_file_ogg) and not os.path.exists(sound_file_wav):
-                warn(f"RP{os.path.sep}{name}.[ogg|wav] is missing for sound definition {key}.")
+            directory, base = os.path.split(os.path.join("RP", name))
+            names = sound_names.get(directory)
+            if names is None:
+                names = list_sound_names(index, directory)
+                sound_names[directory] = names
+            if base not in names:
+                warn(
+                    f"RP{os.path.sep}{name}.[{extensions}] is missing for sound definition {key}.",
+                    "missing_sound",
+                    sound_def_path,
+                    utils.json_pointer(("sound_definitions", key, "sounds"), i),
+                )
+
+
+def list_sound_names(index, directory):
+    names = set()
+    for f in index.list_files(directory):
+        name, ext = os.path.splitext(f)
+        if ext.lower() in data.SOUND_EXTENSIONS:
+            names.add(name)
+    return names
 
 def find_unsupported_sound_files():
     sound_dir = os.path.join("RP", "sounds")
-    if not os.path.exists(sound_dir):
-        return
-    for f in os.listdir(sound_dir):
-        full_path = os.path.join(sound_dir, f)
-        if os.path.isdir(full_path):
-            continue
+    for f in pack_index.get("RP").list_files(sound_dir):
         ext = f.rsplit(".", 1)[-1].lower() if "." in f else ""
-        if ext not in ["json", "ogg", "fsb", "wav"]:
-            warn(f"RP{os.path.sep}sounds{os.path.sep}{f} has unsupported extension .{ext}.")
+        if ext != "json" and f".{ext}" not in data.SOUND_EXTENSIONS:
+            warn(
+                f"RP{os.path.sep}sounds{os.path.sep}{f} has unsupported extension .{ext}.",
+                "unsupported_sound_file",
+                os.path.join(sound_dir, f),
+            )
 
 def find_duplicated_recipe_ids():
-    recipe_dir = os.path.join("BP", "recipes")
-    files = utils.list_files_with_extension(recipe_dir, ["json"])
-    recipe_ids = set()
-    for file in files:
-        try:
-            with open(file, "r", encoding="utf8") as f:
-                data = json.load(f)
-            id = None
-            if "minecraft:recipe_shaped" in data:
-                id = data["minecraft:recipe_shaped"]["description"]["identifier"]
-            elif "minecraft:recipe_shapeless" in data:
-                id = data["minecraft:recipe_shapeless"]["description"]["identifier"]
-            elif "minecraft:recipe_furnace" in data:
-                id = data["minecraft:recipe_furnace"]["description"]["identifier"]
+    registry = identifiers.get("BP", config.config.definition_workers)
+    for file, recipe in registry.files["recipes"]:
+        if "error" in recipe:
+            info(f"File {file} failed to parse as JSON.", "invalid_json", file)
+            continue
+        if "unsupported" in recipe:
+            candidates = recipe["unsupported"]
+            if len(candidates) == 1:
+                info(
+                    f"{file} has an unsupported recipe type {candidates[0]}.",
+                    "unsupported_recipe_type",
+                    file,
+                )
             else:
-                # keys starting with `minecraft:`
-                candidates = [k for k in data.keys() if k.startswith("minecraft:")]
-                if len(candidates) == 1:
-                    print(f"{file} has an unsupported recipe type {candidates[0]}.")
-                else:
-                    print(f"{file} has an unsupported recipe type {candidates}.")
-                continue
-            if id is not None and id in recipe_ids:
-                warn(f"{file} has duplicated recipe ID {id}.")
-                recipe_ids.add(id)
-        except Exception as e:
-            print(f"File {file} failed to parse as JSON.")
+                info(
+                    f"{file} has an unsupported recipe type {candidates}.",
+                    "unsupported_recipe_type",
+                    file,
+                )
+            continue
+        id = recipe["id"]
+        first = registry.first_file("recipes", id)
+        if first != file:
+            warn(
+                f"{file} has duplicated recipe ID {id}, first defined in {first}.",
+                "duplicated_recipe_id",
+                file,
+            )
+
+
+def find_duplicated_identifiers():
+    registry = identifiers.get("BP", config.config.definition_workers)
+    for kind, id, first, file in registry.collisions:
+        # Reported with more details by find_duplicated_recipe_ids
+        if kind == "recipes":
+            continue
+        warn(
+            f"{file} has duplicated identifier {id}, first defined in {first}.",
+            "duplicated_identifier",
+            file,
+        )
+
+def find_dangling_references():
+    graph = references.get()
+    for kind, identifier, file, pointer in graph.dangling():
+        warn(
+            f"{file} references {references.KIND_NAMES[kind]} {identifier}, which isn't defined in the packs.",
+            "dangling_reference",
+            file,
+            pointer,
+        )
+
+
+def find_unreachable_assets():
+    graph = references.get()
+    for kind, identifier, file in graph.unreachable():
+        warn(
+            f"{file} defines {references.KIND_NAMES[kind]} {identifier}, which nothing references.",
+            "unreachable_asset",
+            file,
+        )
+
+
+def build_checks():
+    """Return all checks in output order. BOM removal rewrites files, so every
+    check reading file contents of the same pack waits for it."""
+    return [
+        # Shared checks for both packs
+        scheduler.Check("find_bom_bp", find_bom, ("BP",)),
+        scheduler.Check("find_bom_rp", find_bom, ("RP",)),
+        scheduler.Check(
+            "folder_misspellings_bp", find_folder_misspellings, ("BP", data.BP_FOLDERS)
+        ),
+        scheduler.Check(
+            "folder_misspellings_rp", find_folder_misspellings, ("RP", data.RP_FOLDERS)
+        ),
+        scheduler.Check(
+            "file_misspellings_bp",
+            find_file_misspellings,
+            ("BP", data.BP_FILES, data.BP_FILES_SET),
+        ),
+        scheduler.Check(
+            "file_misspellings_rp",
+            find_file_misspellings,
+            ("RP", data.RP_FILES, data.RP_FILES_SET),
+        ),
+        scheduler.Check(
+            "incorrect_language_names_bp", find_incorrect_language_names, ("BP",)
+        ),
+        scheduler.Check(
+            "incorrect_language_names_rp", find_incorrect_language_names, ("RP",)
+        ),
+        scheduler.Check(
+            "missing_translations_bp",
+            find_missing_translations,
+            ("BP",),
+            depends_on=["find_bom_bp"],
+        ),
+        scheduler.Check(
+            "missing_translations_rp",
+            find_missing_translations,
+            ("RP",),
+            depends_on=["find_bom_rp"],
+        ),
+        # BP specific checks
+        scheduler.Check(
+            "incorrect_property_types",
+            find_incorrect_property_types,
+            depends_on=["find_bom_bp"],
+        ),
+        scheduler.Check(
+            "duplicated_recipe_ids",
+            find_duplicated_recipe_ids,
+            depends_on=["find_bom_bp", "incorrect_property_types"],
+        ),
+        scheduler.Check(
+            "duplicated_identifiers",
+            find_duplicated_identifiers,
+            depends_on=["find_bom_bp", "incorrect_property_types"],
+        ),
+        # RP specific checks
+        scheduler.Check("unsupported_sound_files", find_unsupported_sound_files),
+        scheduler.Check(
+            "missing_sounds", find_missing_sounds, depends_on=["find_bom_rp"]
+        ),
+        # Checks across both packs
+        scheduler.Check(
+            "dangling_references",
+            find_dangling_references,
+            depends_on=["find_bom_bp", "find_bom_rp", "incorrect_property_types"],
+        ),
+        scheduler.Check(
+            "unreachable_assets",
+            find_unreachable_assets,
+            depends_on=["find_bom_bp", "find_bom_rp", "incorrect_property_types"],
+        ),
+    ]
+
 
 if __name__ == "__main__":
     checks = getattr(config.config, "checks", None)
-
-    # Shared checks for both packs
-    if not checks or checks.is_enabled("find_bom_bp"):
-        find_bom("BP")
-    if not checks or checks.is_enabled("find_bom_rp"):
-        find_bom("RP")
-
-    if not checks or checks.is_enabled("folder_misspellings_bp"):
-        find_folder_misspellings("BP", data.BP_FOLDERS)
-    if not checks or checks.is_enabled("folder_misspellings_rp"):
-        find_folder_misspellings("RP", data.RP_FOLDERS)
-
-    if not checks or checks.is_enabled("file_misspellings_bp"):
-        find_file_misspellings("BP", data.BP_FILES)
-    if not checks or checks.is_enabled("file_misspellings_rp"):
-        find_file_misspellings("RP", data.RP_FILES)
-
-    if not checks or checks.is_enabled("incorrect_language_names_bp"):
-        find_incorrect_language_names("BP")
-    if not checks or checks.is_enabled("incorrect_language_names_rp"):
-        find_incorrect_language_names("RP")
-
-    if not checks or checks.is_enabled("missing_translations_bp"):
-        find_missing_translations("BP")
-    if not checks or checks.is_enabled("missing_translations_rp"):
-        find_missing_translations("RP")
-
-    # BP specific checks
-    if not checks or checks.is_enabled("incorrect_property_types"):
-        find_incorrect_property_types()
-    if not checks or checks.is_enabled("duplicated_recipe_ids"):
-        find_duplicated_recipe_ids()
-
-    # RP specific checks
-    if not checks or checks.is_enabled("unsupported_sound_files"):
-        find_unsupported_sound_files()
-    if not checks or checks.is_enabled("missing_sounds"):
-        find_missing_sounds()
+    enabled = [
+        check
+        for check in build_checks()
+        if not checks or checks.is_enabled(check.name)
+    ]
+    if config.config.incremental:
+        # Cached results are only valid for the same fix settings
+        incremental.cache = incremental.ResultCache(
+            config.config.cache_path,
+            json.dumps(vars(config.config.fixes), sort_keys=True),
+        )
+    documents.cache = documents.DocumentCache(
+        config.config.document_cache_size * 1024 * 1024
+    )
+    if config.config.profile:
+        instrumentation.current = instrumentation.Instrumentation(
+            config.config.profile_path
+        )
+    # Diagnostics are printed at the end, and the build only fails once all
+    # checks ran, so that a single run shows every problem
+    diagnostics.collector = diagnostics.Collector(
+        config.config.max_diagnostics_per_rule,
+        show_fixes=config.config.log_fixes,
+        buffered=True,
+    )
+    results = []
+    crashed = False
+    try:
+        # cProfile and tracemalloc can't tell concurrent checks apart
+        workers = 1 if config.config.profile else config.config.workers
+        results = scheduler.run_checks(enabled, workers)
+    except BaseException as e:
+        # The report still gets the checks that finished, and says the build
+        # failed
+        results = getattr(e, "check_results", [])
+        crashed = True
+        raise
+    finally:
+        incremental.cache.save()
+        diagnostics.collector.flush()
+        if config.config.timings or config.config.profile:
+            print(instrumentation.format_table([r.stats for r in results]))
+        failed = crashed or diagnostics.collector.failed(
+            config.config.fail_on_warnings, config.config.fail_on_errors
+        )
+        if config.config.report is not None:
+            report.write(
+                config.config.report,
+                config.config.report_format,
+                diagnostics.collector,
+                results,
+                failed,
+            )
+    if failed:
+        sys.exit(1)
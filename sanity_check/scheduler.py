@@ -0,0 +1,110 @@
+import concurrent.futures
+import os
+import threading
+
+import instrumentation
+
+_local = threading.local()
+
+
+class Check(object):
+    """A single named check, with the checks it has to wait for.
+
+    Checks that modify files (like BOM removal) are listed in `depends_on` of
+    the checks that read the same files, so they never run at the same time.
+    """
+
+    def __init__(self, name, func, args=(), depends_on=()):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.depends_on = depends_on
+
+
+class CheckResult(object):
+    def __init__(self, name, output, exception=None, skipped=False, stats=None):
+        self.name = name
+        self.output = output
+        self.exception = exception
+        self.skipped = skipped
+        # instrumentation.CheckStats, not counting the wait for dependencies
+        if stats is None:
+            stats = instrumentation.CheckStats(name)
+        self.stats = stats
+
+
+def defer(func):
+    """Call `func` now, or when called from a scheduled check, once the
+    output of the checks before it has been replayed."""
+    buffer = getattr(_local, "buffer", None)
+    if buffer is None:
+        func()
+    else:
+        buffer.append(func)
+
+
+def _run(check, dependencies):
+    for dependency in dependencies:
+        if dependency.result().exception is not None:
+            return CheckResult(check.name, [], skipped=True)
+    _local.buffer = []
+    exception = None
+    try:
+        with instrumentation.current.measure(check.name) as stats:
+            check.func(*check.args)
+    except BaseException as e:
+        exception = e
+    finally:
+        output = _local.buffer
+        _local.buffer = None
+    return CheckResult(check.name, output, exception, stats=stats)
+
+
+def run_checks(checks, workers=None):
+    """Run the checks, `workers` at a time.
+
+    Output of each check is buffered and printed in the order of `checks`, so
+    it doesn't depend on scheduling. If a check raises, the checks after it
+    are cancelled and the exception is re-raised once the output before it
+    has been printed. The results of the checks up to the failed one are in
+    the `check_results` attribute of the exception.
+    Returns the `CheckResult` of each check, in the order of `checks`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    results = []
+    if workers <= 1 or len(checks) <= 1:
+        for check in checks:
+            exception = None
+            try:
+                with instrumentation.current.measure(check.name) as stats:
+                    check.func(*check.args)
+            except BaseException as e:
+                exception = e
+            results.append(CheckResult(check.name, [], exception, stats=stats))
+            if exception is not None:
+                exception.check_results = results
+                raise exception
+        return results
+
+    names = set(check.name for check in checks)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {}
+        # Dependencies are always submitted first, so a check waiting for them
+        # can't starve the pool.
+        for check in checks:
+            dependencies = [futures[d] for d in check.depends_on if d in names]
+            futures[check.name] = executor.submit(_run, check, dependencies)
+        for check in checks:
+            result = futures[check.name].result()
+            for func in result.output:
+                func()
+            results.append(result)
+            if result.exception is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+                result.exception.check_results = results
+                raise result.exception
+    finally:
+        executor.shutdown(wait=True)
+    return results
@@ -122,3 +122,632 @@ def test_duplicated_recipe_ids(tmp_path):
         sc.find_duplicated_recipe_ids()
     finally:
         os.chdir(old_cwd)
+
+
+def test_pack_index(tmp_path):
+    import pack_index
+    bp = tmp_path / "BP"
+    write_file(str(bp / "entities" / "a.json"), "{}")
+    write_file(str(bp / "functions" / "tick.MCFUNCTION"), "")
+    write_file(str(bp / "manifest.json"), "{}")
+    index = pack_index.get(str(bp))
+    assert index is pack_index.get(str(bp))
+    assert index.isdir(str(bp / "entities"))
+    assert index.isfile(str(bp / "manifest.json"))
+    assert not index.exists(str(bp / "missing"))
+    assert index.list_dirs(str(bp)) == ["entities", "functions"]
+    assert index.list_files(str(bp)) == ["manifest.json"]
+    assert index.files_with_extension(["json"], str(bp / "entities")) == [
+        str(bp / "entities" / "a.json")
+    ]
+    assert len(index.files_with_extension(sc.data.BOM_EXTENSIONS)) == 3
+    assert index.stat(str(bp / "manifest.json")).st_size == 2
+
+
+def test_pack_index_skips_symlinked_directories(tmp_path):
+    import pytest
+    import pack_index
+    bp = tmp_path / "BP"
+    write_file(str(bp / "entities" / "a.json"), "{}")
+    write_file(str(tmp_path / "outside" / "b.json"), "{}")
+    try:
+        os.symlink("..", str(bp / "entities" / "loop"))
+        os.symlink(str(tmp_path / "outside"), str(bp / "outside"))
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks aren't supported")
+    index = pack_index.PackIndex(str(bp))
+    assert index.files_with_extension(["json"]) == [str(bp / "entities" / "a.json")]
+    assert index.list_dirs(str(bp / "entities")) == ["loop"]
+    assert index.isdir(str(bp / "outside"))
+
+
+def test_run_checks_keeps_output_order(capsys):
+    import time
+    import scheduler
+    order = []
+
+    def slow():
+        time.sleep(0.05)
+        order.append("slow")
+        scheduler.defer(lambda: print("first"))
+
+    def fast():
+        order.append("fast")
+        scheduler.defer(lambda: print("second"))
+
+    def dependent():
+        assert "slow" in order
+        scheduler.defer(lambda: print("third"))
+
+    scheduler.run_checks(
+        [
+            scheduler.Check("slow", slow),
+            scheduler.Check("fast", fast),
+            scheduler.Check("dependent", dependent, depends_on=["slow"]),
+        ],
+        workers=3,
+    )
+    assert order[0] == "fast"
+    assert capsys.readouterr().out == "first\nsecond\nthird\n"
+
+
+def test_run_checks_keeps_results_of_failed_run():
+    import scheduler
+
+    def broken():
+        raise ValueError("broken")
+
+    for workers in (1, 2):
+        checks = [
+            scheduler.Check("ok", lambda: None),
+            scheduler.Check("broken", broken),
+            scheduler.Check("after", lambda: None, depends_on=["broken"]),
+        ]
+        try:
+            scheduler.run_checks(checks, workers)
+            assert False
+        except ValueError as e:
+            exception = e
+        results = exception.check_results
+        assert [r.name for r in results] == ["ok", "broken"]
+        assert results[0].exception is None
+        assert results[1].exception is exception
+
+
+def test_incremental_duplicated_recipe_ids(tmp_path, capsys, monkeypatch):
+    import identifiers
+    import incremental
+    import pack_index
+    bp = tmp_path / "BP"
+    recipe = json.dumps({"minecraft:recipe_shaped": {"description": {"identifier": "a:b"}}})
+    write_file(str(bp / "recipes" / "r1.json"), recipe)
+    write_file(str(bp / "recipes" / "r2.json"), recipe)
+    cache_path = str(tmp_path / "data" / "cache.json")
+    old_cwd = os.getcwd()
+    os.chdir(str(tmp_path))
+    try:
+        monkeypatch.setattr(incremental, "cache", incremental.ResultCache(cache_path))
+        sc.find_duplicated_recipe_ids()
+        incremental.cache.save()
+        assert "duplicated recipe ID a:b" in capsys.readouterr().err
+
+        # The second run replays the cached identifiers without reading files
+        pack_index.clear()
+        monkeypatch.setattr(incremental, "cache", incremental.ResultCache(cache_path))
+
+        def fail(text, root_prefix):
+            raise AssertionError(text)
+
+        monkeypatch.setattr(identifiers, "read_identifier", fail)
+        sc.find_duplicated_recipe_ids()
+        assert "duplicated recipe ID a:b" in capsys.readouterr().err
+    finally:
+        os.chdir(old_cwd)
+
+
+def test_find_incorrect_property_types_fixes(tmp_path):
+    entities_dir = tmp_path / "BP" / "entities"
+    entities_dir.mkdir(parents=True)
+    # Empty objects before the properties used to end the parent object early
+    entity = (
+        '{"minecraft:entity": {"components": {}, "description": {"properties": {'
+        '"a:p": {"type": "float", "range": [0, 1.5], "default": 1}}}}}'
+    )
+    (entities_dir / "e.json").write_text(entity)
+    old_cwd = os.getcwd()
+    os.chdir(str(tmp_path))
+    try:
+        sc.find_incorrect_property_types()
+    finally:
+        os.chdir(old_cwd)
+    fixed = json.loads((entities_dir / "e.json").read_text())
+    prop = fixed["minecraft:entity"]["description"]["properties"]["a:p"]
+    assert (entities_dir / "e.json").read_text().count(".0") == 2
+    assert prop["range"] == [0.0, 1.5] and isinstance(prop["default"], float)
+
+
+def test_json_context_paths():
+    import verbose_json
+    contexts = {}
+
+    class Listener(verbose_json.JsonListener):
+        def exitNumber(self, ctx, value):
+            contexts[value] = ctx
+            return False
+
+    verbose_json.parseJson('{"a": {"b/c": [1, {"d": 2}]}}', Listener())
+    assert contexts["1"].keys == ("a", "b/c")
+    assert contexts["1"].to_path() == "#/a/b/c"
+    assert contexts["2"].path_equals(("a", "b/c", "d"))
+    assert contexts["2"].path_startswith(("a", "b/c"))
+    assert not contexts["2"].path_startswith(("a", "b"))
+
+
+def test_patch_applies_edits_against_original_offsets():
+    import verbose_json
+    patch = verbose_json.Patch()
+    # Added out of order, offsets refer to the original text
+    patch.add(10, 0, ".0")
+    patch.add(1, 3, '"bb"')
+    patch.add(6, 1, "2")
+    assert patch.apply('[aaa, 1, 1]') == '["bb", 2, 1.0]'
+
+
+def test_listener_can_skip_subtrees():
+    import verbose_json
+    seen = []
+
+    class Listener(verbose_json.JsonListener):
+        def enterField(self, ctx):
+            if ctx.name == "skipped":
+                return verbose_json.SKIP
+            return False
+
+        def exitString(self, ctx, value):
+            seen.append(value)
+            return False
+
+    text = '{"skipped": {"a": ["x", "}]\\"", {}]}, "kept": "y"}'
+    root = verbose_json.parseJson(text, Listener())
+    assert seen == ["y"]
+    assert root.children[0].length == len(text)
+
+
+def test_property_listener_without_retained_children():
+    import verbose_json
+    text = '{"minecraft:entity": {"description": {"properties": {"a:p": {"type": "float", "range": [0, 1.0], "default": 0.5}}}}}'
+    listener = verbose_json.PropertyListener(text)
+    root = verbose_json.parseJson(text, listener)
+    assert root.children is None
+    assert len(listener.issueList) == 1
+    assert listener.issueList[0].fixFunc is None
+    patch = verbose_json.Patch()
+    patch.add(*listener.issueList[0].edit)
+    assert '"range": [0.0, 1.0]' in patch.apply(text)
+
+
+def test_needs_property_check():
+    import verbose_json
+    def entity(properties):
+        return '{"minecraft:entity": {"description": {"properties": {' + properties + '}}}}'
+    clean = [
+        entity('"a:p": {"type": "float", "range": [0.0, 1.5], "default": 0.5}'),
+        entity('"a:p": {"type": "float", "range": [0.0, 1.0], "default": "q.x"}'),
+        entity('"a:p": {"type": "int", "range": [0, 1], "default": 0}'),
+        '{"minecraft:entity": {"description": {"identifier": "a:b"}}}',
+    ]
+    suspect = [
+        entity('"a:p": {"type": "float", "range": [0, 1.0], "default": 0.5}'),
+        entity('"a:p": {"type": "float", "range": [0.0, 1e5], "default": 0.5}'),
+        entity('"a:p": {"type": "float", "range": [0.0, 1.0], "default": 1}'),
+        entity('"a:p": {"type": "float", "range": [0.0, 1.0], "default": 0.5,}'),
+    ]
+    for text in clean:
+        assert not verbose_json.needs_property_check(text)
+        listener = verbose_json.PropertyListener(text)
+        verbose_json.parseJson(text, listener)
+        assert listener.issueList == []
+    for text in suspect:
+        assert verbose_json.needs_property_check(text)
+
+
+def test_bounded_levenshtein_distance():
+    import utils
+    assert utils.levenshtein_distance("kitten", "sitting") == 3
+    assert utils.levenshtein_distance("kitten", "sitting", 3) == 3
+    assert utils.levenshtein_distance("kitten", "sitting", 2) == 3
+    assert utils.levenshtein_distance("a", "abcdef", 3) == 4
+    assert utils.find_closest("entites", ["items", "entities"], 3) == ("entities", 1)
+    assert utils.find_closest("zzzzzz", ["items", "entities"], 3) == (None, None)
+
+
+def test_fuzzy_index():
+    import utils
+    entries = ["entities", "items", "blocks", "texts", "textures"]
+    index = utils.FuzzyIndex(entries)
+    assert "items" in index
+    assert index.closest("entites", 3) == ("entities", 1)
+    assert index.closest("text", 3) == utils.find_closest("text", entries, 3)
+    assert index.search("texture", 3) == [(1, "textures"), (3, "texts")]
+    assert index.closest("scripts_and_more", 3) == (None, None)
+
+
+def test_find_bom_streams_large_files(tmp_path):
+    bp = tmp_path / "BP"
+    content = b"say hi\n" * 300000
+    write_file(str(bp / "functions" / "big.mcfunction"), b"\xef\xbb\xbf" + content, binary=True)
+    write_file(str(bp / "functions" / "plain.mcfunction"), content, binary=True)
+    assert sc.has_bom(str(bp / "functions" / "big.mcfunction"))
+    sc.find_bom(str(bp))
+    assert (bp / "functions" / "big.mcfunction").read_bytes() == content
+    assert (bp / "functions" / "plain.mcfunction").read_bytes() == content
+    assert sorted(os.listdir(str(bp / "functions"))) == ["big.mcfunction", "plain.mcfunction"]
+
+
+def test_vanilla_sounds_catalogue():
+    import data
+    with open(data.VANILLA_SOUNDS_PATH, "r", encoding="utf8") as f:
+        lines = f.read().splitlines()
+    assert lines == sorted(set(lines))
+    sounds = data.vanilla_sounds()
+    assert "music/game/hal1" in sounds
+    assert len(sounds) == len(lines)
+    assert data.vanilla_sounds() is sounds
+
+
+def test_find_missing_sounds_resolves_all_extensions(tmp_path, capsys):
+    sounds = tmp_path / "RP" / "sounds"
+    write_file(str(sounds / "mob" / "a.ogg"), "")
+    write_file(str(sounds / "mob" / "b.WAV"), "")
+    write_file(str(sounds / "mob" / "c.fsb"), "")
+    definitions = {
+        "sound_definitions": {
+            "mob.a": {"sounds": ["sounds/mob/a", {"name": "sounds/mob/b"}]},
+            "mob.c": {"sounds": ["sounds/mob/c", "sounds/mob/d", "sounds/other/e"]},
+            # Sounds without a (string) name are reported, not a crash
+            "mob.f": {"sounds": [{"volume": 1}, {"name": 5}]},
+        }
+    }
+    (sounds / "sound_definitions.json").write_text(json.dumps(definitions))
+    old_cwd = os.getcwd()
+    os.chdir(str(tmp_path))
+    try:
+        sc.find_missing_sounds()
+    finally:
+        os.chdir(old_cwd)
+    err = capsys.readouterr().err
+    assert "mob/a." not in err and "mob/b." not in err and "mob/c." not in err
+    assert "sounds/mob/d.[ogg|wav|fsb] is missing for sound definition mob.c" in err
+    assert "sounds/other/e.[ogg|wav|fsb] is missing" in err
+    assert err.count("has a sound without a name for sound definition mob.f") == 2
+
+
+def test_translation_matrix():
+    import lang
+    matrix = lang.TranslationMatrix()
+    matrix.add("en_US.lang", ["a", "b", "c", "d"])
+    matrix.add("de_DE.lang", ["b", "e"])
+    assert matrix.missing("en_US.lang") == ["e"]
+    assert matrix.missing("de_DE.lang") == ["a", "c", "d"]
+    assert matrix.missing("de_DE.lang", 2) == ["a", "c"]
+    assert matrix.missing_count("de_DE.lang") == 3
+
+
+def test_missing_translations_summary(tmp_path, capsys):
+    texts = tmp_path / "RP" / "texts"
+    write_file(str(texts / "en_US.lang"), "# comment\n\na=A\nb=B\nc=C\nnot a translation\n")
+    write_file(str(texts / "de_DE.lang"), "b=B\n")
+    old_config = sc.config.config
+    sc.config.config = sc.config.Config(translation_report="summary", translation_report_limit=1)
+    try:
+        sc.find_missing_translations(str(tmp_path / "RP"))
+    finally:
+        sc.config.config = old_config
+    err = capsys.readouterr().err.splitlines()
+    assert len(err) == 1
+    assert err[0].endswith("de_DE.lang is missing 2 translations: a and 1 more.")
+
+
+def test_read_lang_keys_of_files_on_process_pool(tmp_path):
+    import lang
+    import utils
+    paths = []
+    for i in range(3):
+        path = str(tmp_path / f"l{i}.lang")
+        write_file(path, "".join(f"key_{i}_{j}=value\n" for j in range(100)))
+        paths.append(path)
+    expected = [lang.read_lang_keys(path) for path in paths]
+    assert lang.read_lang_keys_of_files(paths, utils.PARALLEL_MIN_BYTES, 2) == expected
+    assert lang.read_lang_keys_of_files(paths, 0, 2) == expected
+
+
+def test_read_identifiers(tmp_path):
+    import documents
+    import identifiers
+    import utils
+    texts = [
+        # The identifier is found after skipped fields, the rest isn't parsed
+        '{"format_version": "1.20", "minecraft:recipe_brewing_mix": {"tags": ["brewing_stand"],'
+        ' "description": {"identifier": "a:\\u0062"}, "input": not parsed',
+        '{"minecraft:recipe_smithing_transform": {"description": {"identifier": "a:c"}}}',
+        '{"minecraft:entity": {"description": {"identifier": "a:d"}}}',
+        '[{"minecraft:recipe_shaped": {"description": {"identifier": "a:e"}}}]',
+        '{"minecraft:recipe_shaped": {"description": {}}}',
+    ]
+    paths = []
+    for i, text in enumerate(texts):
+        path = str(tmp_path / f"r{i}.json")
+        write_file(path, text)
+        paths.append(path)
+    prefixes = ["minecraft:recipe_"] * len(paths)
+    expected = [
+        {"id": "a:b", "type": "minecraft:recipe_brewing_mix"},
+        {"id": "a:c", "type": "minecraft:recipe_smithing_transform"},
+        {"unsupported": ["minecraft:entity"]},
+        {"error": "Expected {"},
+        {"error": "minecraft:recipe_shaped has no description.identifier"},
+    ]
+    assert identifiers.read_identifiers_of_files(paths, prefixes, 0, 2) == expected
+    # Files parsed in this process are shared with the other checks
+    assert (os.getcwd(), os.path.normpath(paths[1])) in documents.cache.documents
+    assert identifiers.read_identifiers_of_files(
+        paths, prefixes, utils.PARALLEL_MIN_BYTES, 2
+    ) == expected
+
+
+def test_identifier_registry(tmp_path, capsys):
+    import identifiers
+    bp = tmp_path / "BP"
+    definitions = [
+        ("entities", "e1.json", "minecraft:entity", "a:x"),
+        ("entities", "e2.json", "minecraft:entity", "a:x"),
+        ("items", "i1.json", "minecraft:item", "a:x"),
+        ("blocks", "b1.json", "minecraft:block", "a:y"),
+        ("feature_rules", "f1.json", "minecraft:feature_rules", "a:z"),
+        ("feature_rules", "f2.json", "minecraft:feature_rules", "a:z"),
+    ]
+    for folder, name, root, identifier in definitions:
+        definition = {"format_version": "1.20", root: {"description": {"identifier": identifier}}}
+        write_file(str(bp / folder / name), json.dumps(definition))
+    old_cwd = os.getcwd()
+    os.chdir(str(tmp_path))
+    try:
+        registry = identifiers.get("BP", 1)
+        assert identifiers.get("BP", 1) is registry
+        # Each kind of definition has its own identifiers
+        assert registry.exists("items", "a:x")
+        assert not registry.exists("items", "a:y")
+        assert registry.first_file("entities", "a:x") == os.path.join("BP", "entities", "e1.json")
+        assert [(kind, id) for kind, id, first, file in registry.collisions] == [
+            ("entities", "a:x"),
+            ("feature_rules", "a:z"),
+        ]
+        sc.find_duplicated_identifiers()
+        err = capsys.readouterr().err
+        assert (
+            f"BP{os.sep}entities{os.sep}e2.json has duplicated identifier a:x, "
+            f"first defined in BP{os.sep}entities{os.sep}e1.json."
+        ) in err
+        assert "a:z" in err
+    finally:
+        os.chdir(old_cwd)
+
+
+def test_reference_graph(tmp_path, capsys, monkeypatch):
+    import data
+    import references
+    files = {
+        "BP/entities/e.json": {
+            "minecraft:entity": {
+                "description": {
+                    "identifier": "a:e",
+                    "animations": {"walk": "animation.a.walk", "ctrl": "controller.animation.a.missing"},
+                },
+                "component_groups": {"g": {"minecraft:trade_table": {"table": "trading/t.json"}}},
+            }
+        },
+        "BP/animations/a.json": {"animations": {"animation.a.walk": {}, "animation.a.unused": {}}},
+        "BP/trading/t.json": {"tiers": []},
+        "RP/entity/e.json": {
+            "minecraft:client_entity": {
+                "description": {
+                    "identifier": "a:e",
+                    "geometry": {
+                        "default": "geometry.a.child",
+                        "other": "geometry.a.missing",
+                        "vanilla": "geometry.humanoid.custom",
+                    },
+                    "render_controllers": [{"controller.render.a": "true"}],
+                    "textures": {"default": "textures/entity/a", "other": "textures/entity/b"},
+                }
+            }
+        },
+        "RP/entity/pig.json": {"minecraft:client_entity": {"description": {"identifier": "minecraft:pig"}}},
+        "RP/entity/f.json": {"minecraft:client_entity": {"description": {"identifier": "a:f"}}},
+        "RP/models/a.geo.json": {"geometry.a.child:geometry.a.parent": {}, "geometry.a.parent": {}},
+        "RP/models/b.geo.json": {"minecraft:geometry": [{"description": {"identifier": "geometry.a.unused"}}]},
+        "RP/render_controllers/r.json": {"render_controllers": {"controller.render.a": {}, "controller.render.b": {}}},
+    }
+    for path, content in files.items():
+        write_file(str(tmp_path / path), json.dumps(content))
+    write_file(str(tmp_path / "RP" / "textures" / "entity" / "a.png"), b"", binary=True)
+    vanilla = {"entity": frozenset(["minecraft:pig"]), "geometry": frozenset(["geometry.humanoid.custom"])}
+    monkeypatch.setattr(data, "vanilla_references", lambda: vanilla)
+    old_cwd = os.getcwd()
+    os.chdir(str(tmp_path))
+    try:
+        graph = references.get()
+        assert references.get() is graph
+        assert graph.exists("texture", "textures/entity/a")
+        assert [(kind, id, pointer) for kind, id, file, pointer in graph.dangling()] == [
+            ("animation_controller", "controller.animation.a.missing", "/minecraft:entity/description/animations/ctrl"),
+            ("geometry", "geometry.a.missing", "/minecraft:client_entity/description/geometry/other"),
+            ("texture", "textures/entity/b", "/minecraft:client_entity/description/textures/other"),
+            ("entity", "a:f", "/minecraft:client_entity/description/identifier"),
+        ]
+        assert [(kind, id) for kind, id, file in graph.unreachable()] == [
+            ("animation", "animation.a.unused"),
+            ("render_controller", "controller.render.b"),
+            ("geometry", "geometry.a.unused"),
+        ]
+        sc.find_unreachable_assets()
+        assert (
+            f"RP{os.sep}render_controllers{os.sep}r.json defines render controller "
+            "controller.render.b, which nothing references."
+        ) in capsys.readouterr().err
+    finally:
+        os.chdir(old_cwd)
+
+
+def test_diagnostics_collector(capsys, monkeypatch):
+    import diagnostics
+    import scheduler
+    collector = diagnostics.Collector(max_per_rule=2, buffered=True)
+    monkeypatch.setattr(diagnostics, "collector", collector)
+
+    def check(rule, count):
+        for i in range(count):
+            diagnostics.report(
+                diagnostics.Diagnostic(rule, diagnostics.WARNING, f"{rule} {i}", "f.json", f"/a/{i}")
+            )
+        # Repeated diagnostics are dropped
+        diagnostics.report(
+            diagnostics.Diagnostic(rule, diagnostics.WARNING, f"{rule} 0", "f.json", "/a/0")
+        )
+
+    scheduler.run_checks(
+        [scheduler.Check("a", check, ("a", 4)), scheduler.Check("b", check, ("b", 1))],
+        workers=2,
+    )
+    assert capsys.readouterr().err == ""
+    collector.flush()
+    captured = capsys.readouterr()
+    assert captured.err == "[WARNING] a 0\n[WARNING] a 1\n[WARNING] b 0\n"
+    assert captured.out == "2 more a diagnostics (warning) were not shown.\n"
+    assert [d.pointer for d in collector.diagnostics] == ["/a/0", "/a/1", "/a/2", "/a/3", "/a/0"]
+    assert collector.count(diagnostics.WARNING) == 5
+    assert collector.failed(fail_on_warnings=True, fail_on_errors=True)
+    assert not collector.failed(fail_on_warnings=False, fail_on_errors=True)
+
+
+def test_report_json_and_sarif(tmp_path):
+    import diagnostics
+    import instrumentation
+    import report
+    import scheduler
+    collector = diagnostics.Collector(max_per_rule=0, buffered=True)
+    collector.add(
+        diagnostics.Diagnostic(
+            "property_type",
+            diagnostics.WARNING,
+            "Property a:p has invalid default value",
+            os.path.join("BP", "entities", "e.json"),
+            "/minecraft:entity/description/properties/a:p/default",
+        )
+    )
+    collector.add(diagnostics.Diagnostic("bom", diagnostics.FIX, "Removing BOM", "e.json", fixed=True))
+    stats = instrumentation.CheckStats("find_bom_bp")
+    stats.wall_time = 0.5
+    stats.files_read = 2
+    results = [scheduler.CheckResult("find_bom_bp", [], stats=stats)]
+
+    path = str(tmp_path / "report" / "report.json")
+    report.write(path, "json", collector, results, True)
+    with open(path, "r", encoding="utf8") as f:
+        written = json.load(f)
+    assert written["failed"] is True
+    assert written["summary"]["warning"] == 1 and written["summary"]["fix"] == 1
+    assert written["findings"][0]["pointer"] == "/minecraft:entity/description/properties/a:p/default"
+    assert written["findings"][1]["fixed"] is True
+    assert written["checks"][0]["name"] == "find_bom_bp"
+    assert written["checks"][0]["seconds"] == 0.5 and written["checks"][0]["files_read"] == 2
+
+    path = str(tmp_path / "report.sarif")
+    report.write(path, "sarif", collector, results, False)
+    with open(path, "r", encoding="utf8") as f:
+        run = json.load(f)["runs"][0]
+    assert [r["id"] for r in run["tool"]["driver"]["rules"]] == ["property_type", "bom"]
+    assert run["results"][0]["level"] == "warning"
+    assert run["results"][0]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] == "BP/entities/e.json"
+    assert run["invocations"][0]["executionSuccessful"] is True
+
+
+def test_instrumentation_records_reads_and_profiles(tmp_path, monkeypatch):
+    import tracemalloc
+    import instrumentation
+    import scheduler
+
+    def check():
+        instrumentation.record_read(100)
+        instrumentation.record_read(2048)
+
+    profile_path = str(tmp_path / "profile")
+    monkeypatch.setattr(instrumentation, "current", instrumentation.Instrumentation(profile_path))
+    results = scheduler.run_checks([scheduler.Check("reads", check)], workers=1)
+    stats = results[0].stats
+    assert (stats.files_read, stats.bytes_read) == (2, 2148)
+    assert stats.peak_memory is not None
+    assert os.path.isfile(os.path.join(profile_path, "reads.prof"))
+    table = instrumentation.format_table([stats]).splitlines()
+    assert table[0].split() == ["check", "wall", "cpu", "files", "read", "peak", "memory"]
+    assert table[1].split()[0] == "reads" and "2.1 KB" in table[1]
+    # Outside of a check, reads aren't counted
+    instrumentation.record_read(100)
+    tracemalloc.stop()
+
+
+def test_bench_pack_runs_all_checks(tmp_path):
+    sys.path.insert(0, os.path.join(pkg_dir, "benchmarks"))
+    try:
+        import bench_pack
+    finally:
+        sys.path.remove(os.path.join(pkg_dir, "benchmarks"))
+    pack = str(tmp_path / "pack")
+    bench_pack.generate_pack(
+        pack, entities=2, recipes=10, languages=2, keys=20, sounds=20, textures=20, bom=3
+    )
+    old_config = sc.config.config
+    try:
+        results = bench_pack.run(pack, repeat=1)
+    finally:
+        sc.config.config = old_config
+    assert set(results) == set(check.name for check in sc.build_checks())
+    # The identifier registry of the 10 recipes and 2 entities is built by
+    # the first check using it
+    assert results["duplicated_recipe_ids"][1] == 12
+    assert results["duplicated_identifiers"][1] == 0
+
+
+def test_document_cache(tmp_path, monkeypatch):
+    import documents
+    reads = []
+    real_open = open
+
+    def counting_open(path, *args, **kwargs):
+        reads.append(os.path.basename(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(documents, "open", counting_open, raising=False)
+    a = str(tmp_path / "a.json")
+    b = str(tmp_path / "b.json")
+    write_file(a, '{"a": [1, 2.0]}')
+    write_file(b, '{"b": "' + "x" * 100 + '"}')
+    cache = documents.DocumentCache(max_bytes=600)
+    assert cache.get_json(a) == {"a": [1, 2.0]}
+    assert cache.get_text(a) == '{"a": [1, 2.0]}'
+    root = cache.get_verbose(a)
+    assert root.children[0].children[0].name == "a"
+    assert reads == ["a.json"]
+
+    # Writes are noticed through the size, or explicitly invalidated
+    write_file(a, '{"a": [1, 2.0, 3]}')
+    assert cache.get_json(a) == {"a": [1, 2.0, 3]}
+    write_file(a, '{"a": [4, 5.0, 6]}')
+    cache.invalidate(a)
+    assert cache.get_json(a) == {"a": [4, 5.0, 6]}
+    assert reads == ["a.json"] * 3
+
+    # b with its JSON tree doesn't fit next to a, so a is evicted
+    cache.get_json(b)
+    assert list(cache.documents) == [(os.getcwd(), os.path.normpath(b))]
+    assert cache.total_cost <= 600
@@ -1,70 +1,288 @@
+import concurrent.futures
+import multiprocessing
 import os
+import shutil
+import tempfile
+
+# Below this many bytes, starting worker processes costs more than parsing
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
 
 
 class Issue(object):
-    def __init__(self, message, fixFunc):
+    def __init__(self, message, fixFunc, edit=None, pointer=None):
         self.message = message
         self.fixFunc = fixFunc
+        # (index, length, replacement) of the fix, for batching it with others
+        self.edit = edit
+        # JSON pointer of the value with the issue
+        self.pointer = pointer
     
     def can_fix(self):
-        return self.fixFunc is not None
+        return self.fixFunc is not None or self.edit is not None
     
     def fix(self):
         if self.fixFunc is not None:
             self.fixFunc()
 
-def levenshtein_distance(s1, s2):
+def levenshtein_distance(s1, s2, max_distance=None):
+    """Return the edit distance between two strings.
+
+    With `max_distance`, only a band of the matrix around the diagonal is
+    computed and the calculation stops as soon as the distance must exceed
+    it. In that case `max_distance + 1` is returned.
+    """
+    if max_distance is None:
+        max_distance = max(len(s1), len(s2))
+    # The distance is at least the difference in length
+    if abs(len(s1) - len(s2)) > max_distance:
+        return max_distance + 1
     # If one of the strings is empty, the distance is the length of the other string
     if len(s1) == 0:
         return len(s2)
     if len(s2) == 0:
         return len(s1)
+    if s1 == s2:
+        return 0
 
-    # Initialize a matrix of size (len(s1) + 1) x (len(s2) + 1)
-    matrix = [[0 for n in range(len(s2) + 1)] for m in range(len(s1) + 1)]
-
-    # Initialize the first row and column
-    for i in range(len(s1) + 1):
-        matrix[i][0] = i
-    for j in range(len(s2) + 1):
-        matrix[0][j] = j
-
-    # Fill in the matrix
+    # Cells known to exceed max_distance are capped at this value
+    limit = max_distance + 1
+    # Only the previous row of the matrix is kept
+    previous = [min(j, limit) for j in range(len(s2) + 1)]
     for i in range(1, len(s1) + 1):
-        for j in range(1, len(s2) + 1):
-            if s1[i - 1] == s2[j - 1]:
+        current = [limit] * (len(s2) + 1)
+        current[0] = min(i, limit)
+        row_min = current[0]
+        c1 = s1[i - 1]
+        # Cells further than max_distance from the diagonal can't be in range
+        for j in range(max(1, i - max_distance), min(len(s2), i + max_distance) + 1):
+            if c1 == s2[j - 1]:
                 cost = 0
             else:
                 cost = 1
+            value = min(
+                previous[j] + 1,  # Deletion
+                current[j - 1] + 1,  # Insertion
+                previous[j - 1] + cost,  # Substitution
+            )
+            if value > limit:
+                value = limit
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        # Values in a row never decrease in the following rows
+        if row_min >= limit:
+            return limit
+        previous = current
 
-            matrix[i][j] = min(
-                matrix[i - 1][j] + 1,  # Deletion
-                matrix[i][j - 1] + 1,  # Insertion
-                matrix[i - 1][j - 1] + cost,
-            )  # Substitution
+    return previous[len(s2)]
 
-    return matrix[len(s1)][len(s2)]
 
-
-def find_closest(string, valid_entries):
+def find_closest(string, valid_entries, max_distance=None):
+    """Return the closest entry and its distance. With `max_distance`,
+    returns (None, None) if no entry is that close."""
     closest = None
     closest_distance = None
     for entry in valid_entries:
-        distance = levenshtein_distance(string, entry)
-        if closest_distance is None or distance < closest_distance:
-            closest = entry
-            closest_distance = distance
+        # Only entries closer than the current best can replace it
+        bound = max_distance
+        if closest_distance is not None:
+            bound = closest_distance - 1
+        if bound is not None and abs(len(entry) - len(string)) > bound:
+            continue
+        distance = levenshtein_distance(string, entry, bound)
+        if bound is not None and distance > bound:
+            continue
+        closest = entry
+        closest_distance = distance
+        if distance == 0:
+            break
     return closest, closest_distance
 
 
-def list_files_with_extension(base_path, extensions):
-    extensions = [ext.lower() for ext in extensions]
+class FuzzyIndex(object):
+    """Index for finding entries close to a string, without comparing it to
+    every entry.
+
+    Entries are indexed by their length and bigrams. An entry within
+    `max_distance` of a string differs in length by at most `max_distance`,
+    and as an edit changes at most two bigrams, it must share enough bigrams
+    with the string. Only entries passing both filters are compared with
+    `levenshtein_distance`.
+    """
+
+    Q = 2
+
+    def __init__(self, entries=()):
+        self.entries = []
+        self.positions = {}
+        # length -> positions of entries with that length
+        self.by_length = {}
+        # (length, bigram) -> positions of entries with that length containing it
+        self.postings = {}
+        for entry in entries:
+            self.add(entry)
+
+    @staticmethod
+    def qgrams(string):
+        padded = "\0" + string + "\0"
+        return set(padded[i : i + FuzzyIndex.Q] for i in range(len(padded) - 1))
+
+    def add(self, entry):
+        if entry in self.positions:
+            return
+        position = len(self.entries)
+        self.entries.append(entry)
+        self.positions[entry] = position
+        self.by_length.setdefault(len(entry), []).append(position)
+        for gram in FuzzyIndex.qgrams(entry):
+            self.postings.setdefault((len(entry), gram), []).append(position)
+
+    def __contains__(self, entry):
+        return entry in self.positions
+
+    def __len__(self):
+        return len(self.entries)
+
+    def candidates(self, string, max_distance):
+        """Return {position: shared bigrams} of entries that may be within
+        `max_distance` of the string."""
+        grams = FuzzyIndex.qgrams(string)
+        required = len(grams) - max_distance * FuzzyIndex.Q
+        lengths = range(len(string) - max_distance, len(string) + max_distance + 1)
+        counts = {}
+        if required <= 0:
+            # Too short for the bigram filter, use the length filter only
+            for length in lengths:
+                for position in self.by_length.get(length, []):
+                    counts[position] = 0
+            return counts
+        for length in lengths:
+            for gram in grams:
+                for position in self.postings.get((length, gram), []):
+                    counts[position] = counts.get(position, 0) + 1
+        return dict((p, c) for p, c in counts.items() if c >= required)
+
+    def search(self, string, max_distance):
+        """Return (distance, entry) of all entries within `max_distance`,
+        closest first, in the order they were added otherwise."""
+        results = []
+        for position in self.candidates(string, max_distance):
+            entry = self.entries[position]
+            distance = levenshtein_distance(string, entry, max_distance)
+            if distance <= max_distance:
+                results.append((distance, position, entry))
+        results.sort()
+        return [(distance, entry) for distance, _, entry in results]
+
+    def closest(self, string, max_distance):
+        """Same as `find_closest(string, entries, max_distance)`."""
+        if string in self.positions:
+            return string, 0
+        counts = self.candidates(string, max_distance)
+        best = None
+        # Entries sharing more bigrams are likely closer, so try them first to
+        # lower the bound for the rest
+        for position in sorted(counts, key=lambda p: (-counts[p], p)):
+            bound = max_distance
+            if best is not None:
+                # On equal distance, the entry added first wins
+                bound = best[0] if position < best[1] else best[0] - 1
+                if bound < 0:
+                    continue
+            distance = levenshtein_distance(string, self.entries[position], bound)
+            if distance <= bound:
+                best = (distance, position)
+        if best is None:
+            return None, None
+        return self.entries[best[1]], best[0]
+
+
+_fuzzy_indexes = {}
+
+
+def fuzzy_index(entries):
+    """Return a shared FuzzyIndex over a constant list of entries, like
+    data.BP_FOLDERS, built on first use."""
+    key = tuple(entries)
+    index = _fuzzy_indexes.get(key)
+    if index is None:
+        index = FuzzyIndex(entries)
+        _fuzzy_indexes[key] = index
+    return index
+
+
+def read_header(path, size):
+    """Read only the first `size` bytes of a file."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "pread"):
+            return os.pread(fd, size, 0)
+        # os.pread isn't available on Windows
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def strip_prefix(path, size, buffer_size=1024 * 1024):
+    """Remove the first `size` bytes of a file.
+
+    The rest of the file is streamed through a fixed-size buffer into a
+    temporary file next to it, which then replaces the original, so large files
+    aren't loaded into memory and an interrupted run can't truncate them.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as out, open(path, "rb") as src:
+            src.seek(size)
+            shutil.copyfileobj(src, out, buffer_size)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_text_atomic(path, text):
+    """Write a text file with a single write, replacing it atomically, so that
+    readers never see a partial file. Missing directories are created."""
+    directory = os.path.dirname(path)
+    if directory != "":
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def json_pointer(keys, *indices):
+    """Return the JSON pointer of the field names `keys`, followed by the
+    array `indices`."""
+    parts = [str(k).replace("~", "~0").replace("/", "~1") for k in keys]
+    parts.extend(str(i) for i in indices)
+    return "".join("/" + part for part in parts)
+
 
-    matching_files = []
+def process_pool_size(count, total_size, workers=None):
+    """Return the number of processes to parse `count` files of `total_size`
+    bytes with, 1 meaning in the current process. `workers` is the maximum,
+    None means one per CPU."""
+    if total_size < PARALLEL_MIN_BYTES:
+        return 1
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, count))
 
-    for dirpath, _, filenames in os.walk(base_path):
-        for filename in filenames:
-            if filename.lower().endswith(tuple(extensions)):
-                matching_files.append(os.path.join(dirpath, filename))
 
-    return matching_files
+def map_on_processes(func, workers, *iterables, chunksize=1):
+    """Return `list(map(func, *iterables))`, computed on a pool of `workers`
+    processes."""
+    # Checks run on threads, and forking a process with threads can deadlock
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(executor.map(func, *iterables, chunksize=chunksize))
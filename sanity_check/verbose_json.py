@@ -1,39 +1,78 @@
-from utils import Issue
+import json
+import re
+
+from utils import Issue, json_pointer
 
 
 class JsonContext(object):
-    def __init__(self, jsonText, parent=None, value=None):
+    __slots__ = (
+        "parent",
+        "value",
+        "index",
+        "length",
+        "children",
+        "name",
+        "keys",
+        "path",
+    )
+
+    def __init__(self, jsonText, parent=None, value=None, retain_children=True):
         self.parent = parent
         self.value = value
-        self.index = jsonText.position()
+        self.index = jsonText.pos
         self.length = 0
-        self.children = []
+        # Children are only kept when offsets of the whole tree may need to be
+        # shifted by `set_text`. Otherwise contexts are freed as soon as the
+        # listener lets go of them. Children inherit the setting of the root.
+        if parent is not None:
+            retain_children = parent.children is not None
+        self.children = [] if retain_children else None
+        # Field name, only set on field contexts
+        self.name = None
+        # Field names from the root to this context. Contexts that aren't field
+        # values share the tuple of their parent.
+        if parent is None:
+            self.keys = ()
+        elif isinstance(value, str):
+            self.keys = parent.keys + (value,)
+        else:
+            self.keys = parent.keys
+        self.path = None
 
     def to_path(self):
-        path = []
-        ctx = self
-        while ctx is not None:
-            path.append(ctx.value)
-            ctx = ctx.parent
-        path.reverse()
-        strPath = "#"
-        for p in path:
-            if isinstance(p, str):
-                strPath += "/" + p
-        return strPath
+        if self.path is None:
+            if self.parent is None:
+                self.path = "#"
+            elif isinstance(self.value, str):
+                self.path = self.parent.to_path() + "/" + self.value
+            else:
+                self.path = self.parent.to_path()
+        return self.path
+
+    def path_equals(self, keys):
+        """Return whether the field names leading to this context are `keys`."""
+        return self.keys == keys
+
+    def path_startswith(self, prefix):
+        """Return whether the field names leading to this context start with
+        the `prefix` tuple."""
+        return self.keys[: len(prefix)] == prefix
 
     def make_child(self, jsonText, value=None):
         child = JsonContext(jsonText, self, value)
-        self.children.append(child)
+        if self.children is not None:
+            self.children.append(child)
         return child
 
     def update_length(self, jsonText):
-        self.length = jsonText.position() - self.index
+        self.length = jsonText.pos - self.index
 
     def get_text(self, jsonText):
         return jsonText[self.index : self.index + self.length]
 
     def set_text(self, jsonText, value):
+        if self.children is None:
+            raise Exception("set_text requires a tree parsed with retained children")
         jsonText = jsonText[: self.index] + value + jsonText[self.index + self.length :]
         change = len(value) - self.length
         self.length = len(value)
@@ -54,6 +93,34 @@ class JsonContext(object):
         return f"JsonContext({self.to_path()}, {self.index}, {self.length})"
 
 
+class Patch(object):
+    """Collects edits to a JSON text and applies them all in a single pass.
+
+    Edits are (index, length, replacement) tuples in offsets of the original
+    text. Unlike `JsonContext.set_text`, no offsets have to be rewritten
+    between edits, because they are applied from the end of the text.
+    """
+
+    def __init__(self):
+        self.edits = []
+
+    def add(self, index, length, replacement):
+        self.edits.append((index, length, replacement))
+
+    def apply(self, jsonText):
+        parts = []
+        end = len(jsonText)
+        for index, length, replacement in sorted(self.edits, reverse=True):
+            if index + length > end:
+                raise Exception("Overlapping edits")
+            parts.append(jsonText[index + length : end])
+            parts.append(replacement)
+            end = index
+        parts.append(jsonText[:end])
+        parts.reverse()
+        return "".join(parts)
+
+
 class StringReader(object):
     def __init__(self, string):
         self.string = string
@@ -98,7 +165,32 @@ class StringReader(object):
         return len(self.string) - self.pos
 
 
+class _Skip(object):
+    """Return value of `JsonListener.enterObject`, `enterArray` and
+    `enterField` that skips the rest of the node without any further
+    callbacks for it (including its exit callback). It is falsy, so it means
+    "continue" where skipping isn't supported."""
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "SKIP"
+
+
+SKIP = _Skip()
+
+
 class JsonListener(object):
+    """Callbacks of `parseJson`. Returning True stops parsing, returning
+    `SKIP` from enterObject, enterArray or enterField skips the node.
+
+    `retainChildren` keeps the whole context tree alive until parsing ends,
+    which is only needed for `JsonContext.set_text`.
+    """
+
+    retainChildren = True
+
     def __init__(self):
         pass
 
@@ -153,26 +245,140 @@ class JsonListener(object):
 
 def parseJson(jsonText, listener):
     reader = StringReader(jsonText)
-    ctx = JsonContext(reader)
+    ctx = JsonContext(reader, retain_children=listener.retainChildren)
+    skipWhitespace(reader)
     parseValue(reader, listener, ctx)
     return ctx
 
 
+# Tokens are scanned with regular expressions, so that strings, whitespace and
+# numbers are consumed in bulk instead of one character at a time. The parse
+# functions always leave the reader at the start of the next token.
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+NUMBER = re.compile(r"[0-9+\-eE.]*")
+# A field name, the colon and the whitespace up to the value
+FIELD_NAME = re.compile(
+    r'("[^"\\]*(?:\\.[^"\\]*)*")[ \t\n\r]*:[ \t\n\r]*', re.DOTALL
+)
+# A comma or closing bracket after a value, with whitespace around it
+SEPARATOR = re.compile(r"[ \t\n\r]*([,}\]])[ \t\n\r]*")
+# Used when skipping values: a number, boolean or null, and everything up to
+# the next bracket, with strings consumed as a whole
+SCALAR = re.compile(r"[^,}\] \t\n\r]*")
+NON_BRACKETS = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+
 def skipWhitespace(jsonText):
-    jsonText.skip_while(lambda c: c in " \t\n\r")
+    jsonText.pos = WHITESPACE.match(jsonText.string, jsonText.pos).end()
+
+
+def nextSeparator(jsonText, closing):
+    """Consume the separator after a value. Returns True if it closed the
+    object or array, False if it was a comma followed by another element."""
+    match = SEPARATOR.match(jsonText.string, jsonText.pos)
+    if match is None:
+        if jsonText.available() <= 0:
+            raise Exception("Expected " + closing)
+        raise Exception("Expected ,")
+    c = match.group(1)
+    if c == ",":
+        jsonText.pos = match.end()
+        # Trailing commas are allowed
+        if jsonText.string.startswith(closing, jsonText.pos):
+            jsonText.pos += 1
+            return True
+        return False
+    if c != closing:
+        raise Exception("Expected ,")
+    jsonText.pos = match.end(1)
+    return True
+
+
+def skipValue(jsonText):
+    """Skip the value at the current position without creating contexts or
+    calling the listener. Objects and arrays are skipped by counting brackets
+    outside of strings, their content isn't validated."""
+    string = jsonText.string
+    pos = jsonText.pos
+    if pos >= len(string):
+        raise Exception("Unexpected end of JSON")
+    c = string[pos]
+    if c == '"':
+        match = STRING.match(string, pos)
+        if match is None:
+            raise Exception('Expected "')
+        jsonText.pos = match.end()
+        return
+    if c != "{" and c != "[":
+        jsonText.pos = SCALAR.match(string, pos).end()
+        return
+    depth = 0
+    while True:
+        pos = NON_BRACKETS.match(string, pos).end()
+        if pos >= len(string):
+            raise Exception("Unexpected end of JSON")
+        c = string[pos]
+        if c == "{" or c == "[":
+            depth += 1
+        elif c == "}" or c == "]":
+            depth -= 1
+        else:
+            # An unterminated string
+            raise Exception('Expected "')
+        pos += 1
+        if depth == 0:
+            jsonText.pos = pos
+            return
+
+
+def iterFields(jsonText):
+    """Yield the names of the fields of the object at the current position,
+    without a listener or contexts. After each name the reader is at the
+    value of the field, which the caller must consume (with `skipValue`,
+    `readString` or `iterFields`) before asking for the next name."""
+    if jsonText.available() <= 0 or jsonText.peek() != "{":
+        raise Exception("Expected {")
+    jsonText.pos += 1
+    skipWhitespace(jsonText)
+    if jsonText.string.startswith("}", jsonText.pos):
+        jsonText.pos += 1
+        return
+    while True:
+        match = FIELD_NAME.match(jsonText.string, jsonText.pos)
+        if match is None:
+            if jsonText.string.startswith('"', jsonText.pos):
+                raise Exception("Expected :")
+            raise Exception('Expected "')
+        jsonText.pos = match.end()
+        yield unescape_string(match.group(1))
+        if nextSeparator(jsonText, "}"):
+            return
+
+
+def readString(jsonText):
+    """Return the string at the current position, or None (consuming
+    nothing) if the value there isn't a string."""
+    match = STRING.match(jsonText.string, jsonText.pos)
+    if match is None:
+        return None
+    jsonText.pos = match.end()
+    return unescape_string(match.group())
 
 
 def parseValue(jsonText, listener, ctx):
-    skipWhitespace(jsonText)
-    if jsonText.peek() == "{":
+    if jsonText.available() <= 0:
+        raise Exception("Unexpected end of JSON")
+    c = jsonText.peek()
+    if c == "{":
         return parseObject(jsonText, listener, ctx.make_child(jsonText))
-    elif jsonText.peek() == "[":
+    elif c == "[":
         return parseArray(jsonText, listener, ctx.make_child(jsonText))
-    elif jsonText.peek() == '"':
+    elif c == '"':
         return parseString(jsonText, listener, ctx.make_child(jsonText))
-    elif jsonText.peek() == "t" or jsonText.peek() == "f":
+    elif c == "t" or c == "f":
         return parseBoolean(jsonText, listener, ctx.make_child(jsonText))
-    elif jsonText.peek() == "n":
+    elif c == "n":
         return parseNull(jsonText, listener, ctx.make_child(jsonText))
     else:
         return parseNumber(jsonText, listener, ctx.make_child(jsonText))
@@ -181,41 +387,50 @@ def parseValue(jsonText, listener, ctx):
 def parseObject(jsonText, listener, ctx):
     if jsonText.peek() != "{":
         raise Exception("Expected {")
-    if listener.enterObject(ctx):
+    result = listener.enterObject(ctx)
+    if result is SKIP:
+        skipValue(jsonText)
+        ctx.update_length(jsonText)
+        return False
+    if result:
         return True
-    jsonText.skip()
-    while jsonText.available() > 0:
-        skipWhitespace(jsonText)
-        if jsonText.peek() == "}":
-            ctx.update_length(jsonText)
-            return listener.exitObject(ctx)
+    jsonText.pos += 1
+    skipWhitespace(jsonText)
+    closed = jsonText.string.startswith("}", jsonText.pos)
+    if closed:
+        jsonText.pos += 1
+    while not closed:
         stop = parseField(jsonText, listener, ctx.make_child(jsonText))
         if stop:
             return True
-        skipWhitespace(jsonText)
-        if jsonText.peek() == "}":
-            jsonText.skip()
-            ctx.update_length(jsonText)
-            return listener.exitObject(ctx)
-        if jsonText.peek() != ",":
-            raise Exception("Expected ,")
-        jsonText.skip()
-    raise Exception("Expected }")
+        closed = nextSeparator(jsonText, "}")
+    ctx.update_length(jsonText)
+    return listener.exitObject(ctx)
 
 
 def parseField(jsonText, listener, ctx):
-    if jsonText.peek() != '"':
+    match = FIELD_NAME.match(jsonText.string, jsonText.pos)
+    if match is None:
+        if jsonText.string.startswith('"', jsonText.pos):
+            raise Exception("Expected :")
         raise Exception('Expected "')
-    name, stop = parseFieldName(jsonText, listener, ctx.make_child(jsonText))
-    if stop:
+    nameCtx = ctx.make_child(jsonText)
+    if listener.enterFieldName(nameCtx):
+        return True
+    jsonText.pos = match.end(1)
+    nameCtx.update_length(jsonText)
+    name = unescape_string(match.group(1))
+    if listener.exitFieldName(nameCtx, name):
         return True
     ctx.name = name
-    if listener.enterField(ctx):
+    result = listener.enterField(ctx)
+    jsonText.pos = match.end()
+    if result is SKIP:
+        skipValue(jsonText)
+        ctx.update_length(jsonText)
+        return False
+    if result:
         return True
-    skipWhitespace(jsonText)
-    if jsonText.peek() != ":":
-        raise Exception("Expected :")
-    jsonText.skip()
     stop = parseValue(jsonText, listener, ctx.make_child(jsonText, name))
     ctx.update_length(jsonText)
     if stop:
@@ -228,61 +443,36 @@ def parseString(jsonText, listener, ctx):
         raise Exception('Expected "')
     if listener.enterString(ctx):
         return True
-    jsonText.skip()
-    while jsonText.available() > 0:
-        if jsonText.peek() == '"':
-            jsonText.skip()
-            ctx.update_length(jsonText)
-            name = unescape_string(jsonText.string[ctx.index : ctx.index + ctx.length])
-            return listener.exitString(ctx, name)
-        elif jsonText.peek() == "\\":
-            jsonText.skip()
-        jsonText.skip()
-    raise Exception('Expected "')
-
-
-def parseFieldName(jsonText, listener, ctx):
-    if jsonText.peek() != '"':
+    match = STRING.match(jsonText.string, jsonText.pos)
+    if match is None:
         raise Exception('Expected "')
-    if listener.enterFieldName(ctx):
-        return "", True
-    jsonText.skip()
-    while jsonText.available() > 0:
-        if jsonText.peek() == '"':
-            jsonText.skip()
-            ctx.update_length(jsonText)
-            name = unescape_string(jsonText.string[ctx.index : ctx.index + ctx.length])
-            return name, listener.exitFieldName(ctx, name)
-        elif jsonText.peek() == "\\":
-            jsonText.skip()
-        jsonText.skip()
-    raise Exception('Expected "')
+    jsonText.pos = match.end()
+    ctx.update_length(jsonText)
+    return listener.exitString(ctx, unescape_string(match.group()))
 
 
 def parseArray(jsonText, listener, ctx):
     if jsonText.peek() != "[":
         raise Exception("Expected [")
-    if listener.enterArray(ctx):
+    result = listener.enterArray(ctx)
+    if result is SKIP:
+        skipValue(jsonText)
+        ctx.update_length(jsonText)
+        return False
+    if result:
         return True
-    jsonText.skip()
-    while jsonText.available() > 0:
-        skipWhitespace(jsonText)
-        if jsonText.peek() == "]":
-            jsonText.skip()
-            ctx.update_length(jsonText)
-            return listener.exitArray(ctx)
+    jsonText.pos += 1
+    skipWhitespace(jsonText)
+    closed = jsonText.string.startswith("]", jsonText.pos)
+    if closed:
+        jsonText.pos += 1
+    while not closed:
         stop = parseValue(jsonText, listener, ctx.make_child(jsonText))
         if stop:
-            return jsonText, True
-        skipWhitespace(jsonText)
-        if jsonText.peek() == "]":
-            jsonText.skip()
-            ctx.update_length(jsonText)
-            return listener.exitArray(ctx)
-        if jsonText.peek() != ",":
-            raise Exception("Expected ,")
-        jsonText.skip()
-    raise Exception("Expected ]")
+            return True
+        closed = nextSeparator(jsonText, "]")
+    ctx.update_length(jsonText)
+    return listener.exitArray(ctx)
 
 
 def parseBoolean(jsonText, listener, ctx):
@@ -313,13 +503,14 @@ def parseNull(jsonText, listener, ctx):
 
 
 def parseNumber(jsonText, listener, ctx):
-    num = jsonText.read_while(lambda c: c in "0123456789-+eE.")
-    if len(num) == 0:
+    match = NUMBER.match(jsonText.string, jsonText.pos)
+    if match.end() == jsonText.pos:
         raise Exception("Expected number")
+    jsonText.pos = match.end()
     if listener.enterNumber(ctx):
         return True
     ctx.update_length(jsonText)
-    return listener.exitNumber(ctx, num)
+    return listener.exitNumber(ctx, match.group())
 
 
 def is_float(jsonString, value):
@@ -349,11 +540,20 @@ def is_float_or_string(jsonString, value):
 
 
 def unescape_string(string):
-    return string[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    if "\\" not in string:
+        return string[1:-1]
+    # Escapes like \u0041 are rare, the json module decodes all of them
+    return json.loads(string)
+
+
+PROPERTIES_PATH = ("minecraft:entity", "description", "properties")
 
 
 class PropertyListener(JsonListener):
-    def __init__(self, jsonText):
+    def __init__(self, jsonText, retainChildren=False):
+        # Issues always have an edit for `Patch`, but the fixFunc applying
+        # them one by one with `set_text` needs the retained tree
+        self.retainChildren = retainChildren
         self.currentProperty = None
         self.currentRange = []
         self.currentType = None
@@ -361,47 +561,71 @@ class PropertyListener(JsonListener):
         self.jsonText = jsonText
         self.issueList = []
 
+    def appendSuffixIssue(self, message, ctx, suffix, pointer):
+        """Add an issue that is fixed by appending `suffix` to the value."""
+        fixFunc = None
+        if self.retainChildren:
+            fixFunc = lambda text: ctx.set_text(text, ctx.get_text(text) + suffix)
+        self.issueList.append(
+            Issue(message, fixFunc, (ctx.index + ctx.length, 0, suffix), pointer)
+        )
+
     def onEntityProperty(self, property, type, range, default):
         if unescape_string(type.get_text(self.jsonText)) == "float":
             if len(range) != 2:
                 return
             if not is_float(self.jsonText, range[0]):
-                self.issueList.append(
-                    Issue(
-                        f"Property {property} has invalid start range value",
-                        lambda text: range[0].set_text(
-                            text, range[0].get_text(text) + ".0"
-                        ),
-                    )
+                self.appendSuffixIssue(
+                    f"Property {property} has invalid start range value",
+                    range[0],
+                    ".0",
+                    json_pointer(range[0].keys, 0),
                 )
             if not is_float(self.jsonText, range[1]):
-                self.issueList.append(
-                    Issue(
-                        f"Property {property} has invalid end range value",
-                        lambda text: range[1].set_text(
-                            text, range[1].get_text(text) + ".0"
-                        ),
-                    )
+                self.appendSuffixIssue(
+                    f"Property {property} has invalid end range value",
+                    range[1],
+                    ".0",
+                    json_pointer(range[1].keys, 1),
                 )
             if not is_float_or_string(self.jsonText, default):
-                self.issueList.append(
-                    Issue(
-                        f"Property {property} has invalid default value",
-                        lambda text: default.set_text(
-                            text, default.get_text(text) + ".0"
-                        ),
-                    )
+                self.appendSuffixIssue(
+                    f"Property {property} has invalid default value",
+                    default,
+                    ".0",
+                    json_pointer(default.keys),
                 )
 
+    def enterField(self, ctx):
+        # Only minecraft:entity/description/properties is inspected, so skip
+        # everything that isn't on the way to it
+        depth = len(ctx.keys)
+        if depth < len(PROPERTIES_PATH) and ctx.name != PROPERTIES_PATH[depth]:
+            return SKIP
+        return False
+
+    def propertyField(self, ctx):
+        """Return the name of the field in the current property that `ctx` is
+        the value of (or an element of), or None."""
+        keys = ctx.keys
+        if (
+            self.currentProperty is None
+            or len(keys) != 5
+            or keys[3] != self.currentProperty
+            or not ctx.path_startswith(PROPERTIES_PATH)
+        ):
+            return None
+        return keys[4]
+
     def enterObject(self, ctx):
-        if ctx.to_path().startswith("#/minecraft:entity/description/properties/"):
-            self.currentProperty = ctx.to_path().split("/")[-1]
+        if len(ctx.keys) == 4 and ctx.path_startswith(PROPERTIES_PATH):
+            self.currentProperty = ctx.keys[3]
         return False
 
     def exitObject(self, ctx):
-        if ctx.to_path() == "#/minecraft:entity/description/properties":
+        if ctx.path_equals(PROPERTIES_PATH):
             return True
-        if ctx.to_path().startswith("#/minecraft:entity/description/properties/"):
+        if len(ctx.keys) == 4 and ctx.path_startswith(PROPERTIES_PATH):
             self.onEntityProperty(
                 self.currentProperty,
                 self.currentType,
@@ -415,36 +639,92 @@ class PropertyListener(JsonListener):
         return False
 
     def exitString(self, ctx, value):
-        if (
-            self.currentProperty != None
-            and ctx.to_path()
-            == f"#/minecraft:entity/description/properties/{self.currentProperty}/default"
-        ):
+        field = self.propertyField(ctx)
+        if field == "default":
             self.currentDefault = ctx
-        if (
-            self.currentProperty != None
-            and ctx.to_path()
-            == f"#/minecraft:entity/description/properties/{self.currentProperty}/type"
-        ):
+        if field == "type":
             self.currentType = ctx
         return False
 
     def exitNumber(self, ctx, value):
-        if (
-            self.currentProperty != None
-            and ctx.to_path()
-            == f"#/minecraft:entity/description/properties/{self.currentProperty}/range"
-        ):
+        field = self.propertyField(ctx)
+        if field == "range":
             self.currentRange.append(ctx)
-        if (
-            self.currentProperty != None
-            and ctx.to_path()
-            == f"#/minecraft:entity/description/properties/{self.currentProperty}/default"
-        ):
+        if field == "default":
             self.currentDefault = ctx
         return False
 
 
+class _NotFloat(object):
+    """Stands in for number literals that `is_float` rejects, like 1e5."""
+
+
+def _parse_float(literal):
+    value = float(literal)
+    if value.is_integer() and "." not in literal:
+        return _NotFloat
+    return value
+
+
+def _reject_constant(literal):
+    raise ValueError(f"Unsupported constant {literal}")
+
+
+def _is_float(value):
+    return isinstance(value, float)
+
+
+def needs_property_check(jsonText):
+    """Return whether `PropertyListener` may find issues in the text.
+
+    The text is decoded with the C accelerated `json` module, which is much
+    faster than `parseJson`. Only texts with float properties that are
+    certainly valid return False; anything unexpected (invalid or unusual
+    JSON, integers where floats are expected) returns True, so that the
+    verbose parser decides.
+    """
+    try:
+        data = json.loads(
+            jsonText, parse_float=_parse_float, parse_constant=_reject_constant
+        )
+    except ValueError:
+        return True
+    for key in PROPERTIES_PATH:
+        if not isinstance(data, dict):
+            return True
+        if key not in data:
+            return False
+        data = data[key]
+    if not isinstance(data, dict):
+        return True
+    for property in data.values():
+        if not isinstance(property, dict):
+            return True
+        type = property.get("type")
+        if not isinstance(type, str):
+            return True
+        if type != "float":
+            continue
+        range = property.get("range")
+        if range is None:
+            # Like PropertyListener, which only checks ranges of two values
+            continue
+        if not isinstance(range, list):
+            return True
+        for value in range:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                if value is not _NotFloat:
+                    return True
+        if len(range) != 2:
+            continue
+        if not _is_float(range[0]) or not _is_float(range[1]):
+            return True
+        default = property.get("default")
+        if not _is_float(default) and not isinstance(default, str):
+            return True
+    return False
+
+
 # if __name__ == "__main__":
 #     testJson = '{}'
 #     with open("sanity_check/test.json", "r") as f: